@@ -7,13 +7,18 @@ import re
 from datetime import date, datetime
 from typing import Any, Callable
 
-from rich.panel import Panel
-
 from gg_cli.definitions_loader import load_achievements_flat
+from gg_cli.plugins import plugin_checkers
+from gg_cli.render import Renderer, get_renderer
 from gg_cli.translator import Translator
-from gg_cli.utils import console
 
-ACHIEVEMENTS_DEF = load_achievements_flat()
+
+def __getattr__(name: str):
+    # Definitions are loaded on first use, not when the module is imported.
+    if name == "ACHIEVEMENTS_DEF":
+        return load_achievements_flat()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 COMMIT_THRESHOLDS = {
     "commit_10": 10,
@@ -243,6 +248,27 @@ def _check_tiny_commit(
     return None
 
 
+def _check_polyglot(
+    user_data: dict[str, Any], context: dict[str, Any], **kwargs: Any
+) -> dict[str, str] | None:
+    if context.get("command") != "commit":
+        return None
+    languages = [name for name in context.get("languages", {}) if name != "Other"]
+    if len(languages) >= 3:
+        return {"id": "polyglot"}
+    return None
+
+
+def _check_convoy(
+    user_data: dict[str, Any], context: dict[str, Any], **kwargs: Any
+) -> dict[str, str] | None:
+    if context.get("command") != "push":
+        return None
+    if context.get("push_commits", 0) >= 20:
+        return {"id": "convoy"}
+    return None
+
+
 def _check_balanced_day(
     user_data: dict[str, Any], context: dict[str, Any], **kwargs: Any
 ) -> dict[str, str] | None:
@@ -304,21 +330,34 @@ ACHIEVEMENT_CHECKERS: dict[str, Checker] = {
     "big_wave": _check_big_wave,
     "tsunami": _check_tsunami,
     "tiny_commit": _check_tiny_commit,
+    "polyglot": _check_polyglot,
+    "convoy": _check_convoy,
     "balanced_day": _check_balanced_day,
 }
 
 
 def check_all_achievements(
-    user_data: dict[str, Any], translator: Translator, context: dict[str, Any]
+    user_data: dict[str, Any],
+    translator: Translator,
+    context: dict[str, Any],
+    renderer: Renderer | None = None,
 ) -> int:
     """Check and unlock achievements; return total gained XP."""
+    own_renderer = renderer is None
+    if renderer is None:
+        renderer = get_renderer(user_data.get("config", {}).get("output"))
     xp_from_achievements = 0
 
-    for ach_id, checker_func in ACHIEVEMENT_CHECKERS.items():
+    definitions = load_achievements_flat()
+    checks = [(ach_id, definitions.get(ach_id), checker) for ach_id, checker in ACHIEVEMENT_CHECKERS.items()]
+    # Plugin checkers come last and only for plugins subscribed to this command.
+    language = user_data.get("config", {}).get("language", "en")
+    checks.extend(plugin_checkers(context.get("command", ""), language))
+    for ach_id, definition, checker_func in checks:
         # Skip work early for already unlocked or undefined achievements.
         if ach_id in user_data["achievements_unlocked"]:
             continue
-        if ach_id not in ACHIEVEMENTS_DEF:
+        if definition is None:
             continue
 
         result = checker_func(user_data, context=context)
@@ -327,20 +366,19 @@ def check_all_achievements(
 
         # Persist unlock timestamp and add XP immediately.
         user_data["achievements_unlocked"][ach_id] = date.today().isoformat()
-        reward = int(ACHIEVEMENTS_DEF[ach_id].get("xp_reward", 0))
+        reward = int(definition.get("xp_reward", 0))
         xp_from_achievements += reward
 
         # Render a compact unlock panel for terminal feedback.
-        name = translator.t(ACHIEVEMENTS_DEF[ach_id]["name_key"])
-        desc = translator.t(ACHIEVEMENTS_DEF[ach_id]["desc_key"])
+        name = translator.t(definition["name_key"])
+        desc = translator.t(definition["desc_key"])
         panel_title = translator.t("achievement_unlocked_panel_title")
-        console.print(
-            Panel(
-                f"[bold cyan]{name}[/bold cyan]\n[italic]{desc}[/italic]\n\n[bold]Gained +{reward} XP![/bold]",
-                title=panel_title,
-                border_style="yellow",
-                expand=False,
-            )
+        renderer.panel(
+            f"[bold cyan]{name}[/bold cyan]\n[italic]{desc}[/italic]\n\n[bold]Gained +{reward} XP![/bold]",
+            title=panel_title,
+            border_style="yellow",
         )
 
+    if own_renderer:
+        renderer.flush()
     return xp_from_achievements
@@ -5,14 +5,22 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
 import os
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
+from gg_cli import metrics
+from gg_cli.dedup import get_default_ledger
+from gg_cli.history import get_default_history
+from gg_cli.prompt import write_status as write_prompt_status
+from gg_cli.rate_windows import get_default_windows
 from gg_cli.utils import DATA_DIR
 
+logger = logging.getLogger(__name__)
+
 
 def is_in_git_repo() -> bool:
     """Check if the current directory is inside a Git working tree."""
@@ -50,41 +58,246 @@ def get_profile_filename(email: str) -> str | None:
 def get_default_user_data(email: str | None = None) -> dict[str, Any]:
     """Return the default user profile structure."""
     return {
-        "config": {"language": "en", "user_email": email},
+        "config": {"language": "en", "user_email": email, "output": "auto"},
         "user": {"xp": 0, "level": 1},
         "achievements_unlocked": {},
         "stats": {
             "total_commits": 0,
             "total_pushes": 0,
+            "total_pushed_commits": 0,
+            "total_pushed_lines": 0,
             "last_commit_date": "1970-01-01",
             "last_push_date": "1970-01-01",
             "consecutive_commit_days": 0,
             "daily_xp_date": "1970-01-01",
             "daily_commit_count": 0,
-            "daily_push_xp_earned": 0,
         },
+        "events": get_default_ledger(),
+        "sync": {
+            "device_id": None,
+            "peers": {},
+            "peer_blobs": {},
+            "own_unlocks": [],
+            "synced_unlocks": [],
+            "unlock_refund": 0,
+        },
+        "repos": {},
+        "history": get_default_history(),
+        "windows": get_default_windows(),
+        "rebalance": {"rules": None, "xp_delta": 0},
     }
 
 
+def _is_profile_filename(name: str) -> bool:
+    """Return True for `<40 hex>.json` names produced by `get_profile_filename`."""
+    stem, dot, suffix = name.partition(".")
+    return dot == "." and suffix == "json" and len(stem) == 40 and all(
+        c in "0123456789abcdef" for c in stem
+    )
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temp file in the same directory and replace `path`."""
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=path.stem + ".",
+        suffix=".tmp",
+        dir=str(path.parent),
+        text=True,
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        finally:
+            raise
+
+
 class UserRepository:
-    """Persistence layer for user profile JSON files."""
+    """
+    Persistence layer for user profile JSON files.
+
+    Profiles are sharded by hash prefix (`ab/cdef....json`) so no directory
+    grows past a few hundred entries on hosts holding many identities. Files
+    from the older flat layout are moved into their shard on first load.
+
+    Emails listed in `aliases.json` resolve to their canonical identity, so
+    commits made under any of them land in one profile.
+    """
+
+    SHARD_PREFIX_LENGTH = 2
+    ALIASES_FILENAME = "aliases.json"
 
     def __init__(self, data_dir: Path | None = None):
         self.data_dir = data_dir or DATA_DIR
         self.data_dir.mkdir(exist_ok=True)
+        self._leaderboard_index = None
+        self._aliases: dict[str, str] | None = None
+
+    @property
+    def aliases(self) -> dict[str, str]:
+        """Alias email -> canonical email map, read once per repository."""
+        if self._aliases is None:
+            try:
+                with open(self.data_dir / self.ALIASES_FILENAME, "r", encoding="utf-8") as f:
+                    loaded = json.load(f)
+                self._aliases = loaded if isinstance(loaded, dict) else {}
+            except (json.JSONDecodeError, OSError):
+                self._aliases = {}
+        return self._aliases
+
+    def resolve_email(self, email: str) -> str:
+        """Return the canonical email for `email` (itself when not aliased)."""
+        return self.aliases.get(email, email)
+
+    def add_alias(self, alias: str, canonical: str) -> bool:
+        """
+        Map `alias` onto `canonical` and fold any existing alias profile into it.
+
+        Returns True when a separate profile existed for `alias` and was merged.
+        """
+        canonical = self.resolve_email(canonical)
+        if not alias or not canonical or alias == canonical:
+            raise ValueError("An alias must differ from its canonical email.")
+
+        aliases = self.aliases
+        # Keep the map flat: emails that pointed at `alias` now point at `canonical`.
+        for other, target in aliases.items():
+            if target == alias:
+                aliases[other] = canonical
+        aliases[alias] = canonical
+        _write_json_atomic(self.data_dir / self.ALIASES_FILENAME, aliases)
+
+        alias_data = self._read_profile(alias)
+        if alias_data is None:
+            return False
+        from gg_cli.profile_merge import merge_profiles
+
+        self.save(merge_profiles(self._load_exact(canonical), alias_data))
+        self._delete_exact(alias)
+        return True
+
+    def remove_alias(self, alias: str) -> bool:
+        """Stop resolving `alias`; its past progress stays in the canonical profile."""
+        if alias not in self.aliases:
+            return False
+        del self.aliases[alias]
+        _write_json_atomic(self.data_dir / self.ALIASES_FILENAME, self.aliases)
+        return True
+
+    @property
+    def leaderboard_index(self):
+        """Sidecar leaderboard index, opened on first use."""
+        if self._leaderboard_index is None:
+            # Import lazily so plain profile loads never pay for sqlite3.
+            from gg_cli.leaderboard import LeaderboardIndex
+
+            self._leaderboard_index = LeaderboardIndex(self.data_dir)
+        return self._leaderboard_index
+
+    def _update_leaderboard_index(self, data: dict[str, Any]) -> None:
+        """Refresh this profile's index row; the index is rebuildable, so failures are only logged."""
+        from gg_cli.leaderboard import summarize_profile
+
+        email = data["config"]["user_email"]
+        try:
+            self.leaderboard_index.upsert(
+                summarize_profile(get_profile_filename(email)[: -len(".json")], data)
+            )
+        except Exception as exc:
+            _index_failed(exc)
 
     def get_profile_path(self, email: str) -> Path:
+        """Return the sharded profile path (the shard directory is created on write)."""
+        filename = get_profile_filename(email)
+        if not filename:
+            raise ValueError("Email is required to resolve profile path.")
+        return self.data_dir / filename[: self.SHARD_PREFIX_LENGTH] / filename[self.SHARD_PREFIX_LENGTH :]
+
+    def get_legacy_profile_path(self, email: str) -> Path:
+        """Return the pre-sharding flat profile path."""
         filename = get_profile_filename(email)
         if not filename:
             raise ValueError("Email is required to resolve profile path.")
         return self.data_dir / filename
 
+    def _migrate_legacy_profile(self, email: str, profile_path: Path) -> None:
+        """Move a flat-layout profile into its shard when no sharded copy exists."""
+        legacy_path = self.get_legacy_profile_path(email)
+        if profile_path.exists() or not legacy_path.exists():
+            return
+        try:
+            profile_path.parent.mkdir(exist_ok=True)
+            os.replace(legacy_path, profile_path)
+        except OSError:
+            # Another process may have migrated it concurrently.
+            pass
+
+    def iter_profile_paths(self) -> Iterator[Path]:
+        """Yield every stored profile path (sharded and legacy) without listing all at once."""
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and len(entry.name) == self.SHARD_PREFIX_LENGTH:
+                    with os.scandir(entry.path) as shard_entries:
+                        for shard_entry in shard_entries:
+                            if _is_profile_filename(entry.name + shard_entry.name):
+                                yield Path(shard_entry.path)
+                elif entry.is_file() and _is_profile_filename(entry.name):
+                    yield Path(entry.path)
+
+    def delete(self, email: str) -> bool:
+        """Remove a profile in either layout; return True if anything was deleted."""
+        return self._delete_exact(self.resolve_email(email))
+
+    def _delete_exact(self, email: str) -> bool:
+        deleted = False
+        for path in (self.get_profile_path(email), self.get_legacy_profile_path(email)):
+            if path.exists():
+                os.remove(path)
+                deleted = True
+        try:
+            self.leaderboard_index.remove(get_profile_filename(email)[: -len(".json")])
+        except Exception as exc:
+            _index_failed(exc)
+        return deleted
+
+    def _read_profile(self, email: str) -> dict[str, Any] | None:
+        """Return the stored profile for exactly `email`, or None if absent/unreadable."""
+        profile_path = self.get_profile_path(email)
+        self._migrate_legacy_profile(email, profile_path)
+        try:
+            with open(profile_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def find(self, email: str) -> dict[str, Any] | None:
+        """Return the (alias-resolved) profile merged with defaults, or None; never creates one."""
+        email = self.resolve_email(email)
+        disk_data = self._read_profile(email)
+        if disk_data is None:
+            return None
+        user_data = get_default_user_data(email)
+        for main_key in user_data:
+            if isinstance(disk_data.get(main_key), dict):
+                user_data[main_key].update(disk_data[main_key])
+        return user_data
+
     def load(self, email: str | None) -> dict[str, Any]:
-        """Load profile by email and merge with current default schema."""
+        """Load profile by email (resolving aliases) and merge with current default schema."""
         if not email:
             return get_default_user_data()
+        return self._load_exact(self.resolve_email(email))
 
+    def _load_exact(self, email: str) -> dict[str, Any]:
         profile_path = self.get_profile_path(email)
+        self._migrate_legacy_profile(email, profile_path)
         user_data = get_default_user_data(email)
         if not profile_path.exists():
             self.save(user_data)
@@ -102,42 +315,72 @@ class UserRepository:
 
         return user_data
 
-    def save(self, data: dict[str, Any]) -> None:
-        """Persist profile data using an atomic replace operation."""
+    def _write_profile(self, data: dict[str, Any]) -> bool:
+        """Atomically write one profile file; return False when it has no email."""
         email = data.get("config", {}).get("user_email")
         if not email:
-            return
+            return False
 
         profile_path = self.get_profile_path(email)
-        # Atomic write: write tmp file in same directory and replace destination.
-        fd, tmp_path = tempfile.mkstemp(
-            prefix=profile_path.stem + ".",
-            suffix=".tmp",
-            dir=str(profile_path.parent),
-            text=True,
-        )
+        profile_path.parent.mkdir(exist_ok=True)
+        _write_json_atomic(profile_path, data)
+        return True
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Persist profile data using an atomic replace operation."""
+        with metrics.timer("gg_profile_save_seconds"):
+            if self._write_profile(data):
+                self._update_leaderboard_index(data)
+
+    def save_many(self, profiles: Iterable[dict[str, Any]]) -> int:
+        """
+        Persist several profiles and refresh their index rows in one transaction.
+
+        Used by bulk imports, where one index commit per profile would dominate.
+        """
+        from gg_cli.leaderboard import summarize_profile
+
+        entries = []
+        for data in profiles:
+            if self._write_profile(data):
+                email = data["config"]["user_email"]
+                entries.append(summarize_profile(get_profile_filename(email)[: -len(".json")], data))
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(tmp_path, profile_path)
-        except OSError:
-            try:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-            finally:
-                raise
+            self.leaderboard_index.upsert_many(entries)
+        except Exception as exc:
+            _index_failed(exc)
+        return len(entries)
+
+
+def _index_failed(exc: Exception) -> None:
+    # Profiles stay authoritative; `gg leaderboard --rebuild` repairs the index.
+    metrics.inc("gg_errors_total", kind="leaderboard_index")
+    logger.warning("Cannot update the leaderboard index: %s", exc)
 
 
 _USER_REPOSITORY = UserRepository()
 
 
+def get_user_repository() -> UserRepository:
+    """Return the process-wide repository bound to `DATA_DIR`."""
+    return _USER_REPOSITORY
+
+
 def load_user_data() -> dict[str, Any]:
     """Load user data for current Git identity."""
     return _USER_REPOSITORY.load(get_current_git_email())
 
 
 def save_user_data(data: dict[str, Any]) -> None:
-    """Save user data for current Git identity."""
+    """Save user data for current Git identity and refresh the prompt status file."""
     _USER_REPOSITORY.save(data)
+    try:
+        write_prompt_status(str(_USER_REPOSITORY.data_dir), data, _USER_REPOSITORY.aliases)
+    except OSError:
+        # The prompt segment is a convenience; never fail a save over it.
+        pass
+
+
+def reset_user_data(email: str) -> bool:
+    """Delete the stored profile for `email`; return False if none existed."""
+    return _USER_REPOSITORY.delete(email)
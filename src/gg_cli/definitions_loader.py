@@ -1,15 +1,48 @@
 # src/gg_cli/definitions_loader.py
-"""Load and validate game definitions (achievements, rewards, locales)."""
+"""Load and validate game definitions (achievements, rewards, rules, locales)."""
 
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from gg_cli.utils import DEFINITIONS_DIR, LOCALES_DIR
+from gg_cli.utils import DATA_DIR, DEFINITIONS_DIR, LOCALES_DIR
 
 REQUIRED_LOCALES = ("en", "zh")
+REQUIRED_REWARD_TYPES = ("quotes", "jokes")
+OPTIONAL_REWARD_TYPES = ("tips", "challenges")
+XP_RULE_KEYS = (
+    "commit_base",
+    "commit_full_reward_count",
+    "commit_half_reward_count",
+    "commit_change_tier1",
+    "commit_change_tier2",
+    "commit_change_tier3",
+    "commit_change_bonus_tier1",
+    "commit_change_bonus_tier2",
+    "commit_change_bonus_tier3",
+    "push_base",
+    "push_first_of_day_bonus",
+    "push_daily_xp_cap",
+    "push_commit_bonus",
+    "push_commit_bonus_cap",
+    "push_commit_bonus_daily_cap",
+    "merge_xp",
+    "rebase_xp",
+    "revert_xp",
+    "cherry_pick_xp",
+    "tag_xp",
+    "git_ops_daily_xp_cap",
+)
+
+# Compiled cache of parsed and validated definitions: one file per asset,
+# keyed by the source path and its mtime and size.
+COMPILED_CACHE_DIR = DATA_DIR / "definitions-cache"
+COMPILED_CACHE_VERSION = 2
 
 
 class DefinitionsValidationError(RuntimeError):
@@ -22,9 +55,7 @@ def _load_json(path: Path) -> dict[str, Any]:
         return json.load(f)
 
 
-def load_achievements_flat() -> dict[str, dict[str, Any]]:
-    """Load grouped achievements and flatten them into a single map."""
-    raw = _load_json(DEFINITIONS_DIR / "achievements.json")
+def _flatten_achievements(raw: dict[str, Any]) -> dict[str, dict[str, Any]]:
     return {
         achievement_id: achievement
         for category in raw.values()
@@ -32,24 +63,12 @@ def load_achievements_flat() -> dict[str, dict[str, Any]]:
     }
 
 
-def load_rewards() -> dict[str, Any]:
-    """Load reward pools used when users level up."""
-    return _load_json(DEFINITIONS_DIR / "rewards.json")
-
-
-def load_locale(locale: str) -> dict[str, str]:
-    """Load one locale file and normalize all values as strings."""
-    data = _load_json(LOCALES_DIR / f"{locale}.json")
-    return {k: str(v) for k, v in data.items()}
+def _normalize_locale(raw: dict[str, Any]) -> dict[str, str]:
+    return {k: str(v) for k, v in raw.items()}
 
 
-def validate_definitions() -> None:
-    """Validate static definitions and locale keys for runtime safety."""
+def _check_achievements(achievements: dict[str, Any]) -> list[str]:
     errors: list[str] = []
-
-    achievements = load_achievements_flat()
-    locales = {locale: load_locale(locale) for locale in REQUIRED_LOCALES}
-
     for achievement_id, achievement in achievements.items():
         for key in ("name_key", "desc_key", "xp_reward"):
             if key not in achievement:
@@ -60,29 +79,17 @@ def validate_definitions() -> None:
             errors.append(
                 f"Achievement '{achievement_id}' has invalid xp_reward '{xp_reward}'."
             )
+    return errors
 
-        name_key = achievement.get("name_key")
-        desc_key = achievement.get("desc_key")
-        for locale, locale_map in locales.items():
-            if name_key not in locale_map:
-                errors.append(
-                    f"Locale '{locale}' missing achievement key '{name_key}'."
-                )
-            if desc_key not in locale_map:
-                errors.append(
-                    f"Locale '{locale}' missing achievement key '{desc_key}'."
-                )
-
-    rewards = load_rewards()
-    required_reward_types = ("quotes", "jokes")
-    optional_reward_types = ("tips", "challenges")
 
-    for reward_type in required_reward_types:
+def _check_rewards(rewards: dict[str, Any]) -> list[str]:
+    errors: list[str] = []
+    for reward_type in REQUIRED_REWARD_TYPES:
         if reward_type not in rewards or not isinstance(rewards[reward_type], dict):
             errors.append(f"Rewards missing '{reward_type}' section.")
             continue
 
-    for reward_type in list(required_reward_types) + list(optional_reward_types):
+    for reward_type in REQUIRED_REWARD_TYPES + OPTIONAL_REWARD_TYPES:
         if reward_type not in rewards:
             continue
         if not isinstance(rewards[reward_type], dict):
@@ -94,6 +101,235 @@ def validate_definitions() -> None:
                 errors.append(
                     f"Rewards '{reward_type}' has no non-empty list for locale '{locale}'."
                 )
+    return errors
+
+
+def _check_mapping(value: Any) -> list[str]:
+    return [] if isinstance(value, dict) else ["Definition must be a JSON object."]
+
+
+def check_xp_rules(xp_rules: Any, partial: bool = False) -> list[str]:
+    """Return problems with an XP rules mapping; `partial` allows missing keys (overrides)."""
+    if not isinstance(xp_rules, dict):
+        return ["XP rules must be a JSON object."]
+    errors = [f"Unknown XP rule '{key}'." for key in xp_rules if key not in XP_RULE_KEYS]
+    for key in XP_RULE_KEYS:
+        if key not in xp_rules:
+            if not partial:
+                errors.append(f"XP rules missing key '{key}'.")
+            continue
+        value = xp_rules[key]
+        # bool is an int subclass but never a sensible rule value.
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            errors.append(f"XP rule '{key}' must be a non-negative integer, got '{value}'.")
+    return errors
+
+
+def _check_rules(rules: dict[str, Any]) -> list[str]:
+    return check_xp_rules(rules.get("xp_rules"))
+
+
+class DefinitionsRegistry:
+    """
+    Lazily loaded, validated definitions shared by the whole process.
+
+    Each asset (`achievements`, `rewards`, `rules`, `locale:<code>`) is read
+    and checked on first access only. Parsed assets are also written to one
+    compiled cache file each; later processes reuse a file while its source
+    path, mtime and size are unchanged, skipping parsing and validation, and
+    never read the cache of an asset they do not use.
+    Returned objects are shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        definitions_dir: Path = DEFINITIONS_DIR,
+        locales_dir: Path = LOCALES_DIR,
+        cache_dir: Path | None = COMPILED_CACHE_DIR,
+    ) -> None:
+        self.definitions_dir = Path(definitions_dir)
+        self.locales_dir = Path(locales_dir)
+        self.cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._assets: dict[str, Any] = {}
+
+    def _source(self, name: str) -> tuple[Path, Callable[[Any], Any], Callable[[Any], list[str]]]:
+        if name == "achievements":
+            return self.definitions_dir / "achievements.json", _flatten_achievements, _check_achievements
+        if name == "rewards":
+            return self.definitions_dir / "rewards.json", dict, _check_rewards
+        if name == "rules":
+            return self.definitions_dir / "rules.json", dict, _check_rules
+        if name.startswith("locale:"):
+            return self.locales_dir / f"{name[len('locale:'):]}.json", _normalize_locale, _check_mapping
+        raise KeyError(name)
+
+    def get(self, name: str) -> Any:
+        """Return asset `name`, loading and validating it on first use."""
+        try:
+            return self._assets[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._assets:
+                self._assets[name] = self._load(name)
+            return self._assets[name]
+
+    def achievements(self) -> dict[str, dict[str, Any]]:
+        return self.get("achievements")
+
+    def rewards(self) -> dict[str, Any]:
+        return self.get("rewards")
+
+    def rules(self) -> dict[str, Any]:
+        return self.get("rules")
+
+    def locale(self, locale: str) -> dict[str, str]:
+        return self.get(f"locale:{locale}")
+
+    def clear(self) -> None:
+        """Forget loaded assets (the compiled cache files are kept)."""
+        with self._lock:
+            self._assets.clear()
+
+    def _stamp(self, path: Path) -> list[int]:
+        stat = os.stat(path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load(self, name: str) -> Any:
+        path, compile_asset, check = self._source(name)
+        # Raises FileNotFoundError for unknown locales, like reading would.
+        key = {"source": str(path), "stamp": self._stamp(path)}
+        cached = self._read_cache_file(name)
+        if cached is not None and all(cached.get(field) == value for field, value in key.items()):
+            return cached["data"]
+
+        raw = _load_json(path)
+        errors = _check_mapping(raw)
+        value = compile_asset(raw) if not errors else raw
+        errors = errors or check(value)
+        if errors:
+            formatted = "\n".join(f"- {error}" for error in errors)
+            raise DefinitionsValidationError(f"Invalid definitions in {path.name}:\n" + formatted)
+        self._write_cache_file(name, {**key, "data": value})
+        return value
+
+    def is_validated(self) -> bool:
+        """Return True if the current sources already passed `validate_definitions`."""
+        with self._lock:
+            cached = self._read_cache_file("validated")
+            try:
+                return cached is not None and cached.get("stamps") == self._validation_stamps()
+            except OSError:
+                return False
+
+    def mark_validated(self) -> None:
+        """Record that the current sources passed `validate_definitions`."""
+        with self._lock:
+            try:
+                stamps = self._validation_stamps()
+            except OSError:
+                return
+            self._write_cache_file("validated", {"stamps": stamps})
+
+    def _validation_stamps(self) -> dict[str, list[Any]]:
+        names = ["achievements", "rewards"] + [f"locale:{locale}" for locale in REQUIRED_LOCALES]
+        stamps: dict[str, list[Any]] = {}
+        for name in names:
+            path = self._source(name)[0]
+            stamps[name] = [str(path), *self._stamp(path)]
+        return stamps
+
+    def _cache_file(self, name: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return Path(self.cache_dir) / (name.replace(":", "-") + ".json")
+
+    def _read_cache_file(self, name: str) -> dict[str, Any] | None:
+        path = self._cache_file(name)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("version") != COMPILED_CACHE_VERSION:
+            return None
+        return cached
+
+    def _write_cache_file(self, name: str, payload: dict[str, Any]) -> None:
+        """Best-effort atomic rewrite; a read-only data dir only costs speed."""
+        path = self._cache_file(name)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=path.stem + ".", suffix=".tmp", dir=str(path.parent))
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                cached = {"version": COMPILED_CACHE_VERSION, **payload}
+                json.dump(cached, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+registry = DefinitionsRegistry()
+
+
+def load_achievements_flat() -> dict[str, dict[str, Any]]:
+    """Load grouped achievements and flatten them into a single map."""
+    return registry.achievements()
+
+
+def load_rewards() -> dict[str, Any]:
+    """Load reward pools used when users level up."""
+    return registry.rewards()
+
+
+def load_rules() -> dict[str, Any]:
+    """Load engine rules (internal commands, XP rules, diff analysis settings)."""
+    return registry.rules()
+
+
+def load_xp_rules() -> dict[str, int]:
+    """Load the built-in XP rules (before any repository overrides)."""
+    return registry.rules()["xp_rules"]
+
+
+def load_locale(locale: str) -> dict[str, str]:
+    """Load one locale file and normalize all values as strings."""
+    return registry.locale(locale)
+
+
+def validate_definitions() -> None:
+    """Validate static definitions and locale keys for runtime safety."""
+    errors: list[str] = []
+
+    achievements = load_achievements_flat()
+    locales = {locale: load_locale(locale) for locale in REQUIRED_LOCALES}
+
+    errors.extend(_check_achievements(achievements))
+    for achievement in achievements.values():
+        name_key = achievement.get("name_key")
+        desc_key = achievement.get("desc_key")
+        for locale, locale_map in locales.items():
+            if name_key not in locale_map:
+                errors.append(
+                    f"Locale '{locale}' missing achievement key '{name_key}'."
+                )
+            if desc_key not in locale_map:
+                errors.append(
+                    f"Locale '{locale}' missing achievement key '{desc_key}'."
+                )
+
+    errors.extend(_check_rewards(load_rewards()))
 
     if errors:
         formatted = "\n".join(f"- {error}" for error in errors)
@@ -0,0 +1,72 @@
+# src/gg_cli/diff_analysis.py
+"""Path classification for commit diffs: generated/vendor exclusion and languages."""
+
+from __future__ import annotations
+
+import fnmatch
+import posixpath
+import re
+from functools import lru_cache
+from typing import Any, Iterable
+
+from gg_cli.definitions_loader import load_rules
+
+OTHER_LANGUAGE = "Other"
+
+
+def _compile_globs(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Fold glob patterns into one alternation so each path costs a single match."""
+    translated = [fnmatch.translate(pattern) for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(f"(?:{item})" for item in translated))
+
+
+class PathClassifier:
+    """Classify diff paths as excluded or by language using precompiled matchers."""
+
+    def __init__(self, exclude_patterns: Iterable[str], languages: dict[str, list[str]]) -> None:
+        patterns = list(exclude_patterns)
+        # Like gitignore: slash-free patterns match the basename at any depth.
+        self._basename_re = _compile_globs(p for p in patterns if "/" not in p)
+        self._path_re = _compile_globs(p for p in patterns if "/" in p)
+        self._by_extension: dict[str, str] = {}
+        self._by_filename: dict[str, str] = {}
+        for language, suffixes in languages.items():
+            for suffix in suffixes:
+                if suffix.startswith("."):
+                    self._by_extension[suffix.lower()] = language
+                else:
+                    self._by_filename[suffix] = language
+
+    def is_excluded(self, path: str) -> bool:
+        basename = posixpath.basename(path)
+        if self._basename_re is not None and self._basename_re.match(basename):
+            return True
+        return self._path_re is not None and self._path_re.match(path) is not None
+
+    def language_of(self, path: str) -> str:
+        basename = posixpath.basename(path)
+        language = self._by_filename.get(basename)
+        if language:
+            return language
+        _, extension = posixpath.splitext(basename)
+        return self._by_extension.get(extension.lower(), OTHER_LANGUAGE)
+
+    def classify(self, path: str) -> str | None:
+        """Return the language of `path`, or `None` when it is excluded from scoring."""
+        if self.is_excluded(path):
+            return None
+        return self.language_of(path)
+
+
+def build_classifier(rules: dict[str, Any]) -> PathClassifier:
+    """Create a classifier from the `diff_analysis` section of rule definitions."""
+    section = rules.get("diff_analysis", {})
+    return PathClassifier(section.get("exclude", []), section.get("languages", {}))
+
+
+@lru_cache(maxsize=1)
+def get_default_classifier() -> PathClassifier:
+    """Return the process-wide classifier built from bundled definitions."""
+    return build_classifier(load_rules())
@@ -0,0 +1,31 @@
+# src/gg_cli/entry.py
+"""Console-script entry point that routes fast paths before importing Typer/Rich."""
+
+from __future__ import annotations
+
+import sys
+
+
+def cli_entry() -> None:
+    """Serve git wrapper mode and JSON reports without the full CLI; defer the rest to `gg_cli.main`."""
+    args = sys.argv[1:]
+    if args and args[0] == "git":
+        from gg_cli.wrapper import run_git_wrapper
+
+        run_git_wrapper(args[1:])
+        return
+    if args and "--json" in args:
+        from gg_cli.report import REPORT_COMMANDS
+
+        if args[0] in REPORT_COMMANDS:
+            from gg_cli.report import main as report_main
+
+            sys.exit(report_main(args))
+
+    from gg_cli.main import cli_entry as full_cli_entry
+
+    full_cli_entry()
+
+
+if __name__ == "__main__":
+    cli_entry()
@@ -4,56 +4,61 @@
 from __future__ import annotations
 
 import random
-import re
+import time
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
 
-from rich.panel import Panel
-
+from gg_cli import metrics
 from gg_cli.achievements import check_all_achievements
 from gg_cli.core import load_user_data, save_user_data
+from gg_cli.dedup import EventLedger
 from gg_cli.definitions_loader import (
     DefinitionsValidationError,
     load_rewards,
+    load_xp_rules,
+    registry as definitions_registry,
     validate_definitions,
 )
-from gg_cli.git_service import GitService
-from gg_cli.translator import Translator
-from gg_cli.utils import console
-
-# Each tuple: (level_cap, xp_per_level_in_tier, title_translation_key)
-LEVEL_TIERS = [
-    (10, 220, "level_title_novice"),
-    (20, 320, "level_title_apprentice"),
-    (30, 460, "level_title_journeyman"),
-    (40, 650, "level_title_adept"),
-    (50, 900, "level_title_master"),
-    (60, 1200, "level_title_expert"),
-    (70, 1600, "level_title_genius"),
-    (80, 2100, "level_title_legendary"),
-    (90, 2700, "level_title_marvelous"),
-    (100, 3500, "level_title_champion"),
-]
-
-DEFAULT_XP_RULES = {
-    "commit_base": 8,
-    "commit_full_reward_count": 6,
-    "commit_half_reward_count": 12,
-    "commit_change_tier1": 20,
-    "commit_change_tier2": 80,
-    "commit_change_tier3": 200,
-    "commit_change_bonus_tier1": 2,
-    "commit_change_bonus_tier2": 4,
-    "commit_change_bonus_tier3": 6,
-    "push_base": 4,
-    "push_first_of_day_bonus": 8,
-    "push_daily_xp_cap": 12,
-}
-
-_REWARDS_DEF = load_rewards()
+from gg_cli.git_service import (
+    GitCommandResult,
+    GitService,
+    PushedRef,
+    parse_push_report,
+)
+from gg_cli.history import ActivityHistory
+from gg_cli.levels import (
+    LEVEL_TIERS,
+    get_level_from_xp,
+    get_level_info,
+    get_total_xp_for_level,
+)
+from gg_cli.processors import Processor, get_processor
+from gg_cli.rate_windows import RateWindows
+from gg_cli.render import Renderer, get_renderer
+from gg_cli.repo_rules import RepoRulesError, resolve_xp_rules
+from gg_cli.repo_stats import find_repo_id, record_repo_activity
+from gg_cli.translator import Translator, get_translator
+
+
+def __getattr__(name: str):
+    # XP rules live in definitions/rules.json and are loaded on first use.
+    if name == "DEFAULT_XP_RULES":
+        return load_xp_rules()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# (minimum consecutive commit days, bonus XP on the first commit of the day), longest first.
+STREAK_BONUS_TIERS = [(31, 5), (15, 4), (8, 3), (4, 2)]
+STREAK_BONUS_BASE = 1
+
+# Push flags whose output carries no readable push report.
+PUSH_QUIET_FLAGS = frozenset({"-q", "--quiet", "--porcelain", "--dry-run", "-n"})
+
 _DEFINITIONS_VALIDATED = False
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 
 @dataclass
 class GamifyEvent:
@@ -63,53 +68,72 @@ class GamifyEvent:
     args: list[str]
     today: date = field(default_factory=date.today)
     context: dict[str, Any] = field(default_factory=dict)
+    git_output: str = ""
+    repo_id: str | None = None
+    timestamp: float | None = None
 
     def __post_init__(self) -> None:
         self.context.setdefault("command", self.command)
+        if self.timestamp is None:
+            # Events for other days (replays, ingested dates) are placed at the
+            # day boundary, 24 hours apart, so rolling windows act per day.
+            if self.today == date.today():
+                self.timestamp = time.time()
+            else:
+                self.timestamp = float((self.today.toordinal() - _EPOCH_ORDINAL) * 86400)
 
 
 def ensure_runtime_definitions_valid() -> None:
-    """Run definitions integrity checks once per process."""
+    """Run definitions integrity checks once per process (and once per definitions change)."""
     global _DEFINITIONS_VALIDATED
     if _DEFINITIONS_VALIDATED:
         return
-    validate_definitions()
+    if not definitions_registry.is_validated():
+        validate_definitions()
+        definitions_registry.mark_validated()
     _DEFINITIONS_VALIDATED = True
 
 
-def get_level_info(level: int) -> tuple[int, int, str]:
-    """Retrieve tier information for a given level."""
-    if not isinstance(level, int) or level < 1:
-        level = 1
-    for max_level, xp_per_level, title_key in LEVEL_TIERS:
-        if level <= max_level:
-            return max_level, xp_per_level, title_key
-    return LEVEL_TIERS[-1]
-
-
-def get_total_xp_for_level(target_level: int) -> int:
-    """Calculate cumulative XP required to reach the beginning of target level."""
-    total_xp = 0
-    current_level = 1
-    while current_level < target_level:
-        _, xp_per_level, _ = get_level_info(current_level)
-        total_xp += xp_per_level
-        current_level += 1
-    return total_xp
-
-
-def get_level_from_xp(xp: int) -> int:
-    """Calculate user level from total XP."""
-    if not isinstance(xp, int) or xp < 0:
-        xp = 0
-    level = 1
-    xp_needed_for_next_level = 0
-    while True:
-        _, xp_per_level, _ = get_level_info(level)
-        xp_needed_for_next_level += xp_per_level
-        if xp < xp_needed_for_next_level:
-            return level
-        level += 1
+def _inspect_push(event: GamifyEvent, git_service: GitService) -> list[PushedRef] | None:
+    """
+    Resolve refs updated by a push and record range totals in event context.
+
+    Uses the push report already captured on stderr plus at most one extra
+    git process. Returns `None` when the report is unavailable (quiet pushes).
+    """
+    if not event.git_output or PUSH_QUIET_FLAGS.intersection(event.args):
+        return None
+
+    pushed_refs = parse_push_report(event.git_output)
+    event.context["pushed_refs"] = len(pushed_refs)
+    try:
+        summary = git_service.summarize_push(pushed_refs)
+    except Exception:
+        # Timeouts or odd refspecs: keep the push countable without range data.
+        summary = None
+    if summary is not None:
+        event.context["push_commits"] = summary.commits
+        event.context["push_insertions"] = summary.insertions
+        event.context["push_deletions"] = summary.deletions
+    for ref in pushed_refs:
+        if ref.new is None:
+            ref.new = summary.tips.get(ref.src, ref.src) if summary else ref.src
+    return pushed_refs
+
+
+def _is_duplicate_event(
+    user_data: dict[str, Any], event: GamifyEvent, git_service: GitService, processor: Processor
+) -> bool:
+    """Record event keys in the profile ledger and report already-counted work."""
+    try:
+        resolved = processor.event_keys(event, git_service)
+    except Exception:
+        # Unborn HEAD, missing reflog or stub services: fall back to counting.
+        return False
+    if resolved is None:
+        return False
+    keys, supersedes = resolved
+    return not EventLedger(user_data).claim(keys, supersedes)
 
 
 def _process_commit_event(
@@ -139,19 +163,27 @@ def _process_commit_event(
         stats["last_commit_date"] = event.today.isoformat()
 
     stats["daily_commit_count"] += 1
-    commit_count_today = stats["daily_commit_count"]
-    reward_multiplier = _get_commit_reward_multiplier(commit_count_today, xp_rules)
+    # The largest count that still changes the multiplier bounds the buffer.
+    window_commits = RateWindows(user_data, event.timestamp).hit(
+        "commits", xp_rules["commit_half_reward_count"] + 1
+    )
+    reward_multiplier = _get_commit_reward_multiplier(window_commits, xp_rules)
     xp_to_add = 0
 
     try:
-        diff_stats = git_service.get_shortstat_last_commit()
-        # Extract numeric tokens from git shortstat for a lightweight size metric.
-        changes = sum(int(token) for token in diff_stats.split() if token.isdigit())
+        diff = git_service.get_last_commit_diff()
+        # Only scored files count; lockfiles and generated code are excluded.
+        changes = diff.changed_lines
+        if diff.truncated:
+            # Over budget: score as a large commit rather than measuring fully.
+            changes = max(changes, xp_rules["commit_change_tier3"])
+            event.context["diff_truncated"] = True
         event.context["changes"] = changes
         change_xp = _get_change_bonus(changes, xp_rules)
 
-        deletions_match = re.search(r"(\d+)\s+deletions", diff_stats)
-        event.context["deletions"] = int(deletions_match.group(1)) if deletions_match else 0
+        event.context["deletions"] = diff.deletions
+        event.context["languages"] = diff.languages
+        event.context["excluded_lines"] = diff.excluded_lines
         event.context["commit_message"] = git_service.get_last_commit_message()
     except Exception:
         # First commit or detached states can fail diff retrieval; keep flow resilient.
@@ -167,10 +199,15 @@ def _process_commit_event(
 def _process_push_event(
     user_data: dict[str, Any], event: GamifyEvent, xp_rules: dict[str, int]
 ) -> int:
-    """Apply push-specific XP rules, including first-push bonus and daily cap."""
+    """Apply push-specific XP rules, including first-push bonus, range bonus and 24-hour caps."""
     stats = user_data["stats"]
     _reset_daily_trackers_if_needed(stats, event.today)
     stats["total_pushes"] += 1
+    pushed_commits = event.context.get("push_commits", 0)
+    stats["total_pushed_commits"] += pushed_commits
+    stats["total_pushed_lines"] += event.context.get("push_insertions", 0) + event.context.get(
+        "push_deletions", 0
+    )
     is_first_push_today = stats["last_push_date"] != event.today.isoformat()
 
     raw_xp = xp_rules["push_base"]
@@ -178,42 +215,77 @@ def _process_push_event(
         raw_xp += xp_rules["push_first_of_day_bonus"]
         stats["last_push_date"] = event.today.isoformat()
 
-    remaining_xp_quota = max(0, xp_rules["push_daily_xp_cap"] - stats["daily_push_xp_earned"])
-    earned_xp = min(raw_xp, remaining_xp_quota)
-    stats["daily_push_xp_earned"] += earned_xp
-    return earned_xp
+    windows = RateWindows(user_data, event.timestamp)
+    earned_xp = windows.earn("push_xp", raw_xp, xp_rules["push_daily_xp_cap"])
+
+    # Pushed commits earn a small bonus with its own per-push and 24-hour caps.
+    range_xp = min(pushed_commits * xp_rules["push_commit_bonus"], xp_rules["push_commit_bonus_cap"])
+    earned_bonus = windows.earn("push_bonus", range_xp, xp_rules["push_commit_bonus_daily_cap"])
+    return earned_xp + earned_bonus
+
+
+class CommitProcessor(Processor):
+    """Commits are keyed by SHA; an amend supersedes the commit it replaces."""
+
+    def event_keys(self, event: GamifyEvent, git: GitService) -> tuple[list[str], list[str]] | None:
+        if "--amend" in event.args:
+            # HEAD@{1} is the commit being replaced; amending counted work is a rewrite.
+            new_sha, old_sha = git.rev_parse("HEAD", "HEAD@{1}")[:2]
+            return [f"commit:{new_sha}"], [f"commit:{old_sha}"]
+        return [f"commit:{git.rev_parse('HEAD')[0]}"], []
+
+    def process(
+        self, user_data: dict[str, Any], event: GamifyEvent, git: GitService, xp_rules: dict[str, int]
+    ) -> int:
+        return _process_commit_event(user_data, event, git, xp_rules)
+
+
+class PushProcessor(Processor):
+    """Pushes are keyed by remote, destination ref and new tip."""
+
+    def accepts(self, event: GamifyEvent, git: GitService) -> bool:
+        # Quiet pushes still count; a readable report listing no updated refs
+        # ("Everything up-to-date", rejections) is no work rather than a replay.
+        if not event.git_output or PUSH_QUIET_FLAGS.intersection(event.args):
+            return True
+        return bool(parse_push_report(event.git_output))
+
+    def event_keys(self, event: GamifyEvent, git: GitService) -> tuple[list[str], list[str]] | None:
+        pushed_refs = _inspect_push(event, git)
+        if pushed_refs is None:
+            return None
+        return [f"push:{ref.remote}:{ref.dst}:{ref.new}" for ref in pushed_refs], []
+
+    def process(
+        self, user_data: dict[str, Any], event: GamifyEvent, git: GitService, xp_rules: dict[str, int]
+    ) -> int:
+        return _process_push_event(user_data, event, xp_rules)
 
 
 def _reset_daily_trackers_if_needed(stats: dict[str, Any], today: date) -> None:
-    """Reset per-day counters when date has moved to a new day."""
+    """Reset the calendar-day commit count (used by achievements) on a new day."""
     today_str = today.isoformat()
     if stats.get("daily_xp_date") == today_str:
         return
     stats["daily_xp_date"] = today_str
     stats["daily_commit_count"] = 0
-    stats["daily_push_xp_earned"] = 0
 
 
-def _get_commit_reward_multiplier(commit_count_today: int, xp_rules: dict[str, int]) -> float:
-    """Return XP multiplier based on how many commits already happened today."""
-    if commit_count_today <= xp_rules["commit_full_reward_count"]:
+def _get_commit_reward_multiplier(window_commits: int, xp_rules: dict[str, int]) -> float:
+    """Return XP multiplier based on how many commits happened in the last 24 hours."""
+    if window_commits <= xp_rules["commit_full_reward_count"]:
         return 1.0
-    if commit_count_today <= xp_rules["commit_half_reward_count"]:
+    if window_commits <= xp_rules["commit_half_reward_count"]:
         return 0.5
     return 0.0
 
 
 def _get_streak_bonus(consecutive_days: int) -> int:
     """Return streak XP bonus based on consecutive commit days."""
-    if consecutive_days >= 31:
-        return 5
-    if consecutive_days >= 15:
-        return 4
-    if consecutive_days >= 8:
-        return 3
-    if consecutive_days >= 4:
-        return 2
-    return 1
+    for min_days, bonus in STREAK_BONUS_TIERS:
+        if consecutive_days >= min_days:
+            return bonus
+    return STREAK_BONUS_BASE
 
 
 def _get_change_bonus(changes: int, xp_rules: dict[str, int]) -> int:
@@ -232,10 +304,14 @@ def _apply_level_progression(
     translator: Translator,
     xp_to_add: int,
     reward_rng: random.Random | None = None,
+    renderer: Renderer | None = None,
 ) -> None:
-    """Apply XP to profile, print progression info, and grant level-up rewards."""
+    """Apply XP to profile, report progression info, and grant level-up rewards."""
     if xp_to_add <= 0:
         return
+    own_renderer = renderer is None
+    if renderer is None:
+        renderer = get_renderer(user_data.get("config", {}).get("output"))
 
     current_level = user_data.get("user", {}).get("level", 1)
     current_xp = user_data.get("user", {}).get("xp", 0)
@@ -248,7 +324,7 @@ def _apply_level_progression(
     xp_base_for_current_level = get_total_xp_for_level(new_level)
     next_level_xp_target = xp_base_for_current_level + xp_per_level_current
 
-    console.print(
+    renderer.line(
         translator.t(
             "xp_gain_message",
             xp=xp_to_add,
@@ -258,35 +334,45 @@ def _apply_level_progression(
         )
     )
 
-    if new_level <= current_level:
-        return
+    if new_level > current_level:
+        _announce_level_up(user_data, translator, new_level, reward_rng, renderer)
+    if own_renderer:
+        renderer.flush()
 
+
+def _announce_level_up(
+    user_data: dict[str, Any],
+    translator: Translator,
+    new_level: int,
+    reward_rng: random.Random | None,
+    renderer: Renderer,
+) -> None:
+    """Report a level-up and show one random reward from the user's language pool."""
     _, _, title_key = get_level_info(new_level)
-    console.print(
+    renderer.line(
         translator.t("level_up_message", level=new_level, title=translator.t(title_key)),
         style="bold magenta",
     )
 
     language = user_data.get("config", {}).get("language", "en")
     rng = reward_rng or random
+    # Reward pools only matter on level-up, so they are loaded on first use.
+    rewards = load_rewards()
     reward_pools = ["tips", "quotes", "jokes", "challenges"]
     available_reward_pools = [
         pool
         for pool in reward_pools
-        if pool in _REWARDS_DEF and language in _REWARDS_DEF[pool] and _REWARDS_DEF[pool][language]
+        if pool in rewards and language in rewards[pool] and rewards[pool][language]
     ]
     if not available_reward_pools:
         # Defensive fallback for malformed or incomplete reward definitions.
         available_reward_pools = ["quotes"]
     reward_type = rng.choice(available_reward_pools)
-    reward = rng.choice(_REWARDS_DEF[reward_type][language])
-    console.print(
-        Panel(
-            f"[italic cyan]{reward}[/italic cyan]",
-            title=translator.t("random_reward_title"),
-            border_style="green",
-            expand=False,
-        )
+    reward = rng.choice(rewards[reward_type][language])
+    renderer.panel(
+        f"[italic cyan]{reward}[/italic cyan]",
+        title=translator.t("random_reward_title"),
+        border_style="green",
     )
 
 
@@ -296,24 +382,61 @@ def process_event(
     translator: Translator,
     git_service: GitService | None = None,
     xp_rules: dict[str, int] | None = None,
+    renderer: Renderer | None = None,
 ) -> int:
-    """Process a normalized Git event and return total awarded XP."""
-    rules = xp_rules or DEFAULT_XP_RULES
+    """
+    Process a normalized Git event and return total awarded XP.
+
+    Feedback goes to `renderer`; without one, a renderer for the profile's
+    output setting is created and flushed once the event is done.
+    """
+    rules = xp_rules or load_xp_rules()
     git = git_service or GitService()
+    own_renderer = renderer is None
+    if renderer is None:
+        renderer = get_renderer(user_data.get("config", {}).get("output"))
+    try:
+        return _process_event(user_data, event, translator, git, rules, renderer)
+    finally:
+        if own_renderer:
+            renderer.flush()
 
-    xp_to_add = 0
-    if event.command == "commit":
-        xp_to_add += _process_commit_event(user_data, event, git, rules)
-    elif event.command == "push":
-        xp_to_add += _process_push_event(user_data, event, rules)
 
-    xp_to_add += check_all_achievements(user_data, translator, event.context)
-    _apply_level_progression(user_data, translator, xp_to_add)
+def _process_event(
+    user_data: dict[str, Any],
+    event: GamifyEvent,
+    translator: Translator,
+    git: GitService,
+    rules: dict[str, int],
+    renderer: Renderer,
+) -> int:
+    processor = get_processor(event.command)
+    if processor is not None and not processor.accepts(event, git):
+        processor = None
+    if processor is not None and _is_duplicate_event(user_data, event, git, processor):
+        event.context["duplicate"] = True
+        renderer.line(translator.t("duplicate_event_message"), style="dim")
+        return 0
+
+    xp_to_add = processor.process(user_data, event, git, rules) if processor is not None else 0
+    xp_to_add += check_all_achievements(user_data, translator, event.context, renderer)
+    _apply_level_progression(user_data, translator, xp_to_add, renderer=renderer)
+    if processor is not None:
+        ActivityHistory(user_data).record(
+            event.today,
+            commits=int(event.command == "commit"),
+            pushes=int(event.command == "push"),
+            xp=xp_to_add,
+        )
+        if event.repo_id:
+            record_repo_activity(user_data, event.repo_id, event.command, xp_to_add, event.today.isoformat())
     return xp_to_add
 
 
 def process_gamify_logic(
-    git_command_args: list[str], git_service: GitService | None = None
+    git_command_args: list[str],
+    git_service: GitService | None = None,
+    git_result: GitCommandResult | None = None,
 ) -> None:
     """
     Entry point called after successful git command.
@@ -323,15 +446,48 @@ def process_gamify_logic(
     try:
         ensure_runtime_definitions_valid()
     except DefinitionsValidationError as exc:
-        console.print(f"[bold red]Definitions error:[/bold red] {exc}")
+        metrics.inc("gg_errors_total", kind="definitions")
+        renderer = get_renderer()
+        renderer.line(f"[bold red]Definitions error:[/bold red] {exc}")
+        renderer.flush()
         return
 
-    user_data = load_user_data()
+    command = git_command_args[0] if git_command_args else ""
+    event = GamifyEvent(
+        command=command,
+        args=git_command_args,
+        git_output=git_result.stderr if git_result else "",
+        repo_id=find_repo_id(),
+    )
+    git_service = git_service or GitService()
+    processor = get_processor(command)
+    # Runs that did no work (`git tag -l`, an up-to-date merge) print nothing.
+    if processor is None or not processor.accepts(event, git_service):
+        return
+
+    with metrics.timer("gg_gamify_phase_seconds", phase="load"):
+        user_data = load_user_data()
     if not user_data or not user_data.get("config", {}).get("user_email"):
         return
 
-    command = git_command_args[0] if git_command_args else ""
-    event = GamifyEvent(command=command, args=git_command_args)
-    translator = Translator(user_data.get("config", {}).get("language", "en"))
-    process_event(user_data, event, translator, git_service=git_service)
-    save_user_data(user_data)
+    translator = get_translator(user_data.get("config", {}).get("language", "en"))
+    renderer = get_renderer(user_data.get("config", {}).get("output"))
+    renderer.line("-" * 20)
+    try:
+        xp_rules = resolve_xp_rules()
+    except RepoRulesError as exc:
+        metrics.inc("gg_errors_total", kind="repo_rules")
+        renderer.line(f"[yellow]Ignoring repository XP rules: {exc}[/yellow]")
+        xp_rules = load_xp_rules()
+    unlocked_before = len(user_data["achievements_unlocked"])
+    with metrics.timer("gg_gamify_phase_seconds", phase="process"):
+        process_event(user_data, event, translator, git_service=git_service, xp_rules=xp_rules, renderer=renderer)
+    metrics.inc("gg_events_total", command=command)
+    unlocked = len(user_data["achievements_unlocked"]) - unlocked_before
+    if unlocked:
+        metrics.inc("gg_achievement_unlocks_total", unlocked)
+    # One write for the whole event, before the (fsync'd) profile save.
+    with metrics.timer("gg_gamify_phase_seconds", phase="render"):
+        renderer.flush()
+    with metrics.timer("gg_gamify_phase_seconds", phase="save"):
+        save_user_data(user_data)
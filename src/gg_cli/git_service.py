@@ -3,8 +3,30 @@
 
 from __future__ import annotations
 
+import re
 import subprocess
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
+
+from gg_cli.diff_analysis import PathClassifier, get_default_classifier
+
+# One updated-ref line of the human-readable `git push` report on stderr:
+# " <flag> <summary> <from> -> <to> (<reason>)". Flags are stable across
+# locales even though bracketed summaries such as "[new branch]" are not.
+_PUSH_REF_LINE = re.compile(
+    r"^ (?P<flag>[ +*\-!=]) (?P<summary>\[[^\]]*\]|\S+)\s+(?P<src>\S+) -> (?P<dst>\S+)"
+)
+_PUSH_RANGE = re.compile(r"^(?P<old>[0-9a-f]+)\.\.\.?(?P<new>[0-9a-f]+)$")
+_INSERTIONS = re.compile(r"(\d+) insertions?\(\+\)")
+_DELETIONS = re.compile(r"(\d+) deletions?\(-\)")
+
+# Upper bound for summarizing a push; huge first pushes fall back to no range data.
+PUSH_SUMMARY_TIMEOUT_SECONDS = 3.0
+
+# Per-commit diff sizing budget. Vendored bumps and wide merges stop early and
+# are scored as large commits instead of blocking the prompt for seconds.
+DIFF_TIMEOUT_SECONDS = 1.0
+DIFF_MAX_FILES = 2000
 
 
 @dataclass
@@ -16,13 +38,96 @@ class GitCommandResult:
     stderr: str
 
 
+@dataclass
+class ReflogEntry:
+    """Newest HEAD reflog entry: the commit HEAD moved to, when, and why."""
+
+    sha: str
+    timestamp: int
+    subject: str
+
+
+@dataclass
+class PushedRef:
+    """One ref update reported by a successful `git push`."""
+
+    remote: str
+    src: str
+    dst: str
+    old: str | None
+    new: str | None
+    forced: bool = False
+
+
+@dataclass
+class DiffStat:
+    """
+    Size of a commit diff; `truncated` marks a partial, lower-bound measurement.
+
+    Insertions and deletions only cover scored files; lockfiles, vendored and
+    generated paths are tallied separately under `excluded_*`.
+    """
+
+    files: int = 0
+    insertions: int = 0
+    deletions: int = 0
+    truncated: bool = False
+    excluded_files: int = 0
+    excluded_lines: int = 0
+    languages: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def changed_lines(self) -> int:
+        return self.insertions + self.deletions
+
+
+@dataclass
+class PushSummary:
+    """Commit and line totals for the ranges introduced by one push."""
+
+    commits: int = 0
+    insertions: int = 0
+    deletions: int = 0
+    tips: dict[str, str] = field(default_factory=dict)
+
+
+def parse_push_report(output: str) -> list[PushedRef]:
+    """Extract created and updated refs from `git push` stderr output."""
+    remote = ""
+    refs: list[PushedRef] = []
+    for line in output.splitlines():
+        if line.startswith("To "):
+            remote = line[3:].strip()
+            continue
+        match = _PUSH_REF_LINE.match(line)
+        if not match:
+            continue
+        flag = match.group("flag")
+        if flag in ("-", "!", "="):
+            # Deletions, rejections and no-op refs carry no new work.
+            continue
+        range_match = _PUSH_RANGE.match(match.group("summary"))
+        refs.append(
+            PushedRef(
+                remote=remote,
+                src=match.group("src"),
+                dst=match.group("dst"),
+                old=range_match.group("old") if range_match else None,
+                new=range_match.group("new") if range_match else None,
+                forced=flag == "+",
+            )
+        )
+    return refs
+
+
 class GitService:
     """Wrapper around git CLI calls to improve testability."""
 
-    def run(self, args: list[str]) -> GitCommandResult:
+    def run(self, args: list[str], input: str | None = None) -> GitCommandResult:
         """Run a git command and return captured streams and exit code."""
         result = subprocess.run(
             ["git"] + args,
+            input=input,
             capture_output=True,
             text=True,
             check=False,
@@ -34,13 +139,156 @@ class GitService:
             stderr=result.stderr,
         )
 
-    def get_shortstat_last_commit(self) -> str:
-        """Return short diff stats between `HEAD~1` and `HEAD`."""
-        return subprocess.check_output(
-            ["git", "diff", "--shortstat", "HEAD~1", "HEAD"],
+    def rev_parse(self, *revisions: str) -> list[str]:
+        """Resolve revisions to full object names in a single git call."""
+        output = subprocess.check_output(
+            ["git", "rev-parse", *revisions],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        )
+        return output.split()
+
+    def summarize_push(self, pushed_refs: list[PushedRef]) -> PushSummary:
+        """
+        Count commits and changed lines introduced by pushed refs in one git call.
+
+        Updated refs contribute `old..new`. Created refs contribute commits not
+        already on another remote-tracking ref; their tips are read back from
+        `%S` (the command-line ref each commit was reached through).
+        """
+        summary = PushSummary()
+        if not pushed_refs:
+            return summary
+
+        positives = [ref.new or ref.src for ref in pushed_refs]
+        negatives = [f"^{ref.old}" for ref in pushed_refs if ref.old]
+        args = [
+            "git",
+            "log",
+            "--no-renames",
+            "--shortstat",
+            "--date-order",
+            "--format=%x1e%H%x1f%S",
+            *positives,
+            *negatives,
+        ]
+        if any(ref.old is None for ref in pushed_refs):
+            # Remote-tracking refs written by this very push must not hide its commits.
+            args.append("--not")
+            args.extend(f"--exclude=*/{ref.dst}" for ref in pushed_refs)
+            args.append("--remotes")
+        args.append("--")
+
+        output = subprocess.check_output(
+            args,
+            text=True,
+            encoding="utf-8",
+            stderr=subprocess.DEVNULL,
+            timeout=PUSH_SUMMARY_TIMEOUT_SECONDS,
+        )
+        for record in output.split("\x1e")[1:]:
+            header, _, body = record.partition("\n")
+            sha, _, source = header.partition("\x1f")
+            summary.commits += 1
+            # `--date-order` shows children first, so the first hit is the tip.
+            summary.tips.setdefault(source, sha)
+            insertions = _INSERTIONS.search(body)
+            deletions = _DELETIONS.search(body)
+            summary.insertions += int(insertions.group(1)) if insertions else 0
+            summary.deletions += int(deletions.group(1)) if deletions else 0
+        return summary
+
+    def get_last_commit_diff(
+        self,
+        timeout: float = DIFF_TIMEOUT_SECONDS,
+        max_files: int = DIFF_MAX_FILES,
+        classifier: PathClassifier | None = None,
+    ) -> DiffStat:
+        """
+        Measure the first-parent diff of `HEAD` within a time and file budget.
+
+        NUL-delimited numstat output is streamed without rename detection and
+        each path is classified as excluded or by language. The process is
+        killed once `max_files` entries were read or `timeout` elapsed, and
+        the partial totals are returned with `truncated=True`.
+        """
+        classifier = classifier or get_default_classifier()
+        process = subprocess.Popen(
+            ["git", "diff", "--numstat", "-z", "--no-renames", "--no-ext-diff", "HEAD^1", "HEAD", "--"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        expired = threading.Event()
+
+        def _expire() -> None:
+            expired.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, _expire)
+        timer.start()
+        stat = DiffStat()
+        try:
+            assert process.stdout is not None
+            pending = ""
+            for chunk in iter(lambda: process.stdout.read(65536), ""):
+                records = (pending + chunk).split("\0")
+                pending = records.pop()
+                for record in records:
+                    if record and self._add_numstat_record(stat, record, classifier) >= max_files:
+                        stat.truncated = True
+                        break
+                if stat.truncated:
+                    process.kill()
+                    break
+        finally:
+            timer.cancel()
+            if process.stdout is not None:
+                process.stdout.close()
+            returncode = process.wait()
+
+        if expired.is_set():
+            # Whatever was read before the deadline is a lower bound.
+            stat.truncated = True
+        elif returncode != 0 and not stat.truncated:
+            raise subprocess.CalledProcessError(returncode, "git diff")
+        return stat
+
+    @staticmethod
+    def _add_numstat_record(stat: DiffStat, record: str, classifier: PathClassifier) -> int:
+        """Fold one `added<TAB>deleted<TAB>path` record into `stat`; return file count."""
+        added, _, rest = record.partition("\t")
+        deleted, _, path = rest.partition("\t")
+        # Binary files report "-" for both counters.
+        lines_added = int(added) if added.isdigit() else 0
+        lines_deleted = int(deleted) if deleted.isdigit() else 0
+        stat.files += 1
+        language = classifier.classify(path)
+        if language is None:
+            stat.excluded_files += 1
+            stat.excluded_lines += lines_added + lines_deleted
+        else:
+            stat.insertions += lines_added
+            stat.deletions += lines_deleted
+            stat.languages[language] = stat.languages.get(language, 0) + lines_added + lines_deleted
+        return stat.files
+
+    def get_last_reflog_entry(self) -> ReflogEntry | None:
+        """Return the newest HEAD reflog entry, or None without a reflog."""
+        output = subprocess.check_output(
+            ["git", "log", "-g", "-1", "--date=unix", "--format=%H%x1f%gd%x1f%gs", "HEAD"],
             text=True,
+            encoding="utf-8",
             stderr=subprocess.DEVNULL,
         ).strip()
+        if not output:
+            return None
+        sha, selector, subject = (output.split("\x1f", 2) + ["", ""])[:3]
+        # With --date=unix the selector reads `HEAD@{<epoch seconds>}`.
+        stamp = selector.rpartition("@{")[2].rstrip("}")
+        return ReflogEntry(sha=sha, timestamp=int(stamp) if stamp.isdigit() else 0, subject=subject)
 
     def get_last_commit_message(self) -> str:
         """Return the latest commit message body."""
@@ -49,3 +297,41 @@ class GitService:
             text=True,
             stderr=subprocess.DEVNULL,
         ).strip()
+
+
+@dataclass
+class RecordedGitService:
+    """
+    Git service answering from metadata collected elsewhere.
+
+    Used when events are not processed inside the repository they came from,
+    e.g. batches ingested by `gg serve` or commits replayed from history.
+    Missing metadata raises `LookupError`, which event processing tolerates.
+    """
+
+    sha: str | None = None
+    previous_sha: str | None = None
+    diff: DiffStat | None = None
+    message: str = ""
+    push: PushSummary | None = None
+
+    def rev_parse(self, *revisions: str) -> list[str]:
+        if self.sha is None:
+            raise LookupError("No commit SHA recorded for this event.")
+        return [self.sha, self.previous_sha or ""][: len(revisions)]
+
+    def get_last_commit_diff(self) -> DiffStat:
+        if self.diff is None:
+            raise LookupError("No diff stats recorded for this event.")
+        return self.diff
+
+    def get_last_commit_message(self) -> str:
+        return self.message
+
+    def get_last_reflog_entry(self) -> ReflogEntry | None:
+        raise LookupError("No reflog recorded for this event.")
+
+    def summarize_push(self, pushed_refs: list[PushedRef]) -> PushSummary:
+        if self.push is None:
+            raise LookupError("No push summary recorded for this event.")
+        return self.push
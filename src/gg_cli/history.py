@@ -0,0 +1,190 @@
+# src/gg_cli/history.py
+"""Per-day activity history stored as compact base64-encoded arrays."""
+
+from __future__ import annotations
+
+import base64
+import sys
+from array import array
+from datetime import date, timedelta
+from typing import Any
+
+HISTORY_SERIES = ("commits", "pushes", "xp")
+
+# Ten years of days; older days are dropped from the front. Each series costs
+# two bytes per day, so a full year of all three is about 3 KiB of base64.
+HISTORY_MAX_DAYS = 3660
+_UINT16_MAX = 0xFFFF
+
+
+def get_default_history() -> dict[str, Any]:
+    """Return the empty history stored under `user_data["history"]`."""
+    return {"start": 0, **{name: "" for name in HISTORY_SERIES}}
+
+
+def _decode(encoded: str) -> array:
+    values = array("H")
+    if encoded:
+        values.frombytes(base64.b64decode(encoded))
+        if sys.byteorder == "big":
+            values.byteswap()
+    return values
+
+
+def _encode(values: array) -> str:
+    if sys.byteorder == "big":
+        values = array("H", values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+class ActivityHistory:
+    """
+    Day-indexed counters for commits, pushes and XP.
+
+    `start` is the proleptic ordinal (`date.toordinal()`) of the first stored
+    day; index `i` of every series holds that day plus `i`. Counts saturate at
+    65535 per day.
+    """
+
+    def __init__(self, user_data: dict[str, Any]) -> None:
+        stored = user_data.setdefault("history", get_default_history())
+        self._stored = stored
+        self.start = int(stored.get("start") or 0)
+        self.series = {name: _decode(stored.get(name, "")) for name in HISTORY_SERIES}
+        length = max(len(values) for values in self.series.values())
+        for values in self.series.values():
+            values.extend([0] * (length - len(values)))
+
+    def __len__(self) -> int:
+        return len(self.series["commits"])
+
+    @property
+    def first_day(self) -> date | None:
+        return date.fromordinal(self.start) if len(self) else None
+
+    def _index_for(self, day: date) -> int | None:
+        """
+        Return the series index for `day`, growing or shifting the arrays as needed.
+
+        Returns None, leaving the arrays untouched, for a day that falls out of
+        the last `HISTORY_MAX_DAYS` days of the stored data.
+        """
+        ordinal = day.toordinal()
+        if not len(self):
+            self.start = ordinal
+        elif ordinal <= self.start + len(self) - 1 - HISTORY_MAX_DAYS:
+            return None
+        if ordinal < self.start:
+            # Backdated events (e.g. replays) prepend zero-filled days.
+            padding = [0] * (self.start - ordinal)
+            for name, values in self.series.items():
+                self.series[name] = array("H", padding) + values
+            self.start = ordinal
+        index = ordinal - self.start
+        if index >= len(self):
+            for values in self.series.values():
+                values.extend([0] * (index + 1 - len(values)))
+        overflow = len(self) - HISTORY_MAX_DAYS
+        if overflow > 0:
+            for values in self.series.values():
+                del values[:overflow]
+            self.start += overflow
+            index -= overflow
+        return index
+
+    def record(self, day: date, commits: int = 0, pushes: int = 0, xp: int = 0) -> None:
+        """Add activity to `day` and write the encoded series back to the profile (days past retention are dropped)."""
+        index = self._index_for(day)
+        if index is None:
+            return
+        for name, amount in (("commits", commits), ("pushes", pushes), ("xp", xp)):
+            values = self.series[name]
+            values[index] = min(_UINT16_MAX, values[index] + max(0, amount))
+        self.flush()
+
+    def flush(self) -> None:
+        self._stored["start"] = self.start
+        for name, values in self.series.items():
+            self._stored[name] = _encode(values)
+
+    def get(self, name: str, day: date) -> int:
+        index = day.toordinal() - self.start
+        values = self.series[name]
+        return values[index] if 0 <= index < len(values) else 0
+
+    def window(self, name: str, first: date, last: date) -> list[int]:
+        """Return daily values of `name` from `first` to `last` inclusive."""
+        values = self.series[name]
+        offset = first.toordinal() - self.start
+        days = last.toordinal() - first.toordinal() + 1
+        if offset >= 0 and offset + days <= len(values):
+            return values[offset : offset + days].tolist()
+        return [
+            values[offset + i] if 0 <= offset + i < len(values) else 0 for i in range(days)
+        ]
+
+    def commit_streak(self, today: date) -> int:
+        """Recompute consecutive commit days ending today (or yesterday)."""
+        index = today.toordinal() - self.start
+        values = self.series["commits"]
+        if index >= len(values) or index < 0 or not values[index]:
+            index -= 1
+        streak = 0
+        while 0 <= index < len(values) and values[index]:
+            streak += 1
+            index -= 1
+        return streak
+
+
+def merge_histories(*histories: dict[str, Any]) -> dict[str, Any]:
+    """Add several histories day by day."""
+    merged_data: dict[str, Any] = {"history": get_default_history()}
+    merged = ActivityHistory(merged_data)
+    for stored in histories:
+        source = ActivityHistory({"history": stored})
+        if not len(source):
+            continue
+        first = source.first_day
+        for offset in range(len(source)):
+            day = first + timedelta(days=offset)
+            amounts = {name: source.series[name][offset] for name in HISTORY_SERIES}
+            if any(amounts.values()):
+                index = merged._index_for(day)
+                if index is None:
+                    continue
+                for name, amount in amounts.items():
+                    values = merged.series[name]
+                    values[index] = min(_UINT16_MAX, values[index] + amount)
+    merged.flush()
+    return merged_data["history"]
+
+
+def heatmap_grid(history: ActivityHistory, today: date, weeks: int = 53) -> list[list[int | None]]:
+    """
+    Return a GitHub-style grid of commit counts: 7 rows (Mon..Sun) by `weeks` columns.
+
+    The last column is the current week; days after `today` are `None`.
+    """
+    last = today + timedelta(days=6 - today.weekday())
+    first = last - timedelta(days=weeks * 7 - 1)
+    counts = history.window("commits", first, last)
+    future_from = (today - first).days + 1
+    grid: list[list[int | None]] = [[None] * weeks for _ in range(7)]
+    for offset, count in enumerate(counts[:future_from]):
+        grid[offset % 7][offset // 7] = count
+    return grid
+
+
+def heatmap_levels(grid: list[list[int | None]]) -> list[list[int | None]]:
+    """Bucket grid counts into intensity levels 0-4 relative to the busiest day."""
+    peak = max((count for row in grid for count in row if count), default=0)
+    levels: list[list[int | None]] = []
+    for row in grid:
+        levels.append(
+            [
+                None if count is None else 0 if not count else min(4, 1 + (count - 1) * 4 // peak)
+                for count in row
+            ]
+        )
+    return levels
@@ -0,0 +1,168 @@
+# src/gg_cli/leaderboard.py
+"""Sidecar SQLite index of profile summaries backing `gg leaderboard`."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+INDEX_FILENAME = "leaderboard.sqlite3"
+REBUILD_CHUNK_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_hash TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    xp INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    streak INTEGER NOT NULL,
+    achievements INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profiles_by_xp ON profiles (xp DESC);
+"""
+
+
+@dataclass
+class LeaderboardEntry:
+    """Summary row stored per profile in the leaderboard index."""
+
+    profile_hash: str
+    email: str
+    xp: int
+    level: int
+    streak: int
+    achievements: int
+
+
+def summarize_profile(profile_hash: str, data: dict[str, Any]) -> LeaderboardEntry:
+    """Extract the indexed fields from a profile payload."""
+    user = data.get("user", {})
+    return LeaderboardEntry(
+        profile_hash=profile_hash,
+        email=data.get("config", {}).get("user_email") or "",
+        xp=int(user.get("xp", 0)),
+        level=int(user.get("level", 1)),
+        streak=int(data.get("stats", {}).get("consecutive_commit_days", 0)),
+        achievements=len(data.get("achievements_unlocked", {})),
+    )
+
+
+def profile_hash_from_path(path: Path) -> str:
+    """Recover the profile hash from a sharded (`ab/cd...json`) or flat path."""
+    stem = path.name[: -len(".json")]
+    return stem if len(stem) == 40 else path.parent.name + stem
+
+
+def _summarize_profile_file(path: str) -> tuple | None:
+    """Worker entry point: read one profile file and return its index row."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    return astuple(summarize_profile(profile_hash_from_path(Path(path)), data))
+
+
+class LeaderboardIndex:
+    """
+    Incrementally maintained index of profile summaries.
+
+    One connection is shared by every thread (`gg serve` saves snapshots on
+    an executor thread) and each statement runs under the index lock.
+    """
+
+    def __init__(self, data_dir: Path) -> None:
+        self.path = data_dir / INDEX_FILENAME
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def upsert(self, entry: LeaderboardEntry) -> None:
+        """Insert or replace one profile summary."""
+        self.upsert_many([entry])
+
+    def upsert_many(self, entries: Iterable[LeaderboardEntry | tuple]) -> None:
+        rows = [astuple(entry) if isinstance(entry, LeaderboardEntry) else entry for entry in entries]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+
+    def remove(self, profile_hash: str) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM profiles WHERE profile_hash = ?", (profile_hash,))
+
+    def top(self, limit: int = 10) -> list[LeaderboardEntry]:
+        """Return the `limit` highest-XP profiles using the XP index."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT * FROM profiles ORDER BY xp DESC, email ASC LIMIT ?", (limit,)
+            ).fetchall()
+        return [LeaderboardEntry(*row) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def rebuild(self, profile_paths: Iterable[Path], workers: int | None = None) -> int:
+        """Recreate the index from profile files, parsing them across processes."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM profiles")
+
+        paths = (str(path) for path in profile_paths)
+        workers = workers or os.cpu_count() or 1
+        indexed = 0
+        batch: list[tuple] = []
+
+        def _flush() -> None:
+            self.upsert_many(batch)
+            batch.clear()
+
+        if workers == 1:
+            rows = map(_summarize_profile_file, paths)
+            indexed = self._consume_rows(rows, batch, _flush)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                rows = executor.map(_summarize_profile_file, paths, chunksize=REBUILD_CHUNK_SIZE)
+                indexed = self._consume_rows(rows, batch, _flush)
+        return indexed
+
+    @staticmethod
+    def _consume_rows(rows: Iterable[tuple | None], batch: list[tuple], flush) -> int:
+        indexed = 0
+        for row in rows:
+            if row is None:
+                continue
+            batch.append(row)
+            indexed += 1
+            if len(batch) >= REBUILD_CHUNK_SIZE:
+                flush()
+        if batch:
+            flush()
+        return indexed
@@ -0,0 +1,53 @@
+# src/gg_cli/levels.py
+"""Level tiers and XP arithmetic, kept free of UI imports for fast code paths."""
+
+from __future__ import annotations
+
+# Each tuple: (level_cap, xp_per_level_in_tier, title_translation_key)
+LEVEL_TIERS = [
+    (10, 220, "level_title_novice"),
+    (20, 320, "level_title_apprentice"),
+    (30, 460, "level_title_journeyman"),
+    (40, 650, "level_title_adept"),
+    (50, 900, "level_title_master"),
+    (60, 1200, "level_title_expert"),
+    (70, 1600, "level_title_genius"),
+    (80, 2100, "level_title_legendary"),
+    (90, 2700, "level_title_marvelous"),
+    (100, 3500, "level_title_champion"),
+]
+
+
+def get_level_info(level: int) -> tuple[int, int, str]:
+    """Retrieve tier information for a given level."""
+    if not isinstance(level, int) or level < 1:
+        level = 1
+    for max_level, xp_per_level, title_key in LEVEL_TIERS:
+        if level <= max_level:
+            return max_level, xp_per_level, title_key
+    return LEVEL_TIERS[-1]
+
+
+def get_total_xp_for_level(target_level: int) -> int:
+    """Calculate cumulative XP required to reach the beginning of target level."""
+    total_xp = 0
+    current_level = 1
+    while current_level < target_level:
+        _, xp_per_level, _ = get_level_info(current_level)
+        total_xp += xp_per_level
+        current_level += 1
+    return total_xp
+
+
+def get_level_from_xp(xp: int) -> int:
+    """Calculate user level from total XP."""
+    if not isinstance(xp, int) or xp < 0:
+        xp = 0
+    level = 1
+    xp_needed_for_next_level = 0
+    while True:
+        _, xp_per_level, _ = get_level_info(level)
+        xp_needed_for_next_level += xp_per_level
+        if xp < xp_needed_for_next_level:
+            return level
+        level += 1
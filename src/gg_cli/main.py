@@ -7,7 +7,7 @@ import platform
 import shutil
 import subprocess
 import sys
-import traceback
+from typing import List
 
 import typer
 from rich.console import Group
@@ -20,9 +20,10 @@ from rich.text import Text
 from gg_cli.core import (
     get_current_git_email,
     get_default_user_data,
-    get_profile_filename,
+    get_user_repository,
     is_in_git_repo,
     load_user_data,
+    reset_user_data,
     save_user_data,
 )
 from gg_cli.definitions_loader import DefinitionsValidationError
@@ -30,11 +31,11 @@ from gg_cli.gamify import (
     ensure_runtime_definitions_valid,
     get_level_info,
     get_total_xp_for_level,
-    process_gamify_logic,
 )
-from gg_cli.git_service import GitService
-from gg_cli.translator import Translator
+from gg_cli.metrics import METRICS_ENV_VAR
+from gg_cli.translator import Translator, get_translator as translator_for_language
 from gg_cli.utils import DATA_DIR, console
+from gg_cli.wrapper import run_git_wrapper
 
 app = typer.Typer(
     help="Run `gg help` for a list of gamify commands.",
@@ -47,7 +48,7 @@ def get_translator() -> Translator:
     """Build a translator based on current user language configuration."""
     user_data = load_user_data()
     lang_code = user_data.get("config", {}).get("language", "en")
-    return Translator(lang_code)
+    return translator_for_language(lang_code)
 
 
 @app.callback()
@@ -64,7 +65,7 @@ def main_callback(ctx: typer.Context) -> None:
         raise typer.Exit(code=1)
 
     # Profile/config are user-scope commands and require a git identity.
-    if command in ["profile", "config"] and get_current_git_email() is None:
+    if command in ["profile", "achievements", "config", "sync"] and get_current_git_email() is None:
         console.print("[bold red]Error:[/bold red] Cannot find Git user email.")
         console.print("Please run `git config --global user.email 'your@email.com'` to set your identity.")
         raise typer.Exit(code=1)
@@ -78,6 +79,17 @@ def show_help() -> None:
     table.add_column()
     table.add_row("profile", "Display user profile, stats, or reset progress.")
     table.add_row("config", "Get or set configuration values.")
+    table.add_row("achievements", "List unlocked achievements (`--all` for locked ones too).")
+    table.add_row("leaderboard", "Rank all local profiles by XP.")
+    table.add_row("serve", "Run a local HTTP server for team events and leaderboards.")
+    table.add_row("sync", "Sync your profile across machines through a git remote.")
+    table.add_row("alias", "Merge other emails into your profile (add/remove/list).")
+    table.add_row("export", "Stream profiles as NDJSON (`--all` for every identity).")
+    table.add_row("import", "Load profiles from an NDJSON export.")
+    table.add_row("prompt", "Print a level/XP/streak segment for shell prompts.")
+    table.add_row("simulate", "Model XP and levels of a developer population (needs NumPy).")
+    table.add_row("rebalance", "Recompute profiles from git history under candidate XP rules.")
+    table.add_row("install-shim", "Install a `git` shim that starts gg only for tracked commands.")
     table.add_row("doctor", "Print environment diagnostics for troubleshooting.")
     table.add_row("help", "Show this help message and exit.")
     console.print(
@@ -99,28 +111,68 @@ def show_help() -> None:
 def manage_profile(
     stats: bool = typer.Option(False, "--stats", "-s", help="Display detailed statistics."),
     reset: bool = typer.Option(False, "--reset", help="Reset all progress for the current user."),
+    repos: bool = typer.Option(False, "--repos", help="Break down activity per repository."),
+    heatmap: bool = typer.Option(False, "--heatmap", help="Show a one-year commit activity grid."),
+    as_json: bool = typer.Option(False, "--json", help="Print a machine-readable report instead."),
+    emails: List[str] = typer.Option(None, "--email", "-e", help="Identity to report (repeatable, with --json)."),
 ) -> None:
     """Display profile info, stats, or reset the current profile."""
+    if as_json:
+        print_json_report("profile", emails, stats=stats)
+        return
+    if emails:
+        console.print("[red]Error: `--email` is only supported together with `--json`.[/red]")
+        raise typer.Exit(code=1)
     if reset:
         email = get_current_git_email()
         if not email:
             console.print("[red]Error: Cannot find git user email. Is git configured?[/red]")
             raise typer.Exit(code=1)
 
-        profile_path = DATA_DIR / get_profile_filename(email)
         if Confirm.ask(f"[bold yellow]Are you sure you want to reset all progress for '{email}'?[/bold yellow]"):
-            if profile_path.exists():
-                try:
-                    os.remove(profile_path)
+            try:
+                if reset_user_data(email):
                     console.print(f"[green]Profile for '{email}' has been successfully reset![/green]")
-                except OSError as exc:
-                    console.print(f"[bold red]Error: Could not delete profile file. Reason: {exc}[/bold red]")
-            else:
-                console.print(f"[yellow]No profile found for '{email}' to reset.[/yellow]")
+                else:
+                    console.print(f"[yellow]No profile found for '{email}' to reset.[/yellow]")
+            except OSError as exc:
+                console.print(f"[bold red]Error: Could not delete profile file. Reason: {exc}[/bold red]")
         else:
             console.print("[cyan]Reset cancelled.[/cyan]")
         return
 
+    if heatmap:
+        render_heatmap(load_user_data())
+        return
+
+    if repos:
+        from gg_cli.repo_stats import OTHER_REPOS_KEY
+
+        repo_stats = load_user_data().get("repos", {})
+        if not repo_stats:
+            console.print("[yellow]No per-repository activity recorded yet.[/yellow]")
+            return
+        table = Table(title="[bold]Activity by Repository[/bold]", border_style="magenta")
+        table.add_column("Repository", style="cyan")
+        table.add_column("Commits", justify="right")
+        table.add_column("Pushes", justify="right")
+        table.add_column("XP", justify="right")
+        table.add_column("Last active")
+        # Named repositories by XP, with the folded bucket always last.
+        ordered = sorted(
+            repo_stats.items(), key=lambda item: (item[0] == OTHER_REPOS_KEY, -item[1].get("xp", 0))
+        )
+        for repo_id, entry in ordered:
+            table.add_row(
+                repo_id,
+                str(entry.get("commits", 0)),
+                str(entry.get("pushes", 0)),
+                str(entry.get("xp", 0)),
+                entry.get("last_active", ""),
+            )
+        console.print(table)
+        return
+
     if stats:
         user_data = load_user_data()
         stats_payload = user_data.get("stats", {})
@@ -172,7 +224,11 @@ def manage_profile(
     unlocked_achievements = user_data.get("achievements_unlocked", {})
     if unlocked_achievements:
         # Import lazily to avoid definition loading cost when achievements are not displayed.
-        from gg_cli.achievements import ACHIEVEMENTS_DEF as achievements_def
+        from gg_cli.achievements import ACHIEVEMENTS_DEF
+        from gg_cli.plugins import achievement_definitions
+
+        language = user_data.get("config", {}).get("language", "en")
+        achievements_def = {**achievement_definitions(language), **ACHIEVEMENTS_DEF}
 
         display_items = [
             f"* {translator.t(achievements_def.get(ach_id, {}).get('name_key', ach_id))}"
@@ -188,6 +244,455 @@ def manage_profile(
     )
 
 
+HEATMAP_STYLES = ("grey23", "green4", "green3", "green1", "bright_green")
+
+
+def render_heatmap(user_data: dict) -> None:
+    """Print a GitHub-style commit grid for up to the last year from the activity history."""
+    from datetime import date, timedelta
+
+    from gg_cli.history import ActivityHistory, heatmap_grid, heatmap_levels
+
+    history = ActivityHistory(user_data)
+    today = date.today()
+    # Two columns per week plus labels and borders; narrow terminals show fewer weeks.
+    weeks = max(4, min(53, (console.width - 10) // 2))
+    grid = heatmap_grid(history, today, weeks=weeks)
+    levels = heatmap_levels(grid)
+
+    text = Text()
+    for row_index, (label, row) in enumerate(zip(("Mon", "", "Wed", "", "Fri", "", "Sun"), levels)):
+        text.append(f"{label:<4}", style="dim")
+        for level in row:
+            text.append("  " if level is None else "■ ", style=None if level is None else HEATMAP_STYLES[level])
+        if row_index < 6:
+            text.append("\n")
+
+    commits = sum(history.window("commits", today - timedelta(days=364), today))
+    console.print(
+        Panel(
+            text,
+            title="[bold]Commit Activity[/bold]",
+            subtitle=f"{commits} commits in the last year · streak {history.commit_streak(today)} days",
+            border_style="green",
+            expand=False,
+        )
+    )
+
+
+def print_json_report(command: str, emails: List[str] | None, **options) -> None:
+    """Write a `gg_cli.report` payload to stdout, bypassing Rich formatting."""
+    from gg_cli.report import run, write_json
+
+    payload, code = run(command, emails, **options)
+    write_json(payload)
+    if code:
+        raise typer.Exit(code=code)
+
+
+@app.command("achievements")
+def list_achievements(
+    include_locked: bool = typer.Option(False, "--all", help="Also list achievements not unlocked yet."),
+    as_json: bool = typer.Option(False, "--json", help="Print a machine-readable report instead."),
+    emails: List[str] = typer.Option(None, "--email", "-e", help="Identity to report (repeatable, with --json)."),
+) -> None:
+    """List unlocked achievements with their unlock dates."""
+    if as_json:
+        print_json_report("achievements", emails, include_locked=include_locked)
+        return
+    if emails:
+        console.print("[red]Error: `--email` is only supported together with `--json`.[/red]")
+        raise typer.Exit(code=1)
+
+    from gg_cli.report import achievements_report
+
+    translator = get_translator()
+    report = achievements_report(load_user_data(), translator, include_locked=include_locked)
+    if not report["achievements"]:
+        console.print("[yellow]No achievements unlocked yet.[/yellow]")
+        return
+    table = Table(title=translator.t("achievements_unlocked_title"), border_style="yellow")
+    table.add_column("Achievement", style="cyan")
+    table.add_column("Rarity")
+    table.add_column("XP", justify="right")
+    table.add_column("Unlocked")
+    for entry in report["achievements"]:
+        table.add_row(
+            entry["name"],
+            entry["rarity"] or "",
+            str(entry["xp_reward"]),
+            entry["unlocked_on"] or "[dim]-[/dim]",
+        )
+    console.print(table)
+
+
+@app.command("leaderboard")
+def show_leaderboard(
+    top: int = typer.Option(10, "--top", "-n", help="Number of profiles to display."),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Rebuild the index from all profile files."),
+    workers: int = typer.Option(None, "--workers", help="Processes used for --rebuild (default: CPU count)."),
+) -> None:
+    """Rank identities stored in the data directory using the leaderboard index."""
+    repository = get_user_repository()
+    index = repository.leaderboard_index
+    if rebuild:
+        indexed = index.rebuild(repository.iter_profile_paths(), workers=workers)
+        console.print(f"[green]Indexed {indexed} profiles.[/green]")
+
+    entries = index.top(top)
+    if not entries:
+        console.print("[yellow]No profiles indexed yet. Try `gg leaderboard --rebuild`.[/yellow]")
+        return
+
+    table = Table(title="[bold]Git-Gamify Leaderboard[/bold]", border_style="magenta")
+    table.add_column("#", justify="right", style="bold")
+    table.add_column("Email", style="cyan")
+    table.add_column("Level", justify="right")
+    table.add_column("XP", justify="right")
+    table.add_column("Streak", justify="right")
+    table.add_column("Achievements", justify="right")
+    for rank, entry in enumerate(entries, start=1):
+        table.add_row(
+            str(rank),
+            entry.email,
+            str(entry.level),
+            str(entry.xp),
+            str(entry.streak),
+            str(entry.achievements),
+        )
+    console.print(table)
+
+
+@app.command("serve")
+def run_serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind."),
+    port: int = typer.Option(8765, "--port", help="TCP port to listen on."),
+    snapshot_interval: float = typer.Option(
+        30.0, "--snapshot-interval", help="Seconds between writes of changed profiles."
+    ),
+) -> None:
+    """Serve event ingestion and leaderboard/profile JSON over HTTP."""
+    # Import lazily: only the server needs asyncio and the HTTP plumbing.
+    from gg_cli.server import run_server
+
+    run_server(get_user_repository(), host=host, port=port, snapshot_interval=snapshot_interval)
+
+
+@app.command("sync")
+def run_sync(
+    remote: str = typer.Option("origin", "--remote", "-r", help="Remote storing the refs/gamify/* ref."),
+) -> None:
+    """
+    Merge profile progress from other machines and publish this one's.
+
+    XP, counters, streaks, achievements and the record of already counted
+    commits are shared. The activity heatmap, per-repository stats and rate
+    limits stay per machine.
+    """
+    from gg_cli.sync import SyncError, sync_profile
+
+    if not is_in_git_repo():
+        console.print("[red]Error: `gg sync` must run inside a Git repository that has the remote.[/red]")
+        raise typer.Exit(code=1)
+
+    user_data = load_user_data()
+    try:
+        result = sync_profile(user_data, remote)
+    except SyncError as exc:
+        console.print(f"[bold red]Sync failed:[/bold red] {exc}")
+        raise typer.Exit(code=1)
+    save_user_data(user_data)
+
+    action = "published" if result.pushed else "already up to date"
+    console.print(
+        f"[green]Synced with '{remote}': {result.devices} device(s), "
+        f"{result.fetched_devices} updated, local contribution {action}.[/green]"
+    )
+
+
+@app.command("alias")
+def manage_alias(
+    action: str = typer.Argument("list", help="One of: add, remove, list."),
+    email: str = typer.Argument(None, help="Alias email to add or remove."),
+    to: str = typer.Option(None, "--to", help="Canonical email (default: current Git identity)."),
+) -> None:
+    """Map extra emails onto one canonical profile."""
+    repository = get_user_repository()
+    if action == "list":
+        if not repository.aliases:
+            console.print("[yellow]No aliases configured.[/yellow]")
+        for alias, canonical in sorted(repository.aliases.items()):
+            console.print(f"[cyan]{alias}[/cyan] -> {canonical}")
+        return
+    if action not in {"add", "remove"} or not email:
+        console.print("[red]Error: Use `gg alias add EMAIL [--to CANONICAL]` or `gg alias remove EMAIL`.[/red]")
+        raise typer.Exit(code=1)
+
+    if action == "remove":
+        if not repository.remove_alias(email):
+            console.print(f"[yellow]'{email}' is not an alias.[/yellow]")
+            return
+        console.print(f"[green]Removed alias '{email}'.[/green]")
+        return
+
+    canonical = to or get_current_git_email()
+    if not canonical:
+        console.print("[bold red]Error:[/bold red] Cannot find Git user email. Pass `--to CANONICAL`.")
+        raise typer.Exit(code=1)
+    try:
+        merged = repository.add_alias(email, canonical)
+    except ValueError as exc:
+        console.print(f"[red]Error: {exc}[/red]")
+        raise typer.Exit(code=1)
+    canonical = repository.resolve_email(canonical)
+    note = " Existing progress was merged." if merged else ""
+    console.print(f"[green]'{email}' now counts towards '{canonical}'.{note}[/green]")
+
+
+@app.command("export")
+def run_export(
+    all_profiles: bool = typer.Option(False, "--all", help="Export every profile in the data directory."),
+    output: str = typer.Option("-", "--output", "-o", help="NDJSON file to write ('-' for stdout)."),
+) -> None:
+    """Stream profiles as NDJSON, one profile per line."""
+    from gg_cli.transfer import export_lines, iter_profiles
+
+    if all_profiles:
+        profiles = iter_profiles(get_user_repository())
+    else:
+        if get_current_git_email() is None:
+            console.print("[bold red]Error:[/bold red] Cannot find Git user email. Use `--all` or set one.")
+            raise typer.Exit(code=1)
+        profiles = iter([load_user_data()])
+
+    if output == "-":
+        sys.stdout.writelines(export_lines(profiles))
+        sys.stdout.flush()
+        return
+    with open(output, "w", encoding="utf-8") as f:
+        f.writelines(export_lines(profiles))
+
+
+@app.command("import")
+def run_import(
+    source: str = typer.Argument(..., help="NDJSON file produced by `gg export` ('-' for stdin)."),
+    workers: int = typer.Option(1, "--workers", help="Processes used to validate and write profiles."),
+    batch_size: int = typer.Option(500, "--batch-size", help="Profiles written per batch."),
+) -> None:
+    """Validate and store profiles from an NDJSON stream."""
+    from gg_cli.transfer import import_lines
+
+    repository = get_user_repository()
+    try:
+        if source == "-":
+            report = import_lines(sys.stdin, repository, workers=workers, batch_size=batch_size)
+        else:
+            with open(source, "r", encoding="utf-8") as f:
+                report = import_lines(f, repository, workers=workers, batch_size=batch_size)
+    except OSError as exc:
+        console.print(f"[bold red]Import failed:[/bold red] {exc}")
+        raise typer.Exit(code=1)
+
+    for error in report.errors:
+        console.print(f"[yellow]Skipped {error}[/yellow]")
+    if report.rejected > len(report.errors):
+        console.print(f"[yellow]... and {report.rejected - len(report.errors)} more.[/yellow]")
+    console.print(f"[green]Imported {report.imported} profiles ({report.rejected} rejected).[/green]")
+    if report.rejected:
+        raise typer.Exit(code=1)
+
+
+@app.command("prompt")
+def run_prompt(
+    fmt: str = typer.Option(None, "--format", "-f", help="Format string, e.g. 'Lv{level} {streak}d'."),
+) -> None:
+    """Print a shell prompt segment (prefer the faster `gg-prompt` in prompts)."""
+    from gg_cli.prompt import main as prompt_main
+
+    prompt_main(["--format", fmt] if fmt else [])
+
+
+@app.command("simulate")
+def run_simulate(
+    users: int = typer.Option(10000, "--users", "-u", help="Simulated developers."),
+    days: int = typer.Option(365, "--days", "-d", help="Simulated days per developer."),
+    rules_file: str = typer.Option(None, "--rules", help="JSON file with candidate XP rules, streak bonuses or level tiers."),
+    active_rate: float = typer.Option(0.6, "--active-rate", help="Mean share of days with commits."),
+    commits_per_day: float = typer.Option(3.0, "--commits-per-day", help="Mean commits on a commit day."),
+    pushes_per_day: float = typer.Option(1.0, "--pushes-per-day", help="Mean pushes on a commit day."),
+    change_median: float = typer.Option(40.0, "--change-median", help="Median changed lines per commit."),
+    seed: int = typer.Option(None, "--seed", help="Random seed for reproducible runs."),
+    check: int = typer.Option(20, "--check", help="Users replayed through the XP engine to cross-check (0 to skip)."),
+    workers: int = typer.Option(None, "--workers", help="Processes used (default: CPU count)."),
+) -> None:
+    """Simulate XP, streaks and levels across a population to balance the rules."""
+    import time
+
+    from gg_cli.simulate import ActivityModel, SimulationError, SimulationRules, cross_check, load_rules_file, simulate
+
+    model = ActivityModel(
+        active_rate=active_rate,
+        commits_per_day=commits_per_day,
+        pushes_per_day=pushes_per_day,
+        change_median=change_median,
+    )
+    try:
+        rules = load_rules_file(rules_file) if rules_file else SimulationRules()
+        started = time.perf_counter()
+        result = simulate(users, days, model, rules, seed=seed, workers=workers)
+        elapsed = time.perf_counter() - started
+        checked = cross_check(check, min(days, 365), model, rules, seed=seed) if check > 0 else None
+    except SimulationError as exc:
+        console.print(f"[bold red]Error:[/bold red] {exc}")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"[bold]{users:,} developers x {days} days[/bold] simulated in {elapsed:.1f}s "
+        f"(rule XP only; achievements are not modelled)."
+    )
+    percentiles = result.final_xp_percentiles
+    console.print(
+        f"Final XP p10/p50/p90: {percentiles[10]:,.0f} / {percentiles[50]:,.0f} / {percentiles[90]:,.0f}  "
+        f"Mean XP per commit day: {result.mean_xp_per_commit_day:.1f}"
+    )
+
+    levels = Table(title="Final level distribution", border_style="cyan")
+    levels.add_column("Levels", justify="right")
+    levels.add_column("Developers", justify="right")
+    levels.add_column("Share", justify="right")
+    lower = 1
+    for cap, _ in rules.level_tiers + [(max(result.level_counts), 0)]:
+        if lower > max(result.level_counts):
+            break
+        count = sum(n for level, n in result.level_counts.items() if lower <= level <= cap)
+        levels.add_row(f"{lower}-{cap}", f"{count:,}", f"{100 * count / users:.1f}%")
+        lower = cap + 1
+    console.print(levels)
+
+    timing = Table(title="Days to reach level", border_style="magenta")
+    for column in ("Level", "Reached", "p10", "p50", "p90"):
+        timing.add_column(column, justify="right")
+    for milestone in result.milestones:
+        days_at = [
+            "-" if value is None else f"{value:.0f}" for value in (milestone.p10, milestone.p50, milestone.p90)
+        ]
+        timing.add_row(str(milestone.level), f"{100 * milestone.reached / users:.1f}%", *days_at)
+    console.print(timing)
+
+    if checked is None:
+        return
+    if checked.skipped_reason:
+        console.print(f"[yellow]Engine cross-check skipped: {checked.skipped_reason}.[/yellow]")
+    elif checked.ok:
+        console.print(
+            f"[green]Engine cross-check passed: {checked.users} users, {checked.commit_days:,} commit days match.[/green]"
+        )
+    else:
+        for mismatch in checked.mismatches[:5]:
+            console.print(f"[red]Mismatch: {mismatch}[/red]")
+        console.print("[bold red]Engine cross-check failed.[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@app.command("rebalance")
+def run_rebalance(
+    rules_file: str = typer.Option(..., "--rules", help="JSON file with candidate `xp_rules`."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report XP/level changes without saving them."),
+    repos: List[str] = typer.Option(None, "--repo", help="Repository to replay (repeatable, default: current)."),
+    emails: List[str] = typer.Option(None, "--email", "-e", help="Only rebalance these identities (repeatable)."),
+    workers: int = typer.Option(None, "--workers", help="Processes used to read repositories (default: CPU count)."),
+) -> None:
+    """Replay commit history under candidate XP rules and report or apply the XP deltas."""
+    from gg_cli.rebalance import RebalanceError, apply_rebalance, collect_history, plan_rebalance
+    from gg_cli.simulate import SimulationError, load_rules_file
+
+    try:
+        rules = load_rules_file(rules_file)
+    except SimulationError as exc:
+        console.print(f"[bold red]Error:[/bold red] {exc}")
+        raise typer.Exit(code=1)
+    if not rules.matches_engine():
+        console.print("[bold red]Error:[/bold red] rebalance only supports `xp_rules`; streak and level tiers are fixed.")
+        raise typer.Exit(code=1)
+
+    if not repos:
+        try:
+            repos = [
+                subprocess.check_output(
+                    ["git", "rev-parse", "--show-toplevel"], text=True, stderr=subprocess.DEVNULL
+                ).strip()
+            ]
+        except (OSError, subprocess.CalledProcessError):
+            console.print("[bold red]Error:[/bold red] not inside a git repository; pass --repo.")
+            raise typer.Exit(code=1)
+
+    repository = get_user_repository()
+    wanted = [repository.resolve_email(email.strip().lower()) for email in emails] if emails else None
+    try:
+        history = collect_history(repos, repository.aliases, wanted, workers=workers)
+    except RebalanceError as exc:
+        console.print(f"[bold red]Error:[/bold red] {exc}")
+        raise typer.Exit(code=1)
+    planned = list(plan_rebalance(repository, history, rules.xp_rules))
+    if not planned:
+        console.print("No profiles with commits in the given repositories.")
+        return
+
+    table = Table(title="Rebalance (dry run)" if dry_run else "Rebalance", border_style="cyan")
+    table.add_column("Email")
+    for column in ("Commits", "XP now", "Delta", "XP after", "Level"):
+        table.add_column(column, justify="right")
+    for entry, _ in planned:
+        level = str(entry.current_level)
+        if entry.new_level != entry.current_level:
+            level = f"{entry.current_level} -> {entry.new_level}"
+        table.add_row(
+            entry.email,
+            f"{entry.commits:,}",
+            f"{entry.current_xp:,}",
+            f"{entry.delta:+,}",
+            f"{entry.new_xp:,}",
+            level,
+        )
+    console.print(table)
+    console.print("Push XP is not replayed; only commit XP and achievements are recomputed.")
+    if dry_run:
+        return
+    saved = apply_rebalance(repository, planned, rules.xp_rules)
+    console.print(f"[green]Rebalanced {saved} profile(s).[/green]")
+
+
+@app.command("install-shim")
+def run_install_shim(
+    directory: str = typer.Option(None, "--dir", help="Install a `git` script here (must come before git in PATH)."),
+    print_only: bool = typer.Option(False, "--print", help="Print the shell function instead of installing it."),
+) -> None:
+    """Install a POSIX `git` shim that runs real git directly for untracked commands."""
+    from pathlib import Path
+
+    from gg_cli.shim import ShimError, find_gg, find_real_git, install_shim, render_function, tracked_commands
+
+    if os.name == "nt":
+        console.print("[red]Shims need a POSIX shell; on PowerShell keep the `git` function from the README.[/red]")
+        raise typer.Exit(code=1)
+    try:
+        if print_only:
+            # Plain stdout, so `eval "$(gg install-shim --print)"` works.
+            sys.stdout.write(render_function(tracked_commands(), find_gg()))
+            return
+        target = Path(directory).expanduser() if directory else None
+        path = install_shim("script" if target else "function", target)
+    except (ShimError, OSError) as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print(f"[green]Installed {path}[/green] (tracked: {', '.join(tracked_commands())}).")
+    if target is None:
+        console.print(f"Replace the `git` function in ~/.bashrc or ~/.zshrc with: . {path}")
+    elif find_real_git() != str(path):
+        console.print(f"[yellow]Put {target} before the directory of {find_real_git(target)} in PATH.[/yellow]")
+
+
 @app.command("doctor")
 def run_doctor() -> None:
     """Print a concise diagnostics report for local troubleshooting."""
@@ -207,6 +712,10 @@ def run_doctor() -> None:
     except DefinitionsValidationError as exc:
         definitions_status = f"invalid ({exc})"
 
+    from gg_cli.plugins import index as plugin_index
+
+    plugin_entries = plugin_index.entries()
+
     email = get_current_git_email() or "not set"
     shell = os.environ.get("SHELL") or os.environ.get("ComSpec") or "unknown"
     in_repo = "yes" if is_in_git_repo() else "no"
@@ -238,6 +747,12 @@ def run_doctor() -> None:
     info_table.add_row("Definitions", f"[{definitions_style}]{definitions_state}[/{definitions_style}]")
     if definitions_status != "ok":
         info_table.add_row("Definitions detail", definitions_status)
+    info_table.add_row("Metrics file", os.environ.get(METRICS_ENV_VAR) or "disabled")
+    for entry in plugin_entries:
+        if entry["error"]:
+            info_table.add_row(f"Plugin {entry['name']}", f"[red]ERROR[/red] {entry['error']}")
+        else:
+            info_table.add_row(f"Plugin {entry['name']}", f"{len(entry['achievements'])} achievements")
 
     console.print(
         Panel(
@@ -251,7 +766,7 @@ def run_doctor() -> None:
 
 @app.command("config")
 def manage_config(
-    set_value: str = typer.Option(None, "--set", help="Set a value (e.g., 'language=zh')."),
+    set_value: str = typer.Option(None, "--set", help="Set a value (e.g., 'language=zh', 'output=plain')."),
     get_value: str = typer.Option(None, "--get", help="Get a value (e.g., 'language')."),
 ) -> None:
     """Read or update user configuration values."""
@@ -266,13 +781,23 @@ def manage_config(
             if key.lower() == "language":
                 user_data["config"]["language"] = value
                 save_user_data(user_data)
-                confirm_translator = Translator(value)
+                confirm_translator = translator_for_language(value)
                 console.print(
                     Panel(confirm_translator.t("config_language_set"), border_style="green", expand=False)
                 )
+            elif key.lower() == "output":
+                from gg_cli.render import OUTPUT_MODES
+
+                if value.lower() not in OUTPUT_MODES:
+                    console.print(f"[red]Error: output must be one of: {', '.join(OUTPUT_MODES)}.[/red]")
+                    return
+                user_data["config"]["output"] = value.lower()
+                save_user_data(user_data)
+                console.print(f"[green]Gamify output set to '{value.lower()}'.[/green]")
             else:
                 console.print(
-                    f"[red]Error: Unknown config key '[cyan]{key}[/cyan]'. Only 'language' is supported.[/red]"
+                    f"[red]Error: Unknown config key '[cyan]{key}[/cyan]'. "
+                    "Supported keys: 'language', 'output'.[/red]"
                 )
         except ValueError:
             console.print("[red]Error: Invalid format. Please use '--set key=value'.[/red]")
@@ -280,34 +805,15 @@ def manage_config(
     if get_value:
         if get_value.lower() == "language":
             console.print(user_data.get("config", {}).get("language", "en"))
+        elif get_value.lower() == "output":
+            console.print(user_data.get("config", {}).get("output", "auto"))
         else:
             console.print(
-                f"[red]Error: Unknown config key '[cyan]{get_value}[/cyan]'. Only 'language' is supported.[/red]"
+                f"[red]Error: Unknown config key '[cyan]{get_value}[/cyan]'. "
+                "Supported keys: 'language', 'output'.[/red]"
             )
 
 
-def run_git_wrapper(git_args: list[str]) -> None:
-    """Run real git command and trigger gamification on successful commit/push."""
-    git_service = GitService()
-    try:
-        result = git_service.run(git_args)
-        if result.stdout:
-            sys.stdout.write(result.stdout)
-        if result.stderr:
-            sys.stderr.write(result.stderr)
-
-        if result.returncode == 0:
-            command = git_args[0] if git_args else ""
-            if command in ["commit", "push"]:
-                console.print("-" * 20)
-                process_gamify_logic(git_args, git_service=git_service)
-    except FileNotFoundError:
-        console.print("[bold red]Error: 'git' command not found. Is Git installed and in your PATH?[/bold red]")
-    except Exception:
-        console.print("[bold red]An unexpected error occurred. Full traceback below:[/bold red]")
-        traceback.print_exc()
-
-
 def cli_entry() -> None:
     """Dispatch either git-wrapper mode or regular Typer command mode."""
     if len(sys.argv) > 1 and sys.argv[1] == "git":
@@ -0,0 +1,269 @@
+# src/gg_cli/metrics.py
+"""
+Optional latency histograms and counters exported as a Prometheus textfile.
+
+Set `GG_METRICS_FILE` to a path watched by node-exporter's textfile collector
+(e.g. `/var/lib/node_exporter/textfile/gg.prom`). Each process aggregates in
+memory and, at exit, folds its samples into that file under a lock and
+replaces it atomically, so short-lived `gg git` runs add up. Without the
+variable every call returns after one attribute check.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+METRICS_ENV_VAR = "GG_METRICS_FILE"
+
+# Upper bounds in seconds; gg runs in interactive git calls, so most mass is sub-second.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HISTOGRAMS = {
+    "gg_git_wrapper_overhead_seconds": "Time gg git adds on top of the wrapped git command.",
+    "gg_gamify_phase_seconds": "Latency of each gamification phase (load, process, render, save).",
+    "gg_profile_save_seconds": "Time spent writing one profile.",
+}
+
+COUNTERS = {
+    "gg_events_total": "Git events processed by the XP engine.",
+    "gg_achievement_unlocks_total": "Achievements unlocked.",
+    "gg_errors_total": "Errors caught while wrapping or gamifying git commands.",
+}
+
+_Labels = Tuple[Tuple[str, str], ...]
+_Key = Tuple[str, _Labels]
+
+_SAMPLE_RE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$')
+_LABEL_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+_INF_LABEL = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", lambda match: "\n" if match.group(1) == "n" else match.group(1), value)
+
+
+def _format_labels(labels: _Labels, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _NullTimer:
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, registry: "MetricsRegistry", name: str, labels: dict[str, str]) -> None:
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._registry.observe(self._name, time.perf_counter() - self._started, **self._labels)
+
+
+class MetricsRegistry:
+    """In-process counters and histograms, folded into a textfile on `flush`."""
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._counters: Dict[_Key, float] = {}
+        # Cumulative bucket counts (one per LATENCY_BUCKETS bound), then +Inf, sum.
+        self._histograms: Dict[_Key, List[float]] = {}
+        self._exit_hook = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def _touch(self) -> None:
+        if not self._exit_hook:
+            self._exit_hook = True
+            atexit.register(self.flush)
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        if self.path is None:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._touch()
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        if self.path is None:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._touch()
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [0.0] * (len(LATENCY_BUCKETS) + 2)
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    series[index] += 1
+            series[-2] += 1
+            series[-1] += seconds
+
+    def timer(self, name: str, **labels: str):
+        """Context manager observing the elapsed time of its block into histogram `name`."""
+        if self.path is None:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def _read_existing(self) -> None:
+        """Add the samples already in the textfile to the in-memory aggregates."""
+        assert self.path is not None
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return
+        bound_index = {_format_value(bound): index for index, bound in enumerate(LATENCY_BUCKETS)}
+        for line in lines:
+            match = _SAMPLE_RE.match(line)
+            if match is None:
+                continue
+            sample, raw_labels, raw_value = match.groups()
+            try:
+                value = float(raw_value)
+            except ValueError:
+                continue
+            labels = {name: _unescape(text) for name, text in _LABEL_RE.findall(raw_labels or "")}
+            if sample in COUNTERS:
+                key = (sample, tuple(sorted(labels.items())))
+                self._counters[key] = self._counters.get(key, 0) + value
+                continue
+            family, _, suffix = sample.rpartition("_")
+            if family not in HISTOGRAMS or suffix not in ("bucket", "sum", "count"):
+                continue
+            le = labels.pop("le", None)
+            key = (family, tuple(sorted(labels.items())))
+            series = self._histograms.setdefault(key, [0.0] * (len(LATENCY_BUCKETS) + 2))
+            if suffix == "sum":
+                series[-1] += value
+            elif suffix == "count":
+                series[-2] += value
+            elif le in bound_index:
+                # Buckets with other bounds (older layouts) are dropped; +Inf equals _count.
+                series[bound_index[le]] += value
+
+    def render(self) -> str:
+        """Return the aggregates in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for family, help_text in COUNTERS.items():
+            samples = sorted((labels, value) for (name, labels), value in self._counters.items() if name == family)
+            if not samples:
+                continue
+            lines += [f"# HELP {family} {help_text}", f"# TYPE {family} counter"]
+            lines += [f"{family}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples]
+        for family, help_text in HISTOGRAMS.items():
+            samples = sorted((labels, series) for (name, labels), series in self._histograms.items() if name == family)
+            if not samples:
+                continue
+            lines += [f"# HELP {family} {help_text}", f"# TYPE {family} histogram"]
+            for labels, series in samples:
+                for bound, count in zip(LATENCY_BUCKETS, series):
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{family}_bucket{_format_labels(labels, le)} {_format_value(count)}")
+                lines.append(f"{family}_bucket{_format_labels(labels, _INF_LABEL)} {_format_value(series[-2])}")
+                lines.append(f"{family}_sum{_format_labels(labels)} {_format_value(series[-1])}")
+                lines.append(f"{family}_count{_format_labels(labels)} {_format_value(series[-2])}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def flush(self) -> None:
+        """Fold pending samples into the textfile (best effort, never raises)."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._counters and not self._histograms:
+                return
+            try:
+                with _file_lock(self.path):
+                    self._read_existing()
+                    _write_text_atomic(self.path, self.render())
+            except OSError:
+                pass
+            self._counters.clear()
+            self._histograms.clear()
+
+
+class _file_lock:
+    """Exclusive advisory lock on `<path>.lock` where the platform supports one."""
+
+    def __init__(self, path: Path) -> None:
+        self._lock_path = str(path) + ".lock"
+        self._fd: int | None = None
+
+    def __enter__(self) -> "_file_lock":
+        self._fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            import fcntl
+        except ImportError:  # Windows: concurrent flushes may drop samples.
+            return self
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    # The collector must never see a half-written file, so write and rename.
+    fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+registry = MetricsRegistry(os.environ.get(METRICS_ENV_VAR) or None)
+
+
+def inc(name: str, amount: float = 1, **labels: str) -> None:
+    """Increment counter `name`; a no-op unless metrics are enabled."""
+    registry.inc(name, amount, **labels)
+
+
+def observe(name: str, seconds: float, **labels: str) -> None:
+    """Record one latency sample; a no-op unless metrics are enabled."""
+    registry.observe(name, seconds, **labels)
+
+
+def timer(name: str, **labels: str):
+    """Time a block into histogram `name`; a shared no-op unless metrics are enabled."""
+    return registry.timer(name, **labels)
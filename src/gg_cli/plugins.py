@@ -0,0 +1,275 @@
+# src/gg_cli/plugins.py
+"""
+Third-party achievements discovered through the `gg_cli.achievements` entry-point group.
+
+A plugin package registers an `AchievementPlugin` object, e.g. in its
+pyproject.toml:
+
+    [project.entry-points."gg_cli.achievements"]
+    oncall = "acme_gg.oncall:plugin"
+
+Scanning installed distributions costs tens of milliseconds, so discovery
+runs only when the `sys.path` directories change (a package was installed
+or removed). Each plugin's subscribed commands and definitions are then
+kept in an index file, and plugin modules are imported only when an event
+they subscribe to is processed.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from gg_cli import metrics
+from gg_cli.utils import DATA_DIR
+
+ENTRY_POINT_GROUP = "gg_cli.achievements"
+
+PLUGIN_INDEX_PATH = DATA_DIR / "plugins-cache.json"
+PLUGIN_INDEX_VERSION = 1
+
+
+@dataclass
+class AchievementPlugin:
+    """
+    Achievements contributed by a plugin.
+
+    `events` lists the git commands the checkers care about. Each definition
+    has `xp_reward` plus `name` and `desc`, given as text or as a mapping of
+    language code to text; `rarity` is optional. A checker is called like the
+    built-in ones, `checker(user_data, context=context)`, and unlocks its
+    achievement by returning a truthy value.
+    """
+
+    events: tuple[str, ...]
+    achievements: dict[str, dict[str, Any]]
+    checkers: dict[str, Callable[..., Any]]
+
+
+def _check_text(value: Any) -> bool:
+    if isinstance(value, str):
+        return bool(value)
+    return isinstance(value, dict) and bool(value) and all(isinstance(text, str) for text in value.values())
+
+
+def check_plugin(plugin: Any, reserved_ids: Any = ()) -> list[str]:
+    """Return problems with a loaded plugin object; `reserved_ids` are built-in achievement ids."""
+    if not isinstance(plugin, AchievementPlugin):
+        return ["Entry point does not refer to an AchievementPlugin."]
+    errors: list[str] = []
+    events = plugin.events
+    if isinstance(events, str) or not events or not all(isinstance(event, str) for event in events):
+        errors.append("Plugin 'events' must be a non-empty list of git commands.")
+    for ach_id, definition in plugin.achievements.items():
+        if ach_id in reserved_ids:
+            errors.append(f"Achievement '{ach_id}' clashes with a built-in achievement.")
+        if not isinstance(definition, dict):
+            errors.append(f"Achievement '{ach_id}' must be a mapping.")
+            continue
+        xp_reward = definition.get("xp_reward")
+        if isinstance(xp_reward, bool) or not isinstance(xp_reward, int) or xp_reward < 0:
+            errors.append(f"Achievement '{ach_id}' has invalid xp_reward '{xp_reward}'.")
+        for key in ("name", "desc"):
+            if not _check_text(definition.get(key)):
+                errors.append(f"Achievement '{ach_id}' needs a '{key}' text.")
+        if not callable(plugin.checkers.get(ach_id)):
+            errors.append(f"Achievement '{ach_id}' has no checker.")
+    return errors
+
+
+def _site_state() -> list[list[Any]]:
+    """Modification times of the import path; installing a distribution changes one."""
+    state: list[list[Any]] = []
+    for entry in sys.path:
+        if not entry:
+            continue
+        try:
+            state.append([entry, os.stat(entry).st_mtime_ns])
+        except OSError:
+            continue
+    return state
+
+
+def _entry_points() -> list[Any]:
+    # Imported here: only a cache miss pays for reading distribution metadata.
+    from importlib.metadata import entry_points
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        return list(found.select(group=ENTRY_POINT_GROUP))
+    return list(found.get(ENTRY_POINT_GROUP, ()))  # Python < 3.10
+
+
+def _resolve(target: str) -> Any:
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    return functools.reduce(getattr, attribute.split("."), module) if attribute else module
+
+
+class PluginIndex:
+    """Discovered plugins, persisted to `cache_path` and keyed by the import path state."""
+
+    def __init__(self, cache_path: Path | None = PLUGIN_INDEX_PATH) -> None:
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._entries: list[dict[str, Any]] | None = None
+        self._plugins: dict[str, AchievementPlugin | None] = {}
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return one record per entry point: name, target, events, achievements and error."""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = self._load()
+        return self._entries
+
+    def clear(self) -> None:
+        """Forget discovered and imported plugins (the index file is kept)."""
+        with self._lock:
+            self._entries = None
+            self._plugins.clear()
+
+    def _load(self) -> list[dict[str, Any]]:
+        key = _site_state()
+        cached = self._read_index()
+        if cached is not None and cached.get("key") == key:
+            return cached["plugins"]
+        entries = [self._describe(entry_point) for entry_point in _entry_points()]
+        self._write_index({"version": PLUGIN_INDEX_VERSION, "key": key, "plugins": entries})
+        return entries
+
+    def _describe(self, entry_point: Any) -> dict[str, Any]:
+        from gg_cli.definitions_loader import load_achievements_flat
+
+        entry: dict[str, Any] = {
+            "name": entry_point.name,
+            "target": entry_point.value,
+            "events": [],
+            "achievements": {},
+            "error": None,
+        }
+        try:
+            plugin = entry_point.load()
+            errors = check_plugin(plugin, load_achievements_flat())
+        except Exception as exc:
+            entry["error"] = f"{type(exc).__name__}: {exc}"
+            return entry
+        if errors:
+            entry["error"] = " ".join(errors)
+            return entry
+        entry["events"] = list(plugin.events)
+        entry["achievements"] = {
+            ach_id: {key: definition[key] for key in ("xp_reward", "name", "desc", "rarity") if key in definition}
+            for ach_id, definition in plugin.achievements.items()
+        }
+        self._plugins[entry_point.value] = plugin
+        return entry
+
+    def plugin(self, target: str) -> AchievementPlugin | None:
+        """Import the plugin at `target` once; None if it no longer loads."""
+        if target not in self._plugins:
+            try:
+                plugin = _resolve(target)
+            except Exception:
+                plugin = None
+            self._plugins[target] = plugin if isinstance(plugin, AchievementPlugin) else None
+        return self._plugins[target]
+
+    def _read_index(self) -> dict[str, Any] | None:
+        if self.cache_path is None:
+            return None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("version") != PLUGIN_INDEX_VERSION:
+            return None
+        return cached
+
+    def _write_index(self, index_data: dict[str, Any]) -> None:
+        """Best-effort atomic rewrite; without it discovery simply runs again next time."""
+        if self.cache_path is None:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=self.cache_path.stem + ".", suffix=".tmp", dir=str(self.cache_path.parent)
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index_data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+index = PluginIndex()
+
+
+def _localize(text: Any, language: str) -> str:
+    if isinstance(text, dict):
+        text = text.get(language) or text.get("en") or next(iter(text.values()))
+    # Plugin texts sit where built-ins keep locale keys, and Translator.t formats those.
+    return str(text).replace("{", "{{").replace("}", "}}")
+
+
+def _localized_definition(definition: dict[str, Any], language: str) -> dict[str, Any]:
+    return {
+        "name_key": _localize(definition["name"], language),
+        "desc_key": _localize(definition["desc"], language),
+        "xp_reward": definition["xp_reward"],
+        "rarity": definition.get("rarity"),
+    }
+
+
+def achievement_definitions(language: str = "en") -> dict[str, dict[str, Any]]:
+    """Plugin achievements in the built-in definition shape, with texts for `language`."""
+    definitions: dict[str, dict[str, Any]] = {}
+    for entry in index.entries():
+        if entry["error"]:
+            continue
+        for ach_id, definition in entry["achievements"].items():
+            definitions[ach_id] = {**_localized_definition(definition, language), "plugin": entry["name"]}
+    return definitions
+
+
+def _lazy_checker(target: str, ach_id: str) -> Callable[..., Any]:
+    def checker(user_data: dict[str, Any], **kwargs: Any) -> Any:
+        plugin = index.plugin(target)
+        if plugin is None or ach_id not in plugin.checkers:
+            return None
+        try:
+            return plugin.checkers[ach_id](user_data, **kwargs)
+        except Exception:
+            # A broken plugin must not break the git command it rides on.
+            metrics.inc("gg_errors_total", kind="plugin")
+            return None
+
+    return checker
+
+
+def plugin_checkers(command: str, language: str = "en") -> Iterator[tuple[str, dict[str, Any], Callable[..., Any]]]:
+    """
+    Yield `(achievement id, definition, checker)` for plugins subscribed to `command`.
+
+    A plugin is imported when one of its checkers is first called, so an
+    event whose plugin achievements are all unlocked imports nothing.
+    """
+    for entry in index.entries():
+        if entry["error"] or command not in entry["events"]:
+            continue
+        for ach_id, definition in entry["achievements"].items():
+            yield ach_id, _localized_definition(definition, language), _lazy_checker(entry["target"], ach_id)
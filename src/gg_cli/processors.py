@@ -0,0 +1,104 @@
+# src/gg_cli/processors.py
+"""
+Registry mapping git subcommands to the processors that score them.
+
+The registry only holds import paths, so `gg git <cmd>` can tell in one dict
+lookup whether `<cmd>` earns XP without importing the engine. A processor's
+module is imported the first time its command is processed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, FrozenSet
+
+if TYPE_CHECKING:
+    from gg_cli.gamify import GamifyEvent
+    from gg_cli.git_service import GitService
+
+# Git metadata a processor may read:
+# - "head": resolved HEAD (and HEAD@{1} for amends), the event's dedup key;
+# - "diff" / "message": size and message of the HEAD commit;
+# - "push_report": the `git push` report on stderr, plus the pushed range;
+# - "reflog": the newest HEAD reflog entry, which says what the command did.
+METADATA_KINDS = frozenset({"head", "diff", "message", "push_report", "reflog"})
+
+# Metadata a client can record and send to `gg serve` (see RecordedGitService).
+RECORDABLE_METADATA = frozenset({"head", "diff", "message", "push_report"})
+
+
+class Processor(ABC):
+    """
+    Scores one git subcommand.
+
+    `accepts` filters out runs that did no work (listing tags, aborted
+    merges) before the profile is loaded; `event_keys` identifies the work
+    for deduplication; `process` applies XP rules and returns the XP earned.
+    """
+
+    def accepts(self, event: GamifyEvent, git: GitService) -> bool:
+        return True
+
+    def event_keys(self, event: GamifyEvent, git: GitService) -> tuple[list[str], list[str]] | None:
+        """Return `(keys, supersedes)` for the event, or None when it cannot be identified."""
+        return None
+
+    @abstractmethod
+    def process(
+        self, user_data: dict[str, Any], event: GamifyEvent, git: GitService, xp_rules: dict[str, int]
+    ) -> int:
+        """Apply XP rules for the event and return the XP earned."""
+
+
+@dataclass(frozen=True)
+class ProcessorSpec:
+    """Where a processor lives and which git metadata it reads."""
+
+    target: str
+    needs: FrozenSet[str] = frozenset()
+
+
+PROCESSORS: dict[str, ProcessorSpec] = {
+    "commit": ProcessorSpec("gg_cli.gamify:CommitProcessor", frozenset({"head", "diff", "message"})),
+    "push": ProcessorSpec("gg_cli.gamify:PushProcessor", frozenset({"push_report"})),
+    "merge": ProcessorSpec("gg_cli.reflog_processors:MergeProcessor", frozenset({"reflog"})),
+    "rebase": ProcessorSpec("gg_cli.reflog_processors:RebaseProcessor", frozenset({"reflog"})),
+    "revert": ProcessorSpec("gg_cli.reflog_processors:RevertProcessor", frozenset({"reflog"})),
+    "cherry-pick": ProcessorSpec("gg_cli.reflog_processors:CherryPickProcessor", frozenset({"reflog"})),
+    "tag": ProcessorSpec("gg_cli.reflog_processors:TagProcessor", frozenset({"head"})),
+}
+
+_INSTANCES: dict[str, Processor] = {}
+
+
+def register_processor(command: str, target: str, needs: FrozenSet[str] = frozenset()) -> None:
+    """Route `command` to the processor class at `target` (`"module:Class"`)."""
+    unknown = set(needs) - METADATA_KINDS
+    if unknown:
+        raise ValueError(f"Unknown git metadata: {', '.join(sorted(unknown))}.")
+    PROCESSORS[command] = ProcessorSpec(target, frozenset(needs))
+    _INSTANCES.pop(command, None)
+
+
+def is_tracked(command: str) -> bool:
+    return command in PROCESSORS
+
+
+def get_processor(command: str) -> Processor | None:
+    """Return the processor for `command`, importing its module on first use."""
+    processor = _INSTANCES.get(command)
+    if processor is not None:
+        return processor
+    spec = PROCESSORS.get(command)
+    if spec is None:
+        return None
+    module_name, _, class_name = spec.target.partition(":")
+    processor = _INSTANCES[command] = getattr(importlib.import_module(module_name), class_name)()
+    return processor
+
+
+def recordable_commands() -> tuple[str, ...]:
+    """Commands whose processors only need metadata a remote client can send."""
+    return tuple(command for command, spec in PROCESSORS.items() if spec.needs <= RECORDABLE_METADATA)
@@ -0,0 +1,138 @@
+# src/gg_cli/profile_merge.py
+"""Order-independent merge rules for profile data from several sources."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Iterable
+
+from gg_cli import plugins
+from gg_cli.dedup import merge_ledgers
+from gg_cli.definitions_loader import load_achievements_flat
+from gg_cli.history import merge_histories
+from gg_cli.levels import get_level_from_xp
+from gg_cli.rate_windows import merge_windows
+from gg_cli.repo_stats import merge_repo_stats
+
+# Monotonic counters that add up across sources.
+SUMMED_STATS = (
+    "total_commits",
+    "total_pushes",
+    "total_pushed_commits",
+    "total_pushed_lines",
+)
+
+# ISO dates where the most recent value wins.
+LATEST_DATE_STATS = ("last_commit_date", "last_push_date")
+
+# Per-day counters tracked against `daily_xp_date`.
+DAILY_STATS = ("daily_commit_count",)
+
+
+def merge_unlocks(*unlock_maps: dict[str, str]) -> dict[str, str]:
+    """Union achievement unlocks, keeping the earliest unlock date per achievement."""
+    merged: dict[str, str] = {}
+    for unlocks in unlock_maps:
+        for ach_id, unlocked_on in unlocks.items():
+            current = merged.get(ach_id)
+            if current is None or unlocked_on < current:
+                merged[ach_id] = unlocked_on
+    return merged
+
+
+def duplicate_unlock_xp(*unlock_maps: dict[str, str]) -> int:
+    """
+    XP granted more than once for the same achievement across sources.
+
+    Each source earned the achievement's reward when it unlocked it, but the
+    merged profile keeps a single unlock, so every extra unlock is refunded.
+    Unknown achievements (e.g. from an uninstalled plugin) refund nothing.
+    """
+    definitions = {**load_achievements_flat(), **plugins.achievement_definitions()}
+    refund = 0
+    for ach_id in set().union(*unlock_maps):
+        extra = sum(ach_id in unlocks for unlocks in unlock_maps) - 1
+        if extra > 0 and ach_id in definitions:
+            refund += extra * int(definitions[ach_id].get("xp_reward", 0))
+    return refund
+
+
+def latest_dates(stats_list: Iterable[dict[str, Any]]) -> dict[str, str]:
+    """Return the most recent value of each `LATEST_DATE_STATS` field."""
+    result = {key: "1970-01-01" for key in LATEST_DATE_STATS}
+    for stats in stats_list:
+        for key in LATEST_DATE_STATS:
+            value = stats.get(key, "1970-01-01")
+            if value > result[key]:
+                result[key] = value
+    return result
+
+
+def merged_streak(stats_list: Iterable[dict[str, Any]]) -> int:
+    """
+    Combine streaks from sources that may share calendar days.
+
+    Sources active on the same latest day describe overlapping runs, so the
+    longest one is kept; runs that ended earlier cannot extend today's streak.
+    """
+    stats_list = list(stats_list)
+    latest = max((stats.get("last_commit_date", "1970-01-01") for stats in stats_list), default="1970-01-01")
+    return max(
+        (
+            int(stats.get("consecutive_commit_days", 0))
+            for stats in stats_list
+            if stats.get("last_commit_date", "1970-01-01") == latest
+        ),
+        default=0,
+    )
+
+
+def merged_daily_stats(stats_list: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Keep daily counters of the most recent day, adding up sources active on that day."""
+    stats_list = list(stats_list)
+    latest = max((stats.get("daily_xp_date", "1970-01-01") for stats in stats_list), default="1970-01-01")
+    result: dict[str, Any] = {"daily_xp_date": latest}
+    for key in DAILY_STATS:
+        result[key] = sum(
+            int(stats.get(key, 0))
+            for stats in stats_list
+            if stats.get("daily_xp_date", "1970-01-01") == latest
+        )
+    return result
+
+
+def merge_profiles(target: dict[str, Any], *sources: dict[str, Any]) -> dict[str, Any]:
+    """
+    Fold progress from other profiles into a copy of `target`.
+
+    Counters and XP add up (less the rewards of achievements unlocked in more
+    than one source), dates and streaks follow the rules above, and the event
+    ledgers are unioned so commits already counted under another email
+    are not rewarded again. Config and sync state stay those of `target`.
+    """
+    merged = copy.deepcopy(target)
+    profiles = [target, *sources]
+    all_stats = [profile.get("stats", {}) for profile in profiles]
+    stats = merged["stats"]
+
+    for key in SUMMED_STATS:
+        stats[key] = sum(int(item.get(key, 0)) for item in all_stats)
+    stats.update(latest_dates(all_stats))
+    stats["consecutive_commit_days"] = merged_streak(all_stats)
+    stats.update(merged_daily_stats(all_stats))
+
+    unlock_maps = [profile.get("achievements_unlocked", {}) for profile in profiles]
+    xp = sum(int(profile.get("user", {}).get("xp", 0)) for profile in profiles)
+    xp = max(0, xp - duplicate_unlock_xp(*unlock_maps))
+    merged["user"] = {"xp": xp, "level": get_level_from_xp(xp)}
+    merged["achievements_unlocked"] = merge_unlocks(*unlock_maps)
+    merged["events"] = merge_ledgers(*(profile.get("events", {}) for profile in profiles))
+    merged["repos"] = merge_repo_stats(*(profile.get("repos", {}) for profile in profiles))
+    merged["history"] = merge_histories(*(profile.get("history", {}) for profile in profiles))
+    merged["windows"] = merge_windows(*(profile.get("windows", {}) for profile in profiles))
+    # Rebalance deltas are part of the summed XP, so they add up the same way.
+    merged["rebalance"] = {
+        "rules": merged.get("rebalance", {}).get("rules"),
+        "xp_delta": sum(int(profile.get("rebalance", {}).get("xp_delta", 0)) for profile in profiles),
+    }
+    return merged
@@ -0,0 +1,215 @@
+# src/gg_cli/prompt.py
+"""
+Shell prompt segment (`gg-prompt`, `python -m gg_cli.prompt`, `gg prompt`).
+
+A prompt runs on every Enter, so this module only imports `os`, `sys` and
+`time`: it reads a small tab-separated status file refreshed by
+`save_user_data` (no `json`/`re` import) and finds the Git identity by
+reading config files instead of running git. `typing` is avoided as well,
+since importing it alone costs a few milliseconds.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+# Mirrors `gg_cli.utils.DATA_DIR`; importing utils would pull in Rich.
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".git-gamify")
+STATUS_FILENAME = "prompt-status.tsv"
+STATUS_IDENTITIES_LIMIT = 16
+
+DEFAULT_FORMAT = "Lv{level} {xp}xp {streak}d"
+FORMAT_FIELDS = ("email", "level", "xp", "xp_to_next", "progress", "streak")
+# Column order of `identity` rows in the status file.
+_ENTRY_FIELDS = ("level", "xp", "xp_to_next", "progress", "streak", "last_commit_date")
+
+
+def build_status_entry(user_data: dict) -> dict:
+    """Precompute everything a prompt segment may display for one profile."""
+    # Imported lazily: this runs on save, never on the prompt path.
+    from gg_cli.levels import get_level_info, get_total_xp_for_level
+
+    user = user_data.get("user", {})
+    stats = user_data.get("stats", {})
+    level = int(user.get("level", 1))
+    xp = int(user.get("xp", 0))
+    _, xp_per_level, _ = get_level_info(level)
+    level_base = get_total_xp_for_level(level)
+    return {
+        "level": level,
+        "xp": xp,
+        "xp_to_next": max(0, level_base + xp_per_level - xp),
+        "progress": int(100 * (xp - level_base) / xp_per_level) if xp_per_level else 0,
+        "streak": int(stats.get("consecutive_commit_days", 0)),
+        "last_commit_date": stats.get("last_commit_date", "1970-01-01"),
+    }
+
+
+def write_status(data_dir: str, user_data: dict, aliases: dict[str, str]) -> None:
+    """Refresh the status file entry of the profile that was just saved."""
+    email = user_data.get("config", {}).get("user_email")
+    if not email:
+        return
+    path = os.path.join(data_dir, STATUS_FILENAME)
+    status = read_status(path) or {}
+    identities = status.get("identities", {})
+    identities.pop(email, None)
+    identities[email] = build_status_entry(user_data)
+    # Most recently saved identities last; drop the oldest beyond the limit.
+    while len(identities) > STATUS_IDENTITIES_LIMIT:
+        identities.pop(next(iter(identities)))
+    lines = [f"last\t{email}"]
+    lines += [f"alias\t{alias}\t{canonical}" for alias, canonical in aliases.items()]
+    for identity, entry in identities.items():
+        lines.append("\t".join(["identity", identity, *(str(entry[name]) for name in _ENTRY_FIELDS)]))
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+def read_status(path: str) -> dict | None:
+    """Parse the status file into `{"identities", "aliases", "last"}`."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    status: dict = {"identities": {}, "aliases": {}, "last": None}
+    for line in lines:
+        fields = line.split("\t")
+        if fields[0] == "last" and len(fields) == 2:
+            status["last"] = fields[1]
+        elif fields[0] == "alias" and len(fields) == 3:
+            status["aliases"][fields[1]] = fields[2]
+        elif fields[0] == "identity" and len(fields) == 2 + len(_ENTRY_FIELDS):
+            entry = dict(zip(_ENTRY_FIELDS, fields[2:]))
+            try:
+                for name in _ENTRY_FIELDS[:-1]:
+                    entry[name] = int(entry[name])
+            except ValueError:
+                continue
+            status["identities"][fields[1]] = entry
+    return status
+
+
+def _config_email(path: str) -> str | None:
+    """Return the last `user.email` in one git config file (includes are not followed)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    email = None
+    in_user = False
+    for raw_line in lines:
+        line = raw_line.strip()
+        if line.startswith("["):
+            in_user = line.strip("[]").strip().lower() == "user"
+            continue
+        if in_user and "=" in line:
+            key, _, value = line.partition("=")
+            if key.strip().lower() == "email":
+                email = value.split("#", 1)[0].split(";", 1)[0].strip().strip('"') or None
+    return email
+
+
+def _repo_config_path(cwd: str) -> str | None:
+    directory = cwd
+    while True:
+        dot_git = os.path.join(directory, ".git")
+        if os.path.isdir(dot_git):
+            return os.path.join(dot_git, "config")
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git, "r", encoding="utf-8") as f:
+                    git_dir = f.read().strip()[len("gitdir:") :].strip()
+            except OSError:
+                return None
+            git_dir = os.path.join(directory, git_dir)
+            try:
+                with open(os.path.join(git_dir, "commondir"), "r", encoding="utf-8") as f:
+                    git_dir = os.path.join(git_dir, f.read().strip())
+            except OSError:
+                pass
+            return os.path.join(git_dir, "config")
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def find_git_email(cwd: str | None = None) -> str | None:
+    """Resolve `user.email` from repo, global and XDG config files, in git's precedence."""
+    home = os.path.expanduser("~")
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+    candidates = [
+        _repo_config_path(cwd or os.getcwd()),
+        os.path.join(home, ".gitconfig"),
+        os.path.join(xdg, "git", "config"),
+    ]
+    for path in candidates:
+        if path:
+            email = _config_email(path)
+            if email:
+                return email
+    return None
+
+
+def render_segment(status: dict | None, email: str | None, fmt: str = DEFAULT_FORMAT) -> str:
+    """Format the prompt segment for `email` (falling back to the last saved identity)."""
+    if not status:
+        return ""
+    identities = status.get("identities", {})
+    if email:
+        email = status.get("aliases", {}).get(email, email)
+    if email not in identities:
+        email = status.get("last")
+    entry = identities.get(email)
+    if entry is None:
+        return ""
+
+    values = dict(entry, email=email)
+    # The stored streak is as of the last save; it lapses after a missed day.
+    yesterday = time.strftime("%Y-%m-%d", time.localtime(time.time() - 86400))
+    if entry.get("last_commit_date", "1970-01-01") < yesterday:
+        values["streak"] = 0
+    try:
+        return fmt.format(**values)
+    except (KeyError, IndexError, ValueError):
+        return DEFAULT_FORMAT.format(**values)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the prompt segment; `--format/-f FMT` selects the output."""
+    args = sys.argv[1:] if argv is None else argv
+    fmt = os.environ.get("GG_PROMPT_FORMAT") or DEFAULT_FORMAT
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg in ("-f", "--format") and index + 1 < len(args):
+            fmt = args[index + 1]
+            index += 2
+            continue
+        if arg.startswith("--format="):
+            fmt = arg[len("--format=") :]
+        elif arg in ("-h", "--help"):
+            sys.stdout.write(
+                "usage: gg-prompt [--format FMT]\n"
+                f"fields: {', '.join('{' + name + '}' for name in FORMAT_FIELDS)}\n"
+            )
+            return 0
+        index += 1
+
+    status = read_status(os.path.join(DATA_DIR, STATUS_FILENAME))
+    segment = render_segment(status, find_git_email(), fmt)
+    if segment:
+        sys.stdout.write(segment + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# src/gg_cli/rate_windows.py
+"""Rolling-window anti-farming counters persisted inside the user profile."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Union
+
+# Rewards are limited over the last 24 hours rather than per calendar day, so
+# a burst around midnight cannot collect two days' worth of full rewards.
+WINDOW_SECONDS = 24 * 60 * 60
+
+WINDOW_SERIES = ("commits", "push_xp", "push_bonus", "git_ops_xp")
+
+# Commit entries are epoch seconds; XP entries are `[epoch seconds, xp]`.
+_Entry = Union[int, List[int]]
+
+
+def get_default_windows() -> dict[str, Any]:
+    """Return the empty windows stored under `user_data["windows"]`."""
+    return {name: [] for name in WINDOW_SERIES}
+
+
+def _timestamp(entry: _Entry) -> int:
+    return entry[0] if isinstance(entry, list) else entry
+
+
+class RateWindows:
+    """
+    Recent rewarded events, oldest first, for rolling-window limits.
+
+    Each series is a bounded buffer: entries that left the window are evicted
+    from the front before every read, and a series never grows past the
+    capacity its limit needs. Counting and summing therefore cost amortized
+    O(1) per event and the profile stays small at any event rate.
+    """
+
+    def __init__(self, user_data: dict[str, Any], now: float, span: int = WINDOW_SECONDS) -> None:
+        stored = user_data.setdefault("windows", get_default_windows())
+        for name in WINDOW_SERIES:
+            stored.setdefault(name, [])
+        self._stored = stored
+        self.now = int(now)
+        self.span = span
+        # Sums of XP series, kept alongside eviction so reads stay O(1).
+        self._totals: dict[str, int] = {}
+
+    def _series(self, name: str) -> list[_Entry]:
+        series = self._stored[name]
+        cutoff = self.now - self.span
+        evicted = 0
+        while evicted < len(series) and _timestamp(series[evicted]) <= cutoff:
+            evicted += 1
+        if evicted:
+            del series[:evicted]
+            self._totals.pop(name, None)
+        return series
+
+    def hit(self, name: str, capacity: int) -> int:
+        """
+        Record one event now and return how many fell inside the window, itself included.
+
+        Only the newest `capacity` timestamps are kept, so counts above
+        `capacity` are reported as `capacity + 1`; limits up to `capacity`
+        are therefore exact.
+        """
+        series = self._series(name)
+        count = len(series) + 1
+        series.append(self.now)
+        if len(series) > capacity:
+            del series[: len(series) - capacity]
+        return count
+
+    def total(self, name: str) -> int:
+        """Return the XP recorded in series `name` within the window."""
+        series = self._series(name)
+        if name not in self._totals:
+            self._totals[name] = sum(entry[1] for entry in series)
+        return self._totals[name]
+
+    def earn(self, name: str, amount: int, limit: int) -> int:
+        """Grant up to `amount` XP without exceeding `limit` inside the window; return the grant."""
+        granted = max(0, min(amount, limit - self.total(name)))
+        if granted:
+            series = self._stored[name]
+            series.append([self.now, granted])
+            self._totals[name] += granted
+            # Every entry holds at least 1 XP, so `limit` entries always suffice.
+            if len(series) > max(limit, 1):
+                del series[: len(series) - max(limit, 1)]
+                self._totals.pop(name, None)
+        return granted
+
+
+def merge_windows(*windows: dict[str, Any]) -> dict[str, Any]:
+    """Union the recent entries of several sources in time order."""
+    merged = get_default_windows()
+    for name in WINDOW_SERIES:
+        entries: Iterable[_Entry] = (
+            list(entry) if isinstance(entry, list) else entry for source in windows for entry in source.get(name, [])
+        )
+        merged[name] = sorted(entries, key=_timestamp)
+    return merged
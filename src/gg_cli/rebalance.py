@@ -0,0 +1,250 @@
+# src/gg_cli/rebalance.py
+"""
+What-if rebalancing: replay commit history under candidate XP rules.
+
+Each repository's history is read in one streaming `git log --numstat`
+pass, in parallel across repositories. Commits are grouped per (alias-
+resolved) author and replayed through `process_event` twice, once with
+the engine's rules and once with the candidate rules, without rendering.
+A repository's own XP rule overrides win over both rule sets, as they do
+in the live engine. The difference is the XP delta applied to the stored profile, so XP from
+pushes or anything else missing from history is left untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from gg_cli.core import UserRepository, get_default_user_data
+from gg_cli.diff_analysis import get_default_classifier
+from gg_cli.gamify import DEFAULT_XP_RULES, GamifyEvent, process_event
+from gg_cli.git_service import DIFF_MAX_FILES, DiffStat, GitService, RecordedGitService
+from gg_cli.levels import get_level_from_xp
+from gg_cli.render import SilentRenderer
+from gg_cli.repo_rules import RepoRulesError, load_repo_overrides
+from gg_cli.repo_stats import find_repo_id, find_worktree_root
+from gg_cli.translator import get_translator
+
+# Refs whose commits count; `--all` would also walk refs/gamify/* sync commits.
+HISTORY_REFS = ("--branches", "--tags", "--remotes")
+
+
+class RebalanceError(RuntimeError):
+    """Raised when a repository's history cannot be read."""
+
+
+@dataclass
+class HistoryCommit:
+    """One commit as the XP engine would have seen it."""
+
+    day: int
+    timestamp: int
+    sha: str
+    repo_id: str | None
+    message: str
+    diff: DiffStat
+    # The repository's `.gamify.toml`/`.gamify.json` overrides, shared by its commits.
+    xp_overrides: dict[str, int] = field(default_factory=dict)
+
+
+def _parse_header(record: str) -> tuple[str, str, str, str, str]:
+    sha, email, day, timestamp, subject = (record[1:].split("\x1f", 4) + ["", "", "", ""])[:5]
+    return sha, email.strip().lower(), day, timestamp, subject
+
+
+def read_repo_history(
+    repo_path: str,
+    aliases: dict[str, str] | None = None,
+    emails: Iterable[str] | None = None,
+    max_files: int = DIFF_MAX_FILES,
+) -> dict[str, list[HistoryCommit]]:
+    """
+    Stream non-merge commits of one repository, grouped by canonical author email.
+
+    Commits are dated by their committer day, when the engine would have
+    scored them. Only commits of `emails` (when given) are kept and each diff
+    is measured within the live engine's `max_files` budget, so memory grows
+    with the kept commits rather than with the size of the log. The current
+    override file of the repository applies to all of its commits; an
+    unreadable one is an error rather than silently replayed without.
+    """
+    aliases = {alias.lower(): canonical for alias, canonical in (aliases or {}).items()}
+    wanted = {email.lower() for email in emails} if emails is not None else None
+    repo_id = find_repo_id(Path(repo_path))
+    root = find_worktree_root(Path(repo_path))
+    try:
+        xp_overrides = load_repo_overrides(root) if root is not None else {}
+    except RepoRulesError as exc:
+        raise RebalanceError(f"Cannot read XP rules of '{repo_path}': {exc}") from exc
+    classifier = get_default_classifier()
+    process = subprocess.Popen(
+        [
+            "git", "-C", repo_path, "log", "--reverse", "--no-merges", "--no-renames", "--numstat", "-z",
+            "--date=short", "--format=%x1e%H%x1f%ae%x1f%cd%x1f%ct%x1f%s", *HISTORY_REFS, "--",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    commits: dict[str, list[HistoryCommit]] = {}
+    current: HistoryCommit | None = None
+    assert process.stdout is not None
+    pending = ""
+    for chunk in iter(lambda: process.stdout.read(65536), ""):
+        records = (pending + chunk).split("\0")
+        pending = records.pop()
+        for record in records:
+            record = record.lstrip("\n")
+            if record.startswith("\x1e"):
+                sha, email, day, timestamp, subject = _parse_header(record)
+                email = aliases.get(email, email)
+                current = None
+                if wanted is None or email in wanted:
+                    current = HistoryCommit(
+                        day=date.fromisoformat(day).toordinal(),
+                        timestamp=int(timestamp),
+                        sha=sha,
+                        repo_id=repo_id,
+                        message=subject,
+                        diff=DiffStat(),
+                        xp_overrides=xp_overrides,
+                    )
+                    commits.setdefault(email, []).append(current)
+            elif record and current is not None and not current.diff.truncated:
+                if GitService._add_numstat_record(current.diff, record, classifier) >= max_files:
+                    current.diff.truncated = True
+    stderr = process.stderr.read() if process.stderr else ""
+    if process.wait() != 0:
+        raise RebalanceError(f"Cannot read history of '{repo_path}': {stderr.strip() or 'git log failed'}")
+    # Topological order can step back in time after rebases; the engine cannot.
+    for email_commits in commits.values():
+        email_commits.sort(key=lambda commit: (commit.day, commit.timestamp))
+    return commits
+
+
+def _read_repo_history_job(job: tuple[str, dict[str, str], list[str] | None]) -> dict[str, list[HistoryCommit]]:
+    repo_path, aliases, emails = job
+    return read_repo_history(repo_path, aliases, emails)
+
+
+def collect_history(
+    repo_paths: list[str],
+    aliases: dict[str, str] | None = None,
+    emails: Iterable[str] | None = None,
+    workers: int | None = 1,
+) -> dict[str, list[HistoryCommit]]:
+    """Read several repositories (in parallel) and merge each identity's commits by day."""
+    jobs = [(path, dict(aliases or {}), list(emails) if emails is not None else None) for path in repo_paths]
+    workers = min(workers or os.cpu_count() or 1, max(1, len(jobs)))
+    if workers == 1:
+        per_repo = [_read_repo_history_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            per_repo = list(executor.map(_read_repo_history_job, jobs))
+
+    merged: dict[str, list[HistoryCommit]] = {}
+    for email in {email for history in per_repo for email in history}:
+        streams = [history[email] for history in per_repo if email in history]
+        merged[email] = list(heapq.merge(*streams, key=lambda commit: (commit.day, commit.timestamp)))
+    return merged
+
+
+def replay_xp(email: str, commits: Iterable[HistoryCommit], xp_rules: dict[str, int]) -> int:
+    """Total XP (rules plus achievements) a fresh profile earns from `commits` under `xp_rules` and repo overrides."""
+    user_data = get_default_user_data(email)
+    translator = get_translator("en")
+    renderer = SilentRenderer()
+    for commit in commits:
+        event = GamifyEvent(
+            command="commit",
+            args=["commit"],
+            today=date.fromordinal(commit.day),
+            context={},
+            repo_id=commit.repo_id,
+            timestamp=float(commit.timestamp),
+        )
+        git = RecordedGitService(sha=commit.sha, diff=commit.diff, message=commit.message)
+        rules = {**xp_rules, **commit.xp_overrides} if commit.xp_overrides else xp_rules
+        process_event(user_data, event, translator, git_service=git, xp_rules=rules, renderer=renderer)
+    return int(user_data["user"]["xp"])
+
+
+def rules_fingerprint(xp_rules: dict[str, int]) -> str:
+    return hashlib.sha256(json.dumps(xp_rules, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass
+class RebalanceEntry:
+    email: str
+    commits: int
+    baseline_xp: int
+    candidate_xp: int
+    current_xp: int
+    previous_delta: int
+
+    @property
+    def delta(self) -> int:
+        return self.candidate_xp - self.baseline_xp
+
+    @property
+    def new_xp(self) -> int:
+        # A delta applied by an earlier rebalance is replaced, not stacked.
+        return max(0, self.current_xp - self.previous_delta + self.delta)
+
+    @property
+    def current_level(self) -> int:
+        return get_level_from_xp(self.current_xp)
+
+    @property
+    def new_level(self) -> int:
+        return get_level_from_xp(self.new_xp)
+
+
+def plan_rebalance(
+    repository: UserRepository,
+    history: dict[str, list[HistoryCommit]],
+    xp_rules: dict[str, int],
+    baseline_rules: dict[str, int] | None = None,
+) -> Iterator[tuple[RebalanceEntry, dict[str, Any]]]:
+    """Yield the rebalance entry and stored profile of every identity with history and a profile."""
+    baseline_rules = baseline_rules or DEFAULT_XP_RULES
+    for email in sorted(history):
+        profile = repository.find(email)
+        if profile is None:
+            continue
+        commits = history[email]
+        yield (
+            RebalanceEntry(
+                email=email,
+                commits=len(commits),
+                baseline_xp=replay_xp(email, commits, baseline_rules),
+                candidate_xp=replay_xp(email, commits, xp_rules),
+                current_xp=int(profile["user"].get("xp", 0)),
+                previous_delta=int(profile.get("rebalance", {}).get("xp_delta", 0)),
+            ),
+            profile,
+        )
+
+
+def apply_rebalance(
+    repository: UserRepository, planned: Iterable[tuple[RebalanceEntry, dict[str, Any]]], xp_rules: dict[str, int]
+) -> int:
+    """Write new XP/levels and the applied delta; return how many profiles were saved."""
+    fingerprint = rules_fingerprint(xp_rules)
+    profiles = []
+    for entry, profile in planned:
+        profile["user"] = {"xp": entry.new_xp, "level": entry.new_level}
+        profile["rebalance"] = {"rules": fingerprint, "xp_delta": entry.delta}
+        profiles.append(profile)
+    return repository.save_many(profiles)
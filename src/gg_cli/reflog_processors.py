@@ -0,0 +1,132 @@
+# src/gg_cli/reflog_processors.py
+"""
+Processors for history-editing commands: merge, rebase, revert, cherry-pick and tag.
+
+A successful exit code does not say whether these commands did anything
+(`git merge` of an up-to-date branch, `git tag` listing tags), so they read
+what git recorded instead: the newest HEAD reflog entry, or the created tag.
+XP from all of them shares one rolling 24-hour cap.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from gg_cli.git_service import ReflogEntry
+from gg_cli.processors import Processor
+from gg_cli.rate_windows import RateWindows
+
+if TYPE_CHECKING:
+    from gg_cli.gamify import GamifyEvent
+    from gg_cli.git_service import GitService
+
+# A reflog entry older than this was written by an earlier command.
+REFLOG_FRESHNESS_SECONDS = 120
+
+# `git tag` options whose value is the next argument.
+_TAG_VALUE_OPTIONS = {"-m", "-F", "-u", "--message", "--file", "--local-user", "--cleanup"}
+# Deleting, verifying, and every filter or formatting option put `git tag` in list mode.
+_TAG_NON_CREATING_OPTIONS = {
+    "-l", "--list", "-d", "--delete", "-v", "--verify", "-n", "-i", "--ignore-case",
+    "--contains", "--no-contains", "--merged", "--no-merged", "--points-at",
+    "--sort", "--format", "--column", "--no-column", "--color", "--omit-empty",
+}
+
+
+def _earn(user_data: dict[str, Any], event: GamifyEvent, xp: int, xp_rules: dict[str, int]) -> int:
+    return RateWindows(user_data, event.timestamp).earn("git_ops_xp", xp, xp_rules["git_ops_daily_xp_cap"])
+
+
+class ReflogProcessor(Processor):
+    """Rewards a command whose fresh HEAD reflog entry starts with `subject_prefix`."""
+
+    subject_prefix = ""
+    xp_rule = ""
+
+    def matches(self, entry: ReflogEntry) -> bool:
+        return entry.subject.startswith(self.subject_prefix)
+
+    def accepts(self, event: GamifyEvent, git: GitService) -> bool:
+        if "reflog_sha" in event.context:
+            return True
+        try:
+            entry = git.get_last_reflog_entry()
+        except Exception:
+            return False
+        # Aborted or no-op runs (already up to date) leave an older entry behind.
+        if entry is None or entry.timestamp < event.timestamp - REFLOG_FRESHNESS_SECONDS:
+            return False
+        if not self.matches(entry):
+            return False
+        event.context["reflog_sha"] = entry.sha
+        return True
+
+    def event_keys(self, event: GamifyEvent, git: GitService) -> tuple[list[str], list[str]] | None:
+        return [f"{event.command}:{event.context['reflog_sha']}"], []
+
+    def process(
+        self, user_data: dict[str, Any], event: GamifyEvent, git: GitService, xp_rules: dict[str, int]
+    ) -> int:
+        return _earn(user_data, event, xp_rules[self.xp_rule], xp_rules)
+
+
+class MergeProcessor(ReflogProcessor):
+    # "merge topic: Merge made by the 'ort' strategy." or "merge topic: Fast-forward".
+    subject_prefix = "merge "
+    xp_rule = "merge_xp"
+
+
+class RebaseProcessor(ReflogProcessor):
+    # "rebase (finish): returning to refs/heads/topic"; older git wrote "rebase finished: ...".
+    subject_prefix = "rebase"
+    xp_rule = "rebase_xp"
+
+    def matches(self, entry: ReflogEntry) -> bool:
+        return entry.subject.startswith(("rebase (finish)", "rebase finished", "rebase -i (finish)"))
+
+
+class RevertProcessor(ReflogProcessor):
+    subject_prefix = "revert: "
+    xp_rule = "revert_xp"
+
+
+class CherryPickProcessor(ReflogProcessor):
+    subject_prefix = "cherry-pick: "
+    xp_rule = "cherry_pick_xp"
+
+
+def created_tag_name(args: list[str]) -> str | None:
+    """Return the tag a `git tag ...` invocation creates, or None for listing/deleting."""
+    name = None
+    skip_value = False
+    for arg in args[1:]:
+        if skip_value:
+            skip_value = False
+            continue
+        option = arg.split("=", 1)[0]
+        if option in _TAG_NON_CREATING_OPTIONS or (arg.startswith("-n") and arg[2:].isdigit()):
+            return None
+        if arg in _TAG_VALUE_OPTIONS:
+            skip_value = True
+            continue
+        if arg == "--":
+            continue
+        if not arg.startswith("-") and name is None:
+            name = arg
+    return name
+
+
+class TagProcessor(Processor):
+    """Tags are keyed by name and target, so re-creating the same tag earns nothing."""
+
+    def accepts(self, event: GamifyEvent, git: GitService) -> bool:
+        return created_tag_name(event.args) is not None
+
+    def event_keys(self, event: GamifyEvent, git: GitService) -> tuple[list[str], list[str]] | None:
+        name = created_tag_name(event.args)
+        return [f"tag:{name}:{git.rev_parse(f'refs/tags/{name}')[0]}"], []
+
+    def process(
+        self, user_data: dict[str, Any], event: GamifyEvent, git: GitService, xp_rules: dict[str, int]
+    ) -> int:
+        return _earn(user_data, event, xp_rules["tag_xp"], xp_rules)
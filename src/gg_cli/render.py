@@ -0,0 +1,121 @@
+# src/gg_cli/render.py
+"""Pluggable output renderers for gamify feedback (Rich, plain text, silent)."""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from abc import ABC, abstractmethod
+from typing import Any
+
+OUTPUT_MODES = ("auto", "rich", "plain", "silent")
+OUTPUT_ENV_VAR = "GG_OUTPUT"
+
+# Rich markup tags such as `[bold cyan]` / `[/]`; escaped `\[` is left alone.
+_MARKUP_TAG = re.compile(r"(?<!\\)\[/?[a-zA-Z#@][^\[\]]*\]|(?<!\\)\[/\]")
+
+
+def strip_markup(text: str) -> str:
+    """Remove Rich markup tags so messages read cleanly as plain text."""
+    return _MARKUP_TAG.sub("", text).replace("\\[", "[")
+
+
+class Renderer(ABC):
+    """
+    Collects one event's messages and writes them in a single flush.
+
+    `line` and `panel` take Rich markup; each renderer decides how (or
+    whether) to display it.
+    """
+
+    def __init__(self) -> None:
+        self._items: list[tuple[str, str, str | None, str | None]] = []
+
+    def line(self, text: str, style: str | None = None) -> None:
+        self._items.append(("line", text, style, None))
+
+    def panel(self, body: str, title: str | None = None, border_style: str | None = None) -> None:
+        self._items.append(("panel", body, title, border_style))
+
+    def flush(self) -> None:
+        """Write buffered output at once and clear the buffer."""
+        items, self._items = self._items, []
+        if items:
+            self._write(items)
+
+    @abstractmethod
+    def _write(self, items: list[tuple[str, str, str | None, str | None]]) -> None:
+        """Display `(kind, text, style or title, border_style)` items buffered since the last flush."""
+
+
+class RichRenderer(Renderer):
+    """Styled output with panels through the shared Rich console."""
+
+    def _write(self, items: list[tuple[str, str, str | None, str | None]]) -> None:
+        # Imported here so the plain and silent paths never load Rich.
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+
+        from gg_cli import utils
+
+        renderables: list[Any] = []
+        for kind, text, extra, border_style in items:
+            if kind == "panel":
+                renderables.append(Panel(text, title=extra, border_style=border_style or "none", expand=False))
+            else:
+                renderables.append(Text.from_markup(text, style=extra or ""))
+        utils.console.print(Group(*renderables))
+
+
+class PlainRenderer(Renderer):
+    """Markup-free text suitable for CI logs and dumb terminals."""
+
+    def _write(self, items: list[tuple[str, str, str | None, str | None]]) -> None:
+        lines: list[str] = []
+        for kind, text, extra, _ in items:
+            if kind == "panel":
+                if extra:
+                    lines.append(f"== {strip_markup(extra)} ==")
+                lines.extend(f"  {line}" if line else "" for line in strip_markup(text).splitlines())
+            else:
+                lines.append(strip_markup(text))
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+class SilentRenderer(Renderer):
+    """Discards everything (servers, batch replays)."""
+
+    def line(self, text: str, style: str | None = None) -> None:
+        pass
+
+    def panel(self, body: str, title: str | None = None, border_style: str | None = None) -> None:
+        pass
+
+    def _write(self, items: list[tuple[str, str, str | None, str | None]]) -> None:
+        pass
+
+
+def resolve_output_mode(configured: str | None = None) -> str:
+    """
+    Pick `rich`, `plain` or `silent`.
+
+    `GG_OUTPUT` wins over the profile's `config.output`; `auto` uses Rich only
+    on an interactive terminal outside CI.
+    """
+    mode = (os.environ.get(OUTPUT_ENV_VAR) or configured or "auto").lower()
+    if mode in ("rich", "plain", "silent"):
+        return mode
+    interactive = sys.stdout.isatty() and os.environ.get("TERM") != "dumb"
+    return "rich" if interactive and not os.environ.get("CI") else "plain"
+
+
+def get_renderer(configured: str | None = None) -> Renderer:
+    mode = resolve_output_mode(configured)
+    if mode == "silent":
+        return SilentRenderer()
+    if mode == "plain":
+        return PlainRenderer()
+    return RichRenderer()
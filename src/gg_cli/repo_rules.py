@@ -0,0 +1,112 @@
+# src/gg_cli/repo_rules.py
+"""Per-repository XP rule overrides read from `.gamify.toml` or `.gamify.json`."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Tuple
+
+from gg_cli.definitions_loader import check_xp_rules, load_xp_rules
+from gg_cli.repo_stats import find_worktree_root
+
+# Looked up at the worktree root; the first existing file wins.
+OVERRIDE_FILENAMES = (".gamify.toml", ".gamify.json")
+
+
+class RepoRulesError(ValueError):
+    """Raised when a repository's override file cannot be used."""
+
+
+# (filename, mtime_ns, size) of the override file in use, or None without one.
+_Stamp = Tuple[str, int, int]
+
+_OVERRIDES: dict[str, tuple[_Stamp | None, dict[str, int] | None, RepoRulesError | None]] = {}
+_OVERRIDES_LOCK = threading.Lock()
+
+
+def _stamp(root: Path) -> _Stamp | None:
+    for name in OVERRIDE_FILENAMES:
+        try:
+            stat = os.stat(root / name)
+        except OSError:
+            continue
+        return name, stat.st_mtime_ns, stat.st_size
+    return None
+
+
+def _read_override_file(path: Path) -> dict[str, Any]:
+    if path.suffix == ".toml":
+        # Only repositories that ship a TOML override pay for the parser import.
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, "r", encoding="utf-8-sig") as f:
+        raw = json.load(f)
+    if not isinstance(raw, dict):
+        raise ValueError("expected a JSON object")
+    return raw
+
+
+def parse_override_file(path: Path) -> dict[str, int]:
+    """Return the validated `xp_rules` overrides of one override file."""
+    try:
+        raw = _read_override_file(path)
+    except (OSError, ValueError) as exc:
+        # tomllib.TOMLDecodeError and json.JSONDecodeError are ValueErrors.
+        raise RepoRulesError(f"Cannot read {path.name}: {exc}") from exc
+    unknown = sorted(set(raw) - {"xp_rules"})
+    if unknown:
+        raise RepoRulesError(f"{path.name}: unknown keys {', '.join(unknown)}.")
+    overrides = raw.get("xp_rules", {})
+    errors = check_xp_rules(overrides, partial=True)
+    if errors:
+        raise RepoRulesError(f"{path.name}: " + " ".join(errors))
+    return dict(overrides)
+
+
+def load_repo_overrides(root: Path) -> dict[str, int]:
+    """
+    Return the XP rule overrides of the worktree at `root` (empty without a file).
+
+    Results (and errors) are memoized per root and reused while the override
+    file's name, mtime and size are unchanged, so repeated lookups in a
+    long-running process cost one `stat` per candidate file.
+    """
+    key = str(root)
+    stamp = _stamp(root)
+    cached = _OVERRIDES.get(key)
+    if cached is None or cached[0] != stamp:
+        overrides: dict[str, int] | None = {}
+        error: RepoRulesError | None = None
+        if stamp is not None:
+            try:
+                overrides = parse_override_file(root / stamp[0])
+            except RepoRulesError as exc:
+                overrides, error = None, exc
+        cached = (stamp, overrides, error)
+        with _OVERRIDES_LOCK:
+            _OVERRIDES[key] = cached
+    if cached[2] is not None:
+        raise cached[2]
+    return cached[1] or {}
+
+
+def resolve_xp_rules(start: Path | None = None) -> dict[str, int]:
+    """Return the built-in XP rules merged with overrides of the repository at `start` (default: cwd)."""
+    rules = load_xp_rules()
+    root = find_worktree_root(start)
+    if root is None:
+        return rules
+    overrides = load_repo_overrides(root)
+    return {**rules, **overrides} if overrides else rules
+
+
+def clear_repo_rules_cache() -> None:
+    with _OVERRIDES_LOCK:
+        _OVERRIDES.clear()
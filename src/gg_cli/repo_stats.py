@@ -0,0 +1,175 @@
+# src/gg_cli/repo_stats.py
+"""Per-repository activity counters kept in a bounded profile section."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+# Repositories tracked individually; the rest are folded into one bucket so the
+# profile stays small for people who touch hundreds of repositories.
+REPO_STATS_LIMIT = 25
+OTHER_REPOS_KEY = "(other)"
+
+
+def get_default_repo_entry() -> dict[str, Any]:
+    return {"commits": 0, "pushes": 0, "xp": 0, "last_active": "1970-01-01"}
+
+
+def _strip_git_suffix(path: str) -> str:
+    return path[: -len(".git")] if path.endswith(".git") else path
+
+
+def normalize_remote_url(url: str) -> str:
+    """
+    Reduce equivalent remote URLs to one key.
+
+    `git@github.com:Org/Repo.git`, `https://user@github.com/Org/Repo` and
+    `ssh://git@github.com:22/Org/Repo.git/` all become `github.com/Org/Repo`.
+    """
+    url = url.strip()
+    if "://" in url:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        path = parts.path
+    elif ":" in url and "/" not in url.split(":", 1)[0] and len(url.split(":", 1)[0]) > 1:
+        # scp-like syntax `[user@]host:path` (a colon before any slash, not a drive letter).
+        host_part, path = url.split(":", 1)
+        host = host_part.rsplit("@", 1)[-1].lower()
+    else:
+        # Local path remote.
+        return "path:" + _strip_git_suffix(url.rstrip("/"))
+    path = _strip_git_suffix(path.strip("/"))
+    return f"{host}/{path}" if host else path
+
+
+def _find_git_dir(start: Path) -> tuple[Path, Path] | None:
+    """Return `(worktree_root, common_git_dir)` for `start`, reading files only."""
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return candidate, dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = (candidate / content[len("gitdir:") :].strip()).resolve()
+            # Linked worktrees keep the shared config in the common directory.
+            commondir = git_dir / "commondir"
+            if commondir.is_file():
+                try:
+                    git_dir = (git_dir / commondir.read_text(encoding="utf-8").strip()).resolve()
+                except OSError:
+                    pass
+            return candidate, git_dir
+    return None
+
+
+def _read_remote_urls(config_path: Path) -> dict[str, str]:
+    """Collect `remote.<name>.url` values from a git config file."""
+    urls: dict[str, str] = {}
+    try:
+        lines = config_path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return urls
+    remote = None
+    for raw_line in lines:
+        line = raw_line.strip()
+        if line.startswith("["):
+            header = line.strip("[]").strip()
+            name, _, subsection = header.partition(" ")
+            remote = subsection.strip().strip('"') if name.lower() == "remote" else None
+            continue
+        if remote is None or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        if key.strip().lower() == "url":
+            urls.setdefault(remote, value.strip().strip('"'))
+    return urls
+
+
+def find_worktree_root(start: Path | None = None) -> Path | None:
+    """Return the root of the worktree containing `start` (default: cwd), reading files only."""
+    try:
+        start = (start or Path.cwd()).resolve()
+    except OSError:
+        return None
+    found = _find_git_dir(start)
+    return found[0] if found is not None else None
+
+
+def find_repo_id(start: Path | None = None) -> str | None:
+    """
+    Return a stable ID for the repository containing `start` (default: cwd).
+
+    Uses the normalized `origin` URL (or the first remote) so clones on other
+    machines share the ID; repositories without remotes fall back to their
+    root path. Only `.git` files are read, no git process is spawned.
+    """
+    try:
+        start = (start or Path.cwd()).resolve()
+    except OSError:
+        return None
+    found = _find_git_dir(start)
+    if found is None:
+        return None
+    root, git_dir = found
+    urls = _read_remote_urls(git_dir / "config")
+    url = urls.get("origin") or next(iter(urls.values()), None)
+    if url:
+        return normalize_remote_url(url)
+    return "path:" + str(root)
+
+
+def _fold_into(target: dict[str, Any], entry: dict[str, Any]) -> None:
+    for key in ("commits", "pushes", "xp"):
+        target[key] = int(target.get(key, 0)) + int(entry.get(key, 0))
+    target["last_active"] = max(
+        target.get("last_active", "1970-01-01"), entry.get("last_active", "1970-01-01")
+    )
+
+
+def _enforce_limit(repos: dict[str, dict[str, Any]], keep: str | None = None) -> None:
+    """Move the least valuable repositories into the `(other)` bucket."""
+    named = [key for key in repos if key != OTHER_REPOS_KEY]
+    excess = len(named) - REPO_STATS_LIMIT
+    if excess <= 0:
+        return
+    candidates = sorted(
+        (key for key in named if key != keep),
+        key=lambda key: (repos[key].get("xp", 0), repos[key].get("last_active", "")),
+    )
+    other = repos.setdefault(OTHER_REPOS_KEY, get_default_repo_entry())
+    for key in candidates[:excess]:
+        _fold_into(other, repos.pop(key))
+
+
+def record_repo_activity(
+    user_data: dict[str, Any], repo_id: str, command: str, xp: int, today_iso: str
+) -> None:
+    """Count one commit/push event and its XP towards `repo_id`."""
+    repos = user_data.setdefault("repos", {})
+    entry = repos.get(repo_id)
+    if entry is None:
+        entry = repos[repo_id] = get_default_repo_entry()
+    if command == "commit":
+        entry["commits"] += 1
+    elif command == "push":
+        entry["pushes"] += 1
+    entry["xp"] += xp
+    entry["last_active"] = today_iso
+    _enforce_limit(repos, keep=repo_id)
+
+
+def merge_repo_stats(*repo_maps: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Combine repo sections from several profiles, then re-apply the size bound."""
+    merged: dict[str, dict[str, Any]] = {}
+    for repos in repo_maps:
+        for key, entry in repos.items():
+            _fold_into(merged.setdefault(key, get_default_repo_entry()), entry)
+    _enforce_limit(merged)
+    return merged
@@ -0,0 +1,168 @@
+# src/gg_cli/report.py
+"""
+Machine-readable profile, stats and achievement reports (`--json`).
+
+This module must not import Rich or Typer: `gg_cli.entry` routes
+`gg profile --json` and `gg achievements --json` here directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any, Iterable
+
+from gg_cli.core import UserRepository, get_current_git_email, get_user_repository
+from gg_cli.definitions_loader import load_achievements_flat
+from gg_cli.levels import get_level_info, get_total_xp_for_level
+from gg_cli.plugins import achievement_definitions
+from gg_cli.translator import Translator, get_translator
+
+# Bump when a field is removed or changes meaning; adding fields is compatible.
+SCHEMA_VERSION = 1
+REPORT_COMMANDS = ("profile", "achievements")
+
+
+def _translator_for(user_data: dict[str, Any]) -> Translator:
+    return get_translator(user_data.get("config", {}).get("language", "en"))
+
+
+def profile_report(user_data: dict[str, Any], translator: Translator) -> dict[str, Any]:
+    """Level, XP progress, stats and unlocks of one profile."""
+    user = user_data.get("user", {})
+    level = int(user.get("level", 1))
+    xp = int(user.get("xp", 0))
+    _, xp_per_level, title_key = get_level_info(level)
+    level_base = get_total_xp_for_level(level)
+    current = xp - level_base
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "email": user_data.get("config", {}).get("user_email"),
+        "level": level,
+        "title": translator.t(title_key),
+        "xp": xp,
+        "progress": {
+            "current": current,
+            "total": xp_per_level,
+            "percent": round(100 * current / xp_per_level, 1) if xp_per_level else 0.0,
+            "xp_to_next_level": max(0, level_base + xp_per_level - xp),
+        },
+        "stats": dict(user_data.get("stats", {})),
+        "achievements": _unlocked(user_data, translator),
+    }
+
+
+def stats_report(user_data: dict[str, Any]) -> dict[str, Any]:
+    """Raw counters of one profile."""
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "email": user_data.get("config", {}).get("user_email"),
+        "stats": dict(user_data.get("stats", {})),
+    }
+
+
+def _definitions(user_data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    language = user_data.get("config", {}).get("language", "en")
+    return {**achievement_definitions(language), **load_achievements_flat()}
+
+
+def _unlocked(user_data: dict[str, Any], translator: Translator) -> list[dict[str, Any]]:
+    definitions = _definitions(user_data)
+    unlocks = user_data.get("achievements_unlocked", {})
+    return [
+        _achievement_entry(ach_id, definitions.get(ach_id, {}), translator, unlocked_on)
+        for ach_id, unlocked_on in sorted(unlocks.items(), key=lambda item: (item[1], item[0]))
+    ]
+
+
+def _achievement_entry(
+    ach_id: str, definition: dict[str, Any], translator: Translator, unlocked_on: str | None
+) -> dict[str, Any]:
+    return {
+        "id": ach_id,
+        "name": translator.t(definition.get("name_key", ach_id)),
+        "description": translator.t(definition.get("desc_key", ach_id)),
+        "rarity": definition.get("rarity"),
+        "xp_reward": definition.get("xp_reward", 0),
+        "unlocked": unlocked_on is not None,
+        "unlocked_on": unlocked_on,
+    }
+
+
+def achievements_report(
+    user_data: dict[str, Any], translator: Translator, include_locked: bool = False
+) -> dict[str, Any]:
+    """Unlocked achievements with dates, optionally followed by locked ones."""
+    achievements = _unlocked(user_data, translator)
+    if include_locked:
+        unlocks = user_data.get("achievements_unlocked", {})
+        achievements.extend(
+            _achievement_entry(ach_id, definition, translator, None)
+            for ach_id, definition in _definitions(user_data).items()
+            if ach_id not in unlocks
+        )
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "email": user_data.get("config", {}).get("user_email"),
+        "achievements": achievements,
+    }
+
+
+def run(
+    command: str,
+    emails: Iterable[str] | None = None,
+    stats: bool = False,
+    include_locked: bool = False,
+    repository: UserRepository | None = None,
+) -> tuple[Any, int]:
+    """
+    Build the report payload and exit code for `command`.
+
+    Without `emails` the current Git identity is reported as one object;
+    with `emails` the result is a list in the given order, where unknown
+    identities appear as `{"email": ..., "error": "profile not found"}`.
+    """
+    repository = repository or get_user_repository()
+    requested = list(emails or [])
+    single = not requested
+    if single:
+        email = get_current_git_email()
+        if email is None:
+            return {"error": "Cannot find Git user email."}, 1
+        requested = [email]
+
+    reports: list[dict[str, Any]] = []
+    for email in requested:
+        user_data = repository.find(email)
+        if user_data is None:
+            reports.append({"schema_version": SCHEMA_VERSION, "email": email, "error": "profile not found"})
+        elif command == "achievements":
+            reports.append(achievements_report(user_data, _translator_for(user_data), include_locked))
+        elif stats:
+            reports.append(stats_report(user_data))
+        else:
+            reports.append(profile_report(user_data, _translator_for(user_data)))
+
+    found = sum("error" not in report for report in reports)
+    return (reports[0] if single else reports), (0 if found else 1)
+
+
+def write_json(payload: Any) -> None:
+    sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+    sys.stdout.flush()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for `gg profile|achievements --json ...` without Typer/Rich."""
+    parser = argparse.ArgumentParser(prog="gg", add_help=False)
+    parser.add_argument("command", choices=REPORT_COMMANDS)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--stats", "-s", action="store_true")
+    parser.add_argument("--all", dest="include_locked", action="store_true")
+    parser.add_argument("--email", "-e", action="append", dest="emails")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    payload, code = run(args.command, args.emails, stats=args.stats, include_locked=args.include_locked)
+    write_json(payload)
+    return code
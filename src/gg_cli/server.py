@@ -0,0 +1,340 @@
+# src/gg_cli/server.py
+"""Minimal asyncio HTTP server for team event ingestion and leaderboards (`gg serve`)."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import heapq
+import json
+from datetime import date
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from gg_cli.core import UserRepository
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.git_service import DiffStat, PushSummary, RecordedGitService
+from gg_cli.leaderboard import summarize_profile
+from gg_cli.processors import recordable_commands
+from gg_cli.render import SilentRenderer
+from gg_cli.translator import get_translator
+from gg_cli.utils import console
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+DEFAULT_SNAPSHOT_INTERVAL = 30.0
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+class EventPayloadError(ValueError):
+    """Raised when an ingested event payload is malformed."""
+
+
+def _count(section: dict[str, Any], key: str, name: str) -> int:
+    value = section.get(key, 0)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise EventPayloadError(f"Event '{name}.{key}' must be a non-negative integer.")
+    return value
+
+
+def _section(payload: dict[str, Any], name: str) -> dict[str, Any] | None:
+    section = payload.get(name)
+    if section is not None and not isinstance(section, dict):
+        raise EventPayloadError(f"Event '{name}' must be a JSON object.")
+    return section
+
+
+def git_service_from_payload(payload: dict[str, Any]) -> RecordedGitService:
+    """Validate client-collected event metadata and build a recorded git service from it."""
+    for key in ("sha", "previous_sha"):
+        if payload.get(key) is not None and not isinstance(payload[key], str):
+            raise EventPayloadError(f"Event '{key}' must be a string.")
+    diff = _section(payload, "diff")
+    push = _section(payload, "push")
+    languages = {} if diff is None else diff.get("languages", {})
+    if not isinstance(languages, dict):
+        raise EventPayloadError("Event 'diff.languages' must be a JSON object.")
+    return RecordedGitService(
+        sha=payload.get("sha"),
+        previous_sha=payload.get("previous_sha"),
+        diff=DiffStat(
+            files=_count(diff, "files", "diff"),
+            insertions=_count(diff, "insertions", "diff"),
+            deletions=_count(diff, "deletions", "diff"),
+            truncated=bool(diff.get("truncated", False)),
+            languages={str(language): _count(languages, language, "diff.languages") for language in languages},
+        )
+        if diff is not None
+        else None,
+        message=str(payload.get("message", "")),
+        push=PushSummary(
+            commits=_count(push, "commits", "push"),
+            insertions=_count(push, "insertions", "push"),
+            deletions=_count(push, "deletions", "push"),
+        )
+        if push is not None
+        else None,
+    )
+
+
+def event_from_payload(payload: dict[str, Any]) -> tuple[GamifyEvent, RecordedGitService]:
+    """Validate one ingested event payload; return its `GamifyEvent` and recorded git metadata."""
+    if not isinstance(payload, dict):
+        raise EventPayloadError("Event must be a JSON object.")
+    command = payload.get("command")
+    if command not in recordable_commands():
+        raise EventPayloadError(f"Unsupported command '{command}'.")
+    if not isinstance(payload.get("email"), str) or not payload["email"]:
+        raise EventPayloadError("Event is missing 'email'.")
+    try:
+        today = date.fromisoformat(payload["date"]) if payload.get("date") else date.today()
+    except (TypeError, ValueError) as exc:
+        raise EventPayloadError(f"Invalid event date: {exc}") from exc
+    timestamp = payload.get("timestamp")
+    if timestamp is not None and (isinstance(timestamp, bool) or not isinstance(timestamp, (int, float))):
+        raise EventPayloadError("Event 'timestamp' must be epoch seconds.")
+    args = payload.get("args") or [command]
+    if not isinstance(args, list):
+        raise EventPayloadError("Event 'args' must be a list.")
+    # Everything is validated before the profile is touched.
+    git_service = git_service_from_payload(payload)
+    event = GamifyEvent(
+        command=command,
+        args=[str(arg) for arg in args],
+        today=today,
+        git_output=str(payload.get("push_report", "")),
+        repo_id=str(payload["repo"]) if payload.get("repo") else None,
+        timestamp=float(timestamp) if timestamp is not None else None,
+    )
+    return event, git_service
+
+
+class GamifyServer:
+    """In-memory multi-identity profile state with periodic snapshots to disk."""
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        preload: bool = True,
+    ) -> None:
+        self.repository = repository
+        self.snapshot_interval = snapshot_interval
+        self.profiles: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+        # Per-event XP/achievement output is meaningless on a server terminal.
+        self._renderer = SilentRenderer()
+        self._server: asyncio.AbstractServer | None = None
+        self._snapshot_task: asyncio.Future | None = None
+        if preload:
+            self._preload_profiles()
+
+    def _preload_profiles(self) -> None:
+        for path in self.repository.iter_profile_paths():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    email = json.load(f).get("config", {}).get("user_email")
+            except (json.JSONDecodeError, OSError):
+                continue
+            if email:
+                self._profile(email)
+
+    def _profile(self, email: str) -> dict[str, Any]:
+        email = self.repository.resolve_email(email)
+        profile = self.profiles.get(email)
+        if profile is None:
+            profile = self.repository.load(email)
+            self.profiles[email] = profile
+        return profile
+
+    def apply_events(self, payloads: list[Any]) -> dict[str, Any]:
+        """Apply a batch of events per identity with the regular XP engine."""
+        accepted = 0
+        xp_awarded = 0
+        errors: list[str] = []
+        for index, payload in enumerate(payloads):
+            try:
+                event, git_service = event_from_payload(payload)
+            except EventPayloadError as exc:
+                errors.append(f"{index}: {exc}")
+                continue
+            user_data = self._profile(payload["email"])
+            email = user_data["config"]["user_email"]
+            translator = get_translator(user_data.get("config", {}).get("language", "en"))
+            xp_awarded += process_event(
+                user_data,
+                event,
+                translator,
+                git_service=git_service,
+                renderer=self._renderer,
+            )
+            self._dirty.add(email)
+            accepted += 1
+        return {"accepted": accepted, "rejected": len(errors), "xp": xp_awarded, "errors": errors}
+
+    def leaderboard(self, limit: int) -> list[dict[str, Any]]:
+        top = heapq.nlargest(
+            limit, self.profiles.values(), key=lambda data: data.get("user", {}).get("xp", 0)
+        )
+        rows = []
+        for data in top:
+            entry = summarize_profile("", data)
+            rows.append(
+                {
+                    "email": entry.email,
+                    "xp": entry.xp,
+                    "level": entry.level,
+                    "streak": entry.streak,
+                    "achievements": entry.achievements,
+                }
+            )
+        return rows
+
+    def snapshot(self) -> int:
+        """Persist profiles changed since the last snapshot; return how many were saved."""
+        dirty, self._dirty = self._dirty, set()
+        for email in dirty:
+            self.repository.save(self.profiles[email])
+        return len(dirty)
+
+    def route(self, method: str, target: str, body: bytes) -> tuple[int, Any]:
+        """Dispatch one HTTP request to a JSON response `(status, payload)`."""
+        url = urlsplit(target)
+        path = url.path.rstrip("/") or "/"
+
+        if path == "/events":
+            if method != "POST":
+                return 405, {"error": "Use POST for /events."}
+            try:
+                payload = json.loads(body or b"[]")
+            except ValueError as exc:
+                return 400, {"error": f"Invalid JSON: {exc}"}
+            events = payload.get("events") if isinstance(payload, dict) else payload
+            if not isinstance(events, list):
+                return 400, {"error": "Expected a JSON list of events."}
+            return 200, self.apply_events(events)
+
+        if method != "GET":
+            return 405, {"error": f"Use GET for {path}."}
+        if path == "/health":
+            return 200, {"status": "ok", "profiles": len(self.profiles)}
+        if path == "/leaderboard":
+            query = parse_qs(url.query)
+            try:
+                limit = max(1, int(query.get("limit", ["10"])[0]))
+            except ValueError:
+                return 400, {"error": "limit must be an integer."}
+            return 200, {"leaderboard": self.leaderboard(limit)}
+        if path.startswith("/profiles/"):
+            email = self.repository.resolve_email(unquote(path[len("/profiles/") :]))
+            if email not in self.profiles:
+                return 404, {"error": f"Unknown profile '{email}'."}
+            return 200, self.profiles[email]
+        return 404, {"error": f"Unknown path '{path}'."}
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    writer.write(_http_response(413, {"error": "Body too large."}, keep_alive=False))
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = self.route(method, target, body)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(_http_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _snapshot_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            if not self._dirty:
+                continue
+            # Copy in the loop thread so the writer never sees half-applied events.
+            dirty, self._dirty = self._dirty, set()
+            frozen = [copy.deepcopy(self.profiles[email]) for email in dirty]
+            await loop.run_in_executor(None, _save_all, self.repository, frozen)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> tuple[str, int]:
+        """Start listening; return the bound `(host, port)` (useful with port 0)."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self._snapshot_task = asyncio.ensure_future(self._snapshot_loop())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self) -> None:
+        """Stop accepting connections and write a final snapshot."""
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.snapshot()
+
+    async def serve_forever(self, host: str, port: int) -> None:
+        bound_host, bound_port = await self.start(host, port)
+        console.print(f"[green]Serving on http://{bound_host}:{bound_port}[/green]")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+
+def _save_all(repository: UserRepository, profiles: list[dict[str, Any]]) -> None:
+    for profile in profiles:
+        repository.save(profile)
+
+
+def _http_response(status: int, payload: Any, keep_alive: bool) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def run_server(
+    repository: UserRepository,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+) -> None:
+    """Run `gg serve` until interrupted, snapshotting pending changes on exit."""
+    server = GamifyServer(repository, snapshot_interval=snapshot_interval)
+    try:
+        asyncio.run(server.serve_forever(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.snapshot()
@@ -0,0 +1,202 @@
+# src/gg_cli/shim.py
+"""
+POSIX `git` shims that start Python only for tracked git commands (`gg install-shim`).
+
+A shim is either a shell function file to source from `~/.bashrc`/`~/.zshrc`
+or a `git` script placed before the real git in PATH. Both `case` on the
+first argument: tracked commands go through `gg git`, everything else execs
+the real git directly. Installed shims are listed in `shim.json` and are
+rewritten by `gg git` when the tracked-command list changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable
+
+from gg_cli.processors import PROCESSORS
+from gg_cli.utils import DATA_DIR
+
+SHIM_STATE_PATH = DATA_DIR / "shim.json"
+FUNCTION_SHIM_PATH = DATA_DIR / "git-shim.sh"
+SHIM_MARKER = "# git-gamify shim"
+
+
+class ShimError(RuntimeError):
+    """Raised when a shim cannot be installed safely."""
+
+
+def tracked_commands() -> list[str]:
+    """Git subcommands routed through `gg git`."""
+    return sorted(PROCESSORS)
+
+
+def _case_pattern(commands: Iterable[str]) -> str:
+    return "|".join(shlex.quote(command) for command in commands)
+
+
+def render_function(commands: Iterable[str], gg: str) -> str:
+    """A `git` shell function; `command git` bypasses it, so gg's own git calls reach real git."""
+    commands = list(commands)
+    return (
+        f"{SHIM_MARKER} (tracked: {' '.join(commands)}); regenerated by gg, do not edit.\n"
+        "git() {\n"
+        '    case "$1" in\n'
+        f'        {_case_pattern(commands)}) command {shlex.quote(gg)} git "$@" ;;\n'
+        '        *) command git "$@" ;;\n'
+        "    esac\n"
+        "}\n"
+    )
+
+
+def render_script(commands: Iterable[str], gg: str, real_git: str) -> str:
+    """A `git` script; gg runs with the real git's directory first in PATH so it never re-enters the shim."""
+    commands = list(commands)
+    git_dir = os.path.dirname(real_git)
+    return (
+        "#!/bin/sh\n"
+        f"{SHIM_MARKER} (tracked: {' '.join(commands)}); regenerated by gg, do not edit.\n"
+        'case "$1" in\n'
+        f'    {_case_pattern(commands)}) PATH={shlex.quote(git_dir)}:"$PATH" exec {shlex.quote(gg)} git "$@" ;;\n'
+        f'    *) exec {shlex.quote(real_git)} "$@" ;;\n'
+        "esac\n"
+    )
+
+
+def find_real_git(exclude_dir: Path | None = None) -> str:
+    """Return the first `git` in PATH outside `exclude_dir` (where the shim lives)."""
+    entries = os.environ.get("PATH", "").split(os.pathsep)
+    if exclude_dir is not None:
+        excluded = os.path.realpath(exclude_dir)
+        entries = [entry for entry in entries if entry and os.path.realpath(entry) != excluded]
+    real_git = shutil.which("git", path=os.pathsep.join(entries))
+    if real_git is None:
+        raise ShimError("Cannot find git in PATH.")
+    return os.path.abspath(real_git)
+
+
+def find_gg() -> str:
+    gg = shutil.which("gg")
+    if gg is None:
+        raise ShimError("Cannot find gg in PATH; install git-gamify so the `gg` script is on PATH.")
+    return os.path.abspath(gg)
+
+
+def _render(record: dict[str, Any], commands: list[str]) -> str:
+    if record["kind"] == "function":
+        return render_function(commands, record["gg"])
+    return render_script(commands, record["gg"], record["git"])
+
+
+def _write_text_atomic(path: Path, text: str, mode: int) -> None:
+    fd, tmp_path = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_state(state_path: Path) -> list[dict[str, Any]]:
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return []
+    shims = state.get("shims") if isinstance(state, dict) else None
+    return [record for record in shims if isinstance(record, dict)] if isinstance(shims, list) else []
+
+
+def _write_state(state_path: Path, shims: list[dict[str, Any]]) -> None:
+    _write_text_atomic(state_path, json.dumps({"shims": shims}, indent=2) + "\n", 0o644)
+
+
+def install_shim(
+    kind: str = "script",
+    directory: Path | None = None,
+    state_path: Path | None = None,
+) -> Path:
+    """
+    Write a `script` shim (`<directory>/git`) or a `function` shim file and record it.
+
+    Refuses to overwrite a `git` file that is not a git-gamify shim.
+    """
+    state_path = state_path or SHIM_STATE_PATH
+    gg = find_gg()
+    if kind == "function":
+        path = FUNCTION_SHIM_PATH if directory is None else Path(directory) / FUNCTION_SHIM_PATH.name
+        record = {"kind": "function", "path": str(path), "gg": gg}
+    elif kind == "script":
+        if directory is None:
+            raise ShimError("A script shim needs a directory that comes before git in PATH.")
+        path = Path(directory) / "git"
+        record = {"kind": "script", "path": str(path), "gg": gg, "git": find_real_git(Path(directory))}
+    else:
+        raise ShimError(f"Unknown shim kind '{kind}'.")
+
+    try:
+        existing = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = None
+    except (OSError, UnicodeDecodeError):
+        existing = ""
+    if existing is not None and SHIM_MARKER not in existing:
+        raise ShimError(f"{path} exists and is not a git-gamify shim; remove it first.")
+
+    commands = tracked_commands()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_text_atomic(path, _render(record, commands), 0o755 if kind == "script" else 0o644)
+    record["commands"] = commands
+    shims = [shim for shim in _read_state(state_path) if shim.get("path") != str(path)]
+    _write_state(state_path, shims + [record])
+    return path
+
+
+def refresh_installed_shims(state_path: Path | None = None) -> list[Path]:
+    """Rewrite recorded shims whose tracked-command list is out of date; return the rewritten paths."""
+    state_path = state_path or SHIM_STATE_PATH
+    shims = _read_state(state_path)
+    if not shims:
+        return []
+    commands = tracked_commands()
+    kept: list[dict[str, Any]] = []
+    refreshed: list[Path] = []
+    for record in shims:
+        path = Path(record.get("path", ""))
+        if record.get("commands") == commands:
+            kept.append(record)
+            continue
+        try:
+            current = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            # The shim was deleted; stop tracking it.
+            continue
+        except (OSError, UnicodeDecodeError):
+            kept.append(record)
+            continue
+        kept.append(record)
+        if SHIM_MARKER not in current:
+            continue
+        try:
+            _write_text_atomic(path, _render(record, commands), 0o755 if record.get("kind") == "script" else 0o644)
+        except (OSError, KeyError):
+            continue
+        record["commands"] = commands
+        refreshed.append(path)
+    if refreshed or len(kept) != len(shims):
+        try:
+            _write_state(state_path, kept)
+        except OSError:
+            pass
+    return refreshed
@@ -0,0 +1,604 @@
+# src/gg_cli/simulate.py
+"""
+Population simulator for balancing XP rules, streak bonuses and level tiers.
+
+Daily XP of a whole population is computed as NumPy array operations over
+users x days, applying the same rules as `gamify._process_commit_event` and
+`gamify._process_push_event` (reward multipliers, change-size tiers, streak
+bonuses, push caps). Events of one simulated day share a timestamp, so the
+engine's rolling 24-hour limits act per day. Achievement XP is not modelled. NumPy is an
+optional extra: `pip install "git-gamify[simulate]"`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # Optional extra; `require_numpy` explains how to install it.
+    np = None
+
+from gg_cli.gamify import (
+    DEFAULT_XP_RULES,
+    STREAK_BONUS_BASE,
+    STREAK_BONUS_TIERS,
+    GamifyEvent,
+    _process_commit_event,
+    _process_push_event,
+)
+from gg_cli.git_service import DiffStat
+from gg_cli.levels import LEVEL_TIERS
+
+DEFAULT_MILESTONES = (5, 10, 20, 30, 40, 50)
+# Users simulated per NumPy batch; bounds peak memory to a few hundred MB.
+CHUNK_CELLS = 4_000_000
+_CHANGE_TIERS = 4
+# Beyond this many scored commits per day, tier splits are drawn with binomials.
+_OUTCOME_TABLE_MAX_TRIALS = 24
+# Guide table resolution per unit of a CDF (a power of two keeps lookups exact).
+_GUIDE_BINS = 256
+# Push rates up to this are drawn by inverting a Poisson CDF table.
+_POISSON_TABLE_MAX_MEAN = 64.0
+
+
+class SimulationError(ValueError):
+    """Raised for missing NumPy or invalid simulation parameters and rule files."""
+
+
+def require_numpy() -> Any:
+    if np is None:
+        raise SimulationError('`gg simulate` needs NumPy. Install it with: pip install "git-gamify[simulate]"')
+    return np
+
+
+@dataclass
+class ActivityModel:
+    """
+    Distribution of developer behaviour.
+
+    Each user gets an own commit-day probability (Beta distribution with mean
+    `active_rate`) and an own commits-per-day rate (Gamma distribution with
+    mean `commits_per_day`). Commit sizes are log-normal around
+    `change_median` changed lines; pushes per commit day are Poisson.
+    """
+
+    active_rate: float = 0.6
+    active_concentration: float = 4.0
+    commits_per_day: float = 3.0
+    commits_dispersion: float = 2.0
+    pushes_per_day: float = 1.0
+    change_median: float = 40.0
+    change_sigma: float = 1.2
+
+    def validate(self) -> None:
+        if not 0 < self.active_rate <= 1:
+            raise SimulationError("active_rate must be in (0, 1].")
+        if self.commits_per_day < 1:
+            raise SimulationError("commits_per_day must be at least 1.")
+        for name in ("active_concentration", "commits_dispersion", "change_median", "change_sigma"):
+            if getattr(self, name) <= 0:
+                raise SimulationError(f"{name} must be positive.")
+        if self.pushes_per_day < 0:
+            raise SimulationError("pushes_per_day must not be negative.")
+
+
+@dataclass
+class SimulationRules:
+    """XP rules, streak bonus tiers and level tiers to evaluate."""
+
+    xp_rules: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_XP_RULES))
+    streak_tiers: list[tuple[int, int]] = field(default_factory=lambda: list(STREAK_BONUS_TIERS))
+    streak_base: int = STREAK_BONUS_BASE
+    level_tiers: list[tuple[int, int]] = field(
+        default_factory=lambda: [(cap, xp) for cap, xp, _ in LEVEL_TIERS]
+    )
+
+    def matches_engine(self) -> bool:
+        """True when streak and level tiers equal the ones the scalar engine uses."""
+        return (
+            sorted(self.streak_tiers, reverse=True) == sorted(STREAK_BONUS_TIERS, reverse=True)
+            and self.streak_base == STREAK_BONUS_BASE
+            and self.level_tiers == [(cap, xp) for cap, xp, _ in LEVEL_TIERS]
+        )
+
+    def level_starts(self, max_xp: int) -> list[int]:
+        """Cumulative XP at which levels 2, 3, ... start, up to `max_xp`."""
+        starts: list[int] = []
+        total = 0
+        level = 1
+        while total <= max_xp:
+            per_level = next((xp for cap, xp in self.level_tiers if level <= cap), self.level_tiers[-1][1])
+            total += per_level
+            starts.append(total)
+            level += 1
+        return starts
+
+    def start_of_level(self, target: int) -> int:
+        total = 0
+        for level in range(1, target):
+            total += next((xp for cap, xp in self.level_tiers if level <= cap), self.level_tiers[-1][1])
+        return total
+
+
+def load_rules_file(path: str) -> SimulationRules:
+    """
+    Read candidate rules from JSON.
+
+    Accepted keys: `xp_rules` (overrides of `DEFAULT_XP_RULES`),
+    `streak_bonus` (`{"tiers": [[min_days, bonus], ...], "base": 1}`) and
+    `level_tiers` (`[[level_cap, xp_per_level], ...]`).
+    """
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            raw = json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        raise SimulationError(f"Cannot read rules file '{path}': {exc}") from exc
+    if not isinstance(raw, dict):
+        raise SimulationError("Rules file must contain a JSON object.")
+
+    rules = SimulationRules()
+    unknown = set(raw) - {"xp_rules", "streak_bonus", "level_tiers"}
+    if unknown:
+        raise SimulationError(f"Unknown rules file keys: {', '.join(sorted(unknown))}.")
+    for key, value in raw.get("xp_rules", {}).items():
+        if key not in DEFAULT_XP_RULES:
+            raise SimulationError(f"Unknown XP rule '{key}'.")
+        if not isinstance(value, int) or value < 0:
+            raise SimulationError(f"XP rule '{key}' must be a non-negative integer.")
+        rules.xp_rules[key] = value
+    if "streak_bonus" in raw:
+        streak = raw["streak_bonus"]
+        try:
+            rules.streak_tiers = sorted(((int(d), int(b)) for d, b in streak.get("tiers", [])), reverse=True)
+            rules.streak_base = int(streak.get("base", STREAK_BONUS_BASE))
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise SimulationError("streak_bonus must look like {\"tiers\": [[days, bonus], ...]}.") from exc
+    if "level_tiers" in raw:
+        try:
+            rules.level_tiers = [(int(tier[0]), int(tier[1])) for tier in raw["level_tiers"]]
+        except (IndexError, TypeError, ValueError) as exc:
+            raise SimulationError("level_tiers must look like [[level_cap, xp_per_level], ...].") from exc
+        if not rules.level_tiers or any(xp <= 0 for _, xp in rules.level_tiers):
+            raise SimulationError("level_tiers needs at least one tier with positive XP per level.")
+    return rules
+
+
+@dataclass
+class Activity:
+    """
+    Sampled activity of `users` over `days`, stored for commit days only.
+
+    Entry `i` is day `day[i]` of user `user[i]`, ordered by user then day.
+    `first_tier` is the change-size tier (0-3) of the day's first commit;
+    `full_split`/`half_split` index rows of `outcomes` (commits per tier)
+    for the remaining commits scored at full and half reward. Commits beyond
+    the half-reward limit score nothing, so their sizes are not sampled.
+    """
+
+    users: int
+    days: int
+    user: Any
+    day: Any
+    commits: Any
+    pushes: Any
+    first_tier: Any
+    full_split: Any
+    half_split: Any
+    outcomes: Any
+
+
+def _reward_counts(commits: Any, xp_rules: dict[str, int]) -> tuple[Any, Any]:
+    """Numbers of commits after the first one that earn full and half reward."""
+    full_limit = xp_rules["commit_full_reward_count"]
+    half_limit = xp_rules["commit_half_reward_count"]
+    full = np.clip(np.minimum(commits, full_limit) - 1, 0, None)
+    half = np.clip(np.minimum(commits, half_limit) - max(full_limit, 1), 0, None)
+    return full, half
+
+
+def change_tier_probabilities(model: ActivityModel, xp_rules: dict[str, int]) -> list[float]:
+    """Probability of a commit landing in change tiers 0-3 under the log-normal size model."""
+
+    def at_least(lines: int) -> float:
+        if lines <= 0:
+            return 1.0
+        z = (math.log(lines) - math.log(model.change_median)) / model.change_sigma
+        return 0.5 * math.erfc(z / math.sqrt(2))
+
+    tier1, tier2, tier3 = (at_least(xp_rules[f"commit_change_tier{n}"]) for n in (1, 2, 3))
+    return [1.0 - tier1, tier1 - tier2, tier2 - tier3, tier3]
+
+
+def _tier_outcomes(max_trials: int, probabilities: list[float]) -> tuple[Any, Any]:
+    """
+    Enumerate every tier split of 0..`max_trials` commits with its probability.
+
+    Returns the outcome table (`(n, 4)` tier counts) and a cumulative
+    probability array in which the block for `m` commits spans `(m, m + 1]`,
+    so `searchsorted(cdf, m + u)` draws a split for `m` commits from one
+    uniform `u`.
+    """
+    outcomes: list[tuple[int, int, int, int]] = []
+    cdf: list[float] = []
+    for trials in range(max_trials + 1):
+        total = 0.0
+        for c0 in range(trials + 1):
+            for c1 in range(trials - c0 + 1):
+                for c2 in range(trials - c0 - c1 + 1):
+                    c3 = trials - c0 - c1 - c2
+                    ways = math.comb(trials, c0) * math.comb(trials - c0, c1) * math.comb(trials - c0 - c1, c2)
+                    total += ways * math.prod(p**c for p, c in zip(probabilities, (c0, c1, c2, c3)))
+                    outcomes.append((c0, c1, c2, c3))
+                    cdf.append(trials + min(total, 1.0))
+        # Guard against rounding so `m + u` (u < 1) always lands inside block m.
+        cdf[-1] = trials + 1.0
+    return np.array(outcomes, dtype=np.int32), np.array(cdf)
+
+
+def _search_cdf(cdf: Any, values: Any) -> Any:
+    """
+    `np.searchsorted(cdf, values, side="right")` through a guide table.
+
+    `cdf` is non-decreasing, non-negative and ends above every value. The
+    guide gives, per bin of width 1/_GUIDE_BINS, the answer for the bin's
+    start; each value then steps forward over the few CDF entries between its
+    bin start and itself. This avoids a binary search per value.
+    """
+    bins = np.arange(math.ceil(cdf[-1]) * _GUIDE_BINS + 1) / _GUIDE_BINS
+    guide = np.searchsorted(cdf, bins, side="right")
+    index = guide[(values * _GUIDE_BINS).astype(np.intp)]
+    pending = np.flatnonzero(cdf[index] <= values)
+    while pending.size:
+        index[pending] += 1
+        pending = pending[cdf[index[pending]] <= values[pending]]
+    return index
+
+
+def _poisson(rng: Any, mean: float, size: int) -> Any:
+    """Poisson counts with a shared `mean`, drawn by inverting its CDF."""
+    if mean <= 0:
+        return np.zeros(size, dtype=np.int32)
+    if mean > _POISSON_TABLE_MAX_MEAN:
+        return rng.poisson(mean, size=size).astype(np.int32)
+    # The table ends where the remaining tail is far below float resolution.
+    counts = np.arange(1, int(mean + 12 * math.sqrt(mean) + 24))
+    pmf = np.concatenate([[math.exp(-mean)], math.exp(-mean) * np.cumprod(mean / counts)])
+    cdf = np.cumsum(pmf)
+    cdf[-1] = 1.0
+    return _search_cdf(cdf, rng.random(size)).astype(np.int32)
+
+
+def _split_tiers(rng: Any, trials: Any, probabilities: list[float]) -> tuple[Any, Any]:
+    """
+    Draw multinomial tier counts for each entry of `trials`.
+
+    Returns an outcome table of distinct `(n, 4)` tier counts and, per entry,
+    the index of its row.
+    """
+    max_trials = int(trials.max(initial=0))
+    if max_trials <= _OUTCOME_TABLE_MAX_TRIALS:
+        outcomes, cdf = _tier_outcomes(max_trials, probabilities)
+        # Row 0 is the empty split; only entries with scored commits need a draw.
+        index = np.zeros(trials.shape, dtype=np.intp)
+        drawn = np.flatnonzero(trials)
+        index[drawn] = _search_cdf(cdf, trials[drawn] + rng.random(drawn.size))
+        return outcomes, index
+    # Large daily limits: a chain of binomials avoids a huge outcome table.
+    counts = np.zeros(trials.shape + (_CHANGE_TIERS,), dtype=np.int64)
+    remaining = trials.astype(np.int64)
+    rest = 1.0
+    for tier, probability in enumerate(probabilities[:-1]):
+        share = min(1.0, probability / rest) if rest > 0 else 0.0
+        drawn = rng.binomial(remaining, share)
+        counts[:, tier] = drawn
+        remaining -= drawn
+        rest -= probability
+    counts[:, -1] = remaining
+    # Deduplicate rows through a scalar key; `np.unique(axis=0)` is far slower.
+    base = max_trials + 1
+    keys = ((counts[:, 0] * base + counts[:, 1]) * base + counts[:, 2]) * base + counts[:, 3]
+    _, first, index = np.unique(keys, return_index=True, return_inverse=True)
+    return counts[first].astype(np.int32), index.reshape(-1)
+
+
+def sample_activity(rng: Any, users: int, days: int, model: ActivityModel, rules: SimulationRules) -> Activity:
+    """Draw commit days, commits, commit sizes and pushes for `users` x `days`."""
+    alpha = model.active_rate * model.active_concentration
+    beta = (1.0 - model.active_rate) * model.active_concentration
+    active_rate = rng.beta(alpha, beta, size=(users, 1)) if beta > 0 else np.ones((users, 1))
+    # 16-bit draws resolve each user's commit-day rate to 1/65536 at a quarter
+    # of the random bytes of floats; entries come out ordered by user, then day.
+    threshold = np.round(active_rate * 65536).astype(np.uint32)
+    cells = np.flatnonzero(rng.integers(0, 1 << 16, size=(users, days), dtype=np.uint16) < threshold)
+    user, day = np.divmod(cells, days)
+    size = user.size
+
+    extra_mean = model.commits_per_day - 1.0
+    rate = np.zeros(users)
+    if extra_mean > 0:
+        rate = rng.gamma(model.commits_dispersion, extra_mean / model.commits_dispersion, size=users)
+    commits = (1 + rng.poisson(rate[user])).astype(np.int32)
+    pushes = _poisson(rng, model.pushes_per_day, size)
+
+    probabilities = change_tier_probabilities(model, rules.xp_rules)
+    # Three comparisons are cheaper than `searchsorted` for a four-way split.
+    uniform = rng.random(size)
+    first_tier = np.zeros(size, dtype=np.int8)
+    for boundary in np.cumsum(probabilities[:-1]):
+        first_tier += uniform >= boundary
+    full, half = _reward_counts(commits, rules.xp_rules)
+    # Both splits share one outcome table so entries can be stored as row indices.
+    outcomes, split_index = _split_tiers(rng, np.concatenate([full, half]), probabilities)
+    return Activity(
+        users=users,
+        days=days,
+        user=user,
+        day=day,
+        commits=commits,
+        pushes=pushes,
+        first_tier=first_tier,
+        full_split=split_index[:size],
+        half_split=split_index[size:],
+        outcomes=outcomes,
+    )
+
+
+def _streak_lengths(user: Any, day: Any) -> Any:
+    """Consecutive commit days ending at each entry."""
+    if not user.size:
+        return np.zeros(0, dtype=np.int64)
+    continues = np.zeros(user.size, dtype=bool)
+    continues[1:] = (user[1:] == user[:-1]) & (day[1:] == day[:-1] + 1)
+    index = np.arange(user.size)
+    run_start = np.maximum.accumulate(np.where(continues, 0, index))
+    return index - run_start + 1
+
+
+def daily_xp(activity: Activity, rules: SimulationRules) -> Any:
+    """Rule XP of each commit day, identical to replaying its events through the engine."""
+    xp_rules = rules.xp_rules
+    bonuses = np.array([0] + [xp_rules[f"commit_change_bonus_tier{n}"] for n in (1, 2, 3)], dtype=np.int64)
+    full_xp = xp_rules["commit_base"] + bonuses
+    half_xp = full_xp // 2
+
+    streak = _streak_lengths(activity.user, activity.day)
+    streak_table = np.full(activity.days + 1, rules.streak_base, dtype=np.int64)
+    for min_days, bonus in sorted(rules.streak_tiers):
+        streak_table[min(min_days, activity.days + 1) :] = bonus
+    first_raw = full_xp[activity.first_tier] + streak_table[streak]
+    if xp_rules["commit_full_reward_count"] >= 1:
+        xp = first_raw
+    elif xp_rules["commit_half_reward_count"] >= 1:
+        xp = first_raw // 2
+    else:
+        xp = np.zeros_like(first_raw)
+    xp = xp + (activity.outcomes @ full_xp)[activity.full_split] + (activity.outcomes @ half_xp)[activity.half_split]
+
+    # Push XP only depends on the day's commit and push counts, so it is
+    # computed once per (commits, pushes) pair and looked up per entry.
+    commits = np.arange(int(activity.commits.max(initial=0)) + 1)[:, None]
+    pushes = np.arange(int(activity.pushes.max(initial=0)) + 1)[None, :]
+    pushed = pushes > 0
+    push_raw = pushes * xp_rules["push_base"] + pushed * xp_rules["push_first_of_day_bonus"]
+    push_xp = np.minimum(push_raw, xp_rules["push_daily_xp_cap"])
+
+    # A day's commits are spread evenly over its pushes.
+    per_push = commits // np.maximum(pushes, 1)
+    larger = np.where(pushed, commits - per_push * pushes, 0)
+    bonus, bonus_cap = xp_rules["push_commit_bonus"], xp_rules["push_commit_bonus_cap"]
+    range_xp = larger * np.minimum((per_push + 1) * bonus, bonus_cap) + (pushes - larger) * np.minimum(
+        per_push * bonus, bonus_cap
+    )
+    push_xp = push_xp + np.minimum(range_xp, xp_rules["push_commit_bonus_daily_cap"])
+    xp += push_xp[activity.commits, activity.pushes]
+    return xp
+
+
+@dataclass
+class MilestoneStats:
+    level: int
+    reached: int
+    p10: float | None
+    p50: float | None
+    p90: float | None
+
+
+@dataclass
+class SimulationResult:
+    users: int
+    days: int
+    level_counts: dict[int, int]
+    final_xp_percentiles: dict[int, float]
+    mean_xp_per_commit_day: float
+    milestones: list[MilestoneStats]
+
+
+def _simulate_chunk(
+    seed: Any, users: int, days: int, model: ActivityModel, rules: SimulationRules, starts: dict[int, int]
+) -> tuple[Any, dict[int, Any], int]:
+    """Final XP per user, day each milestone was reached (per reaching user) and commit days."""
+    activity = sample_activity(np.random.default_rng(seed), users, days, model, rules)
+    xp = daily_xp(activity, rules)
+    final = np.bincount(activity.user, weights=xp, minlength=users).astype(np.int64)
+
+    # Per-user running totals over the (user, day)-ordered entries.
+    running = np.cumsum(xp)
+    running -= np.concatenate([[0], np.cumsum(final)[:-1]])[activity.user]
+    # Running totals only grow, so each user passes milestone starts in order;
+    # only entries where the number passed changes can reach a milestone.
+    levels = sorted(starts, key=starts.__getitem__)
+    passed = np.searchsorted(np.array([starts[level] for level in levels]), running, side="right")
+    before = np.zeros_like(passed)
+    before[1:] = np.where(activity.user[1:] == activity.user[:-1], passed[:-1], 0)
+    changed = np.flatnonzero(passed != before)
+    reach_days = {}
+    for rank, level in enumerate(levels):
+        hits = changed[(before[changed] <= rank) & (passed[changed] > rank)]
+        reach_days[level] = activity.day[hits] + 1
+    return final, reach_days, int(activity.user.size)
+
+
+def simulate(
+    users: int,
+    days: int,
+    model: ActivityModel | None = None,
+    rules: SimulationRules | None = None,
+    seed: int | None = None,
+    milestones: tuple[int, ...] = DEFAULT_MILESTONES,
+    workers: int | None = 1,
+) -> SimulationResult:
+    """
+    Simulate `users` developers for `days` days and summarize levels reached.
+
+    Users are processed in chunks with independent random streams derived
+    from `seed`, so results do not depend on `workers`.
+    """
+    require_numpy()
+    model = model or ActivityModel()
+    rules = rules or SimulationRules()
+    model.validate()
+    if users < 1 or days < 1:
+        raise SimulationError("users and days must be positive.")
+
+    starts = {level: rules.start_of_level(level) for level in milestones}
+    chunk = max(1, CHUNK_CELLS // days)
+    sizes = [min(chunk, users - offset) for offset in range(0, users, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(chunk_seed, size, days, model, rules, starts) for chunk_seed, size in zip(seeds, sizes)]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        results = [_simulate_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_simulate_chunk, *zip(*jobs)))
+
+    final_xp_parts = [final for final, _, _ in results]
+    reach_days = {level: [reached[level] for _, reached, _ in results] for level in milestones}
+    total_xp = sum(int(final.sum()) for final in final_xp_parts)
+    commit_days = sum(count for _, _, count in results)
+
+    final_xp = np.concatenate(final_xp_parts)
+    level_starts = np.array(rules.level_starts(int(final_xp.max())), dtype=np.int64)
+    levels = 1 + np.searchsorted(level_starts, final_xp, side="right")
+    values, counts = np.unique(levels, return_counts=True)
+
+    milestone_stats = []
+    for level in milestones:
+        reached_days = np.concatenate(reach_days[level])
+        if reached_days.size:
+            p10, p50, p90 = (float(v) for v in np.percentile(reached_days, [10, 50, 90]))
+        else:
+            p10 = p50 = p90 = None
+        milestone_stats.append(MilestoneStats(level, int(reached_days.size), p10, p50, p90))
+
+    return SimulationResult(
+        users=users,
+        days=days,
+        level_counts={int(level): int(count) for level, count in zip(values, counts)},
+        final_xp_percentiles={
+            q: float(v) for q, v in zip((10, 50, 90), np.percentile(final_xp, [10, 50, 90]))
+        },
+        mean_xp_per_commit_day=total_xp / commit_days if commit_days else 0.0,
+        milestones=milestone_stats,
+    )
+
+
+class _ReplayGitService:
+    """Serves the diff size of the commit being replayed."""
+
+    def __init__(self) -> None:
+        self.changes = 0
+
+    def get_last_commit_diff(self) -> DiffStat:
+        return DiffStat(files=1, insertions=self.changes)
+
+    def get_last_commit_message(self) -> str:
+        return "simulated commit"
+
+
+@dataclass
+class CrossCheckResult:
+    users: int
+    commit_days: int
+    mismatches: list[str]
+    skipped_reason: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches and self.skipped_reason is None
+
+
+def replay_daily_xp(activity: Activity, entries: Any, rules: SimulationRules, start: date) -> list[int]:
+    """Feed one user's simulated commit days (`entries`) through the scalar engine."""
+    # Imported here: only the cross-check needs a full profile payload.
+    from gg_cli.core import get_default_user_data
+
+    xp_rules = rules.xp_rules
+    tier_changes = [0] + [xp_rules[f"commit_change_tier{n}"] for n in (1, 2, 3)]
+    user_data = get_default_user_data("simulated@example.invalid")
+    git = _ReplayGitService()
+    result = []
+    for entry in entries:
+        today = start + timedelta(days=int(activity.day[entry]))
+        commits = int(activity.commits[entry])
+        sizes = [tier_changes[int(activity.first_tier[entry])]]
+        for split in (activity.full_split[entry], activity.half_split[entry]):
+            for tier, count in enumerate(activity.outcomes[split]):
+                sizes.extend([tier_changes[tier]] * int(count))
+        sizes.extend([0] * (commits - len(sizes)))
+
+        xp = 0
+        for changes in sizes:
+            git.changes = changes
+            xp += _process_commit_event(user_data, GamifyEvent("commit", [], today=today), git, xp_rules)
+        pushes = int(activity.pushes[entry])
+        for index in range(pushes):
+            pushed = commits // pushes + (1 if index < commits % pushes else 0)
+            event = GamifyEvent("push", [], today=today, context={"push_commits": pushed})
+            xp += _process_push_event(user_data, event, xp_rules)
+        result.append(xp)
+    return result
+
+
+def cross_check(
+    users: int,
+    days: int,
+    model: ActivityModel | None = None,
+    rules: SimulationRules | None = None,
+    seed: int | None = None,
+) -> CrossCheckResult:
+    """Compare vectorized daily XP with the scalar engine for a small sample of users."""
+    require_numpy()
+    model = model or ActivityModel()
+    rules = rules or SimulationRules()
+    if not rules.matches_engine():
+        return CrossCheckResult(
+            users=0,
+            commit_days=0,
+            mismatches=[],
+            skipped_reason="custom streak or level tiers are not used by the scalar engine",
+        )
+
+    activity = sample_activity(np.random.default_rng(seed), users, days, model, rules)
+    vectorized = daily_xp(activity, rules)
+    mismatches = []
+    start = date(2024, 1, 1)
+    for user in range(users):
+        entries = np.flatnonzero(activity.user == user)
+        scalar = replay_daily_xp(activity, entries, rules, start)
+        for entry, expected in zip(entries, scalar):
+            actual = int(vectorized[entry])
+            if expected != actual:
+                mismatches.append(
+                    f"user {user}, day {int(activity.day[entry])}: engine {expected} XP, simulator {actual} XP "
+                    f"({int(activity.commits[entry])} commits, {int(activity.pushes[entry])} pushes)"
+                )
+                break
+    return CrossCheckResult(users=users, commit_days=int(activity.user.size), mismatches=mismatches)
@@ -0,0 +1,244 @@
+# src/gg_cli/sync.py
+"""Cross-machine profile sync through a dedicated git ref (`gg sync`)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from gg_cli.git_service import GitService
+from gg_cli.levels import get_level_from_xp
+from gg_cli.profile_merge import (
+    LATEST_DATE_STATS,
+    SUMMED_STATS,
+    duplicate_unlock_xp,
+    latest_dates,
+    merge_unlocks,
+    merged_streak,
+)
+
+SYNC_REF_PREFIX = "refs/gamify/"
+PUSH_ATTEMPTS = 3
+
+
+class SyncError(RuntimeError):
+    """Raised when the sync ref cannot be fetched, written or pushed."""
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one `gg sync` run."""
+
+    pushed: bool
+    devices: int
+    fetched_devices: int
+
+
+def get_default_sync_state() -> dict[str, Any]:
+    """
+    Return the empty sync bookkeeping stored under `user_data["sync"]`.
+
+    `own_unlocks` are achievements this device unlocked itself, `synced_unlocks`
+    every unlock present after the last sync, and `unlock_refund` the XP taken
+    off for achievements unlocked on several devices.
+    """
+    return {
+        "device_id": None,
+        "peers": {},
+        "peer_blobs": {},
+        "own_unlocks": [],
+        "synced_unlocks": [],
+        "unlock_refund": 0,
+    }
+
+
+def sync_ref_name(email: str) -> str:
+    """Return the per-identity ref holding one contribution blob per device."""
+    return SYNC_REF_PREFIX + hashlib.sha1(email.encode("utf-8")).hexdigest()
+
+
+def build_contribution(user_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return this device's own contribution to the identity's totals.
+
+    Counters are stored as local totals minus what was last merged from peers,
+    so each device only ever writes its own blob and summing blobs is
+    order-independent. Unlocks are those made on this device (anything new
+    since the last sync, since merged unlocks are never checked again), and
+    the event ledger is this device's own, which only ever holds its work.
+    """
+    state = user_data["sync"]
+    stats = user_data["stats"]
+    peers = state["peers"].values()
+    # The refund was taken off the merged XP, not off this device's work.
+    counters = {"xp": int(user_data["user"].get("xp", 0)) + int(state.get("unlock_refund", 0))}
+    counters.update({key: int(stats.get(key, 0)) for key in SUMMED_STATS})
+    for peer in peers:
+        for key in counters:
+            counters[key] -= int(peer["counters"].get(key, 0))
+    unlocked = user_data["achievements_unlocked"]
+    synced = set(state.get("synced_unlocks", []))
+    own_unlocks = set(state.get("own_unlocks", [])) | {ach_id for ach_id in unlocked if ach_id not in synced}
+    return {
+        "device": state["device_id"],
+        "counters": {key: max(0, value) for key, value in counters.items()},
+        "stats": {
+            **{key: stats.get(key, "1970-01-01") for key in LATEST_DATE_STATS},
+            "consecutive_commit_days": int(stats.get("consecutive_commit_days", 0)),
+        },
+        "achievements_unlocked": {ach_id: unlocked[ach_id] for ach_id in sorted(own_unlocks) if ach_id in unlocked},
+        "events": user_data.get("events", {}),
+    }
+
+
+def apply_contributions(
+    user_data: dict[str, Any], own: dict[str, Any], peers: dict[str, dict[str, Any]]
+) -> None:
+    """
+    Rebuild profile totals as own contribution plus every peer contribution.
+
+    Like alias merges, an achievement unlocked on several devices is rewarded
+    once. Peer event ledgers stay in the sync state, where `EventLedger`
+    consults them, so work counted on another device is not counted again.
+    """
+    contributions = [own, *peers.values()]
+    stats = user_data["stats"]
+    state = user_data["sync"]
+
+    unlock_maps = [item.get("achievements_unlocked", {}) for item in contributions]
+    refund = duplicate_unlock_xp(*unlock_maps)
+    xp = max(0, sum(int(item["counters"].get("xp", 0)) for item in contributions) - refund)
+    for key in SUMMED_STATS:
+        stats[key] = sum(int(item["counters"].get(key, 0)) for item in contributions)
+    stats.update(latest_dates(item["stats"] for item in contributions))
+    stats["consecutive_commit_days"] = merged_streak(item["stats"] for item in contributions)
+    user_data["achievements_unlocked"] = merge_unlocks(user_data["achievements_unlocked"], *unlock_maps)
+    user_data["user"] = {"xp": xp, "level": get_level_from_xp(xp)}
+    state["peers"] = peers
+    state["own_unlocks"] = sorted(own.get("achievements_unlocked", {}))
+    state["synced_unlocks"] = sorted(user_data["achievements_unlocked"])
+    state["unlock_refund"] = refund
+
+
+class GitRefStore:
+    """Plumbing-level access to one sync ref in the current repository and a remote."""
+
+    def __init__(self, git_service: GitService, remote: str, ref: str) -> None:
+        self.git = git_service
+        self.remote = remote
+        self.ref = ref
+
+    def _run(self, args: list[str], input: str | None = None) -> str:
+        result = self.git.run(args, input=input)
+        if result.returncode != 0:
+            raise SyncError(f"git {' '.join(args[:2])} failed: {result.stderr.strip()}")
+        return result.stdout
+
+    def fetch(self) -> str | None:
+        """Fetch the remote ref; return its commit, or `None` if the remote has none yet."""
+        result = self.git.run(["ls-remote", "--refs", self.remote, self.ref])
+        if result.returncode != 0:
+            raise SyncError(f"Cannot reach remote '{self.remote}': {result.stderr.strip()}")
+        if not result.stdout.strip():
+            return None
+        # Objects already present locally are not transferred again.
+        self._run(["fetch", "--quiet", "--no-tags", self.remote, f"+{self.ref}:{self.ref}"])
+        return self._run(["rev-parse", "--verify", self.ref]).strip()
+
+    def read_tree(self, commit: str | None) -> dict[str, str]:
+        """Return `{filename: blob_sha}` for the tree of `commit`."""
+        if commit is None:
+            return {}
+        entries: dict[str, str] = {}
+        for record in self._run(["ls-tree", "-z", commit]).split("\0"):
+            if not record:
+                continue
+            meta, _, name = record.partition("\t")
+            entries[name] = meta.split()[2]
+        return entries
+
+    def read_blobs(self, shas: Iterable[str]) -> dict[str, str]:
+        """Read several blobs through one `cat-file --batch` process."""
+        shas = list(shas)
+        if not shas:
+            return {}
+        output = self._run(["cat-file", "--batch"], input="".join(f"{sha}\n" for sha in shas))
+        blobs: dict[str, str] = {}
+        position = 0
+        for sha in shas:
+            header_end = output.index("\n", position)
+            size = int(output[position:header_end].split()[2])
+            # Contribution blobs are ASCII JSON, so byte sizes equal string lengths.
+            blobs[sha] = output[header_end + 1 : header_end + 1 + size]
+            position = header_end + 1 + size + 1
+        return blobs
+
+    def write_blob(self, content: str) -> str:
+        return self._run(["hash-object", "-w", "--stdin"], input=content).strip()
+
+    def write_commit(self, entries: dict[str, str], parent: str | None, message: str) -> str:
+        tree_input = "".join(f"100644 blob {sha}\t{name}\0" for name, sha in sorted(entries.items()))
+        tree = self._run(["mktree", "-z"], input=tree_input).strip()
+        args = ["commit-tree", tree, "-m", message]
+        if parent:
+            args[2:2] = ["-p", parent]
+        commit = self._run(args).strip()
+        self._run(["update-ref", self.ref, commit])
+        return commit
+
+    def push(self) -> bool:
+        """Push the ref; return False when the remote moved on (non-fast-forward)."""
+        result = self.git.run(["push", "--quiet", "--no-verify", self.remote, f"{self.ref}:{self.ref}"])
+        return result.returncode == 0
+
+
+def sync_profile(
+    user_data: dict[str, Any], remote: str, git_service: GitService | None = None
+) -> SyncResult:
+    """
+    Merge peer contributions from `remote` into `user_data` and publish our own.
+
+    Only peer blobs that changed since the last sync are read, and a new
+    commit is pushed only when this device's contribution changed.
+    """
+    git = git_service or GitService()
+    email = user_data["config"]["user_email"]
+    state = user_data.setdefault("sync", get_default_sync_state())
+    if not state.get("device_id"):
+        state["device_id"] = uuid.uuid4().hex
+    own_name = f"{state['device_id']}.json"
+    store = GitRefStore(git, remote, sync_ref_name(email))
+
+    for _ in range(PUSH_ATTEMPTS):
+        parent = store.fetch()
+        tree = store.read_tree(parent)
+        peer_entries = {name[: -len(".json")]: sha for name, sha in tree.items() if name != own_name}
+        changed = {
+            device: sha for device, sha in peer_entries.items() if state["peer_blobs"].get(device) != sha
+        }
+        blobs = store.read_blobs(changed.values())
+
+        peers = {
+            device: state["peers"][device]
+            for device in peer_entries
+            if device not in changed and device in state["peers"]
+        }
+        for device, sha in changed.items():
+            peers[device] = json.loads(blobs[sha])
+
+        own = build_contribution(user_data)
+        apply_contributions(user_data, own, peers)
+        state["peer_blobs"] = peer_entries
+
+        own_blob = store.write_blob(json.dumps(own, sort_keys=True))
+        if tree.get(own_name) == own_blob:
+            return SyncResult(pushed=False, devices=len(peers) + 1, fetched_devices=len(changed))
+
+        store.write_commit({**tree, own_name: own_blob}, parent, f"gg sync {state['device_id']}")
+        if store.push():
+            return SyncResult(pushed=True, devices=len(peers) + 1, fetched_devices=len(changed))
+
+    raise SyncError(f"Remote '{remote}' kept changing; sync gave up after {PUSH_ATTEMPTS} attempts.")
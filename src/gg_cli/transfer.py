@@ -0,0 +1,175 @@
+# src/gg_cli/transfer.py
+"""Streaming NDJSON export and import of profiles (`gg export` / `gg import`)."""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from gg_cli.core import UserRepository, get_default_user_data
+
+IMPORT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 20
+
+
+class ProfileRecordError(ValueError):
+    """Raised when an imported record does not match the profile schema."""
+
+
+@dataclass
+class ImportReport:
+    """Outcome of one `gg import` run."""
+
+    imported: int = 0
+    rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def add(self, imported: int, errors: list[str]) -> None:
+        self.imported += imported
+        self.rejected += len(errors)
+        room = MAX_REPORTED_ERRORS - len(self.errors)
+        if room > 0:
+            self.errors.extend(errors[:room])
+
+
+def _check_type(path: str, value: Any, default: Any) -> None:
+    if default is None:
+        expected: tuple[type, ...] = (str, type(None))
+    elif isinstance(default, bool):
+        expected = (bool,)
+    elif isinstance(default, int):
+        expected = (int,)
+    else:
+        expected = (type(default),)
+    # bool is an int subclass; never accept it where a counter is expected.
+    if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+        names = " or ".join(t.__name__ for t in expected)
+        raise ProfileRecordError(f"'{path}' must be {names}, got {type(value).__name__}.")
+
+
+def validate_profile_record(record: Any) -> dict[str, Any]:
+    """
+    Check one record against the `get_default_user_data` schema.
+
+    Returns the record merged over a fresh default profile, the same way
+    `UserRepository.load` upgrades older files; unknown top-level keys are dropped.
+    """
+    if not isinstance(record, dict):
+        raise ProfileRecordError("Record must be a JSON object.")
+    email = record.get("config", {}).get("user_email") if isinstance(record.get("config"), dict) else None
+    if not isinstance(email, str) or not email:
+        raise ProfileRecordError("Record is missing 'config.user_email'.")
+
+    profile = get_default_user_data(email)
+    for main_key, defaults in profile.items():
+        if main_key not in record:
+            continue
+        section = record[main_key]
+        _check_type(main_key, section, defaults)
+        for key, value in section.items():
+            if key in defaults:
+                _check_type(f"{main_key}.{key}", value, defaults[key])
+        defaults.update(section)
+
+    for ach_id, unlocked_on in profile["achievements_unlocked"].items():
+        if not isinstance(unlocked_on, str):
+            raise ProfileRecordError(f"'achievements_unlocked.{ach_id}' must be str.")
+    return profile
+
+
+def iter_profiles(repository: UserRepository) -> Iterator[dict[str, Any]]:
+    """Yield stored profiles one at a time, skipping unreadable files."""
+    for path in repository.iter_profile_paths():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            continue
+        if isinstance(data, dict) and data.get("config", {}).get("user_email"):
+            yield data
+
+
+def export_lines(profiles: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Serialize profiles as NDJSON lines (including the trailing newline)."""
+    for data in profiles:
+        yield json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _iter_batches(lines: Iterable[str], batch_size: int) -> Iterator[tuple[int, list[str]]]:
+    """Group input lines into `(first_line_number, lines)` batches."""
+    batch: list[str] = []
+    start = 1
+    for number, line in enumerate(lines, start=1):
+        if not batch:
+            start = number
+        batch.append(line)
+        if len(batch) >= batch_size:
+            yield start, batch
+            batch = []
+    if batch:
+        yield start, batch
+
+
+def _import_batch(repository: UserRepository, start: int, lines: list[str]) -> tuple[int, list[str]]:
+    profiles = []
+    errors = []
+    for number, line in enumerate(lines, start=start):
+        if not line.strip():
+            continue
+        try:
+            profiles.append(validate_profile_record(json.loads(line)))
+        except ValueError as exc:  # JSONDecodeError and ProfileRecordError alike.
+            errors.append(f"line {number}: {exc}")
+    return repository.save_many(profiles), errors
+
+
+_WORKER_REPOSITORY: UserRepository | None = None
+
+
+def _import_batch_in_worker(data_dir: str, start: int, lines: list[str]) -> tuple[int, list[str]]:
+    """Worker entry point; each process keeps one repository (and index connection)."""
+    global _WORKER_REPOSITORY
+    if _WORKER_REPOSITORY is None or str(_WORKER_REPOSITORY.data_dir) != data_dir:
+        _WORKER_REPOSITORY = UserRepository(Path(data_dir))
+    return _import_batch(_WORKER_REPOSITORY, start, lines)
+
+
+def import_lines(
+    lines: Iterable[str],
+    repository: UserRepository,
+    workers: int | None = 1,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ImportReport:
+    """
+    Validate and store NDJSON profile lines in batches.
+
+    At most two batches per worker are in flight, so memory stays bounded no
+    matter how long the input is. When the same identity appears more than
+    once, the last copy written wins; with several workers that order is not
+    guaranteed, so deduplicate inputs first if it matters.
+    """
+    report = ImportReport()
+    batches = _iter_batches(lines, batch_size)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for start, batch in batches:
+            report.add(*_import_batch(repository, start, batch))
+        return report
+
+    data_dir = str(repository.data_dir)
+    pending: set[Future] = set()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for start, batch in batches:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.add(*future.result())
+            pending.add(executor.submit(_import_batch_in_worker, data_dir, start, batch))
+        for future in pending:
+            report.add(*future.result())
+    return report
@@ -3,46 +3,151 @@
 from __future__ import annotations
 
 import json
+import threading
+from string import Formatter
+from typing import Any, Union
 
-from gg_cli.utils import LOCALES_DIR, console
+# `utils.console` is created on first use; translating alone never imports Rich.
+from gg_cli import utils
+from gg_cli.definitions_loader import load_locale
 
+# A compiled template is either a plain string (no fields) or a list of
+# literal strings and `(field_name, conversion, format_spec)` tuples.
+CompiledTemplate = Union[str, list]
 
-class Translator:
-    """Load locale files and expose a small translation lookup API."""
+_FORMATTER = Formatter()
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
 
-    def __init__(self, lang_code: str = "en") -> None:
-        self.strings: dict[str, str] = {}
+# Process-wide catalogs keyed by language; each is read from disk once.
+_CATALOGS: dict[str, "Catalog"] = {}
+_CATALOGS_LOCK = threading.Lock()
+_WARNED_LANGUAGES: set[str] = set()
+_TRANSLATORS: dict[str, "Translator"] = {}
+
+
+def _compile_template(template: str) -> CompiledTemplate | None:
+    """
+    Pre-parse `template` with `string.Formatter.parse`.
+
+    Returns None for templates using positional, indexed/attribute or nested
+    fields; those keep going through `str.format`.
+    """
+    parts: list[Any] = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or "{" in (format_spec or ""):
+            return None
+        parts.append((field_name, conversion, format_spec or ""))
+    if all(isinstance(part, str) for part in parts):
+        return "".join(parts)
+    return parts
+
+
+class Catalog:
+    """Merged strings of one language (English fallback first) plus compiled templates."""
 
-        # Always seed translations with English to guarantee fallback keys.
-        self._load_language("en")
-        if lang_code.lower() != "en":
-            self.load_strings(lang_code)
+    def __init__(self, strings: dict[str, str]) -> None:
+        self.strings = strings
+        self._compiled: dict[str, CompiledTemplate | None] = {}
 
-    def _load_language(self, lang_code: str) -> bool:
-        """Load one locale file into the translation map."""
-        lang_file = LOCALES_DIR / f"{lang_code.lower()}.json"
+    def format(self, key: str, kwargs: dict[str, Any]) -> str:
+        template = self.strings.get(key, key)
         try:
-            with open(lang_file, "r", encoding="utf-8-sig") as f:
-                self.strings.update(json.load(f))
-            return True
-        except FileNotFoundError:
-            console.print(f"[yellow]Warning: Language file for '{lang_code}' not found.[/yellow]")
-        except json.JSONDecodeError:
-            console.print(
-                f"[bold red]Error: Failed to decode language file for '{lang_code}'. The file might be corrupted.[/bold red]"
-            )
-        except Exception as exc:
-            console.print(
-                f"[bold red]An unexpected error occurred while loading language '{lang_code}': {exc}[/bold red]"
-            )
-        return False
-
-    def load_strings(self, lang_code: str) -> None:
-        """Load non-English strings while preserving English fallback entries."""
-        if not self._load_language(lang_code):
-            console.print("[yellow]Falling back to English.[/yellow]")
+            compiled = self._compiled[template]
+        except KeyError:
+            compiled = self._compiled[template] = _compile_template(template)
+        if compiled is None:
+            return template.format(**kwargs)
+        if isinstance(compiled, str):
+            return compiled
+        pieces = []
+        for part in compiled:
+            if isinstance(part, str):
+                pieces.append(part)
+                continue
+            name, conversion, spec = part
+            value = kwargs[name]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            pieces.append(format(value, spec))
+        return "".join(pieces)
+
+
+def _warn_once(lang_code: str, message: str) -> None:
+    if lang_code in _WARNED_LANGUAGES:
+        return
+    _WARNED_LANGUAGES.add(lang_code)
+    utils.console.print(message)
+
+
+def _read_locale(lang_code: str) -> dict[str, str] | None:
+    """Read one locale file, warning (once per language) when it is unusable."""
+    try:
+        return load_locale(lang_code)
+    except FileNotFoundError:
+        _warn_once(lang_code, f"[yellow]Warning: Language file for '{lang_code}' not found. Falling back to English.[/yellow]")
+    except json.JSONDecodeError:
+        _warn_once(
+            lang_code,
+            f"[bold red]Error: Failed to decode language file for '{lang_code}'. The file might be corrupted.[/bold red]",
+        )
+    except Exception as exc:
+        _warn_once(
+            lang_code,
+            f"[bold red]An unexpected error occurred while loading language '{lang_code}': {exc}[/bold red]",
+        )
+    return None
+
+
+def get_catalog(lang_code: str = "en") -> Catalog:
+    """Return the shared catalog for `lang_code`, loading it on first use."""
+    lang_code = (lang_code or "en").lower()
+    catalog = _CATALOGS.get(lang_code)
+    if catalog is not None:
+        return catalog
+    with _CATALOGS_LOCK:
+        catalog = _CATALOGS.get(lang_code)
+        if catalog is None:
+            strings: dict[str, str] = {}
+            if lang_code != "en":
+                # Always seed translations with English to guarantee fallback keys.
+                english = _CATALOGS.get("en")
+                strings.update(english.strings if english else _read_locale("en") or {})
+            strings.update(_read_locale(lang_code) or {})
+            catalog = _CATALOGS[lang_code] = Catalog(strings)
+    return catalog
+
+
+def clear_catalogs() -> None:
+    """Drop cached catalogs (after locale files change, or in tests)."""
+    with _CATALOGS_LOCK:
+        _CATALOGS.clear()
+        _TRANSLATORS.clear()
+        _WARNED_LANGUAGES.clear()
+
+
+class Translator:
+    """Translation lookup API backed by the shared per-language catalog."""
+
+    def __init__(self, lang_code: str = "en") -> None:
+        self._catalog = get_catalog(lang_code)
+
+    @property
+    def strings(self) -> dict[str, str]:
+        return self._catalog.strings
 
     def t(self, key: str, **kwargs) -> str:
         """Return translated text for `key`, formatted with `kwargs` if provided."""
-        template = self.strings.get(key, key)
-        return template.format(**kwargs)
+        return self._catalog.format(key, kwargs)
+
+
+def get_translator(lang_code: str = "en") -> Translator:
+    """Return a process-wide `Translator` for `lang_code`."""
+    key = (lang_code or "en").lower()
+    translator = _TRANSLATORS.get(key)
+    if translator is None:
+        translator = _TRANSLATORS[key] = Translator(key)
+    return translator
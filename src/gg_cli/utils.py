@@ -2,11 +2,6 @@
 
 from pathlib import Path
 
-from rich.console import Console
-
-# Shared Rich console used by CLI and runtime messages.
-console = Console()
-
 # Package-relative paths for static assets bundled with the project.
 _CODE_DIR = Path(__file__).parent
 DEFINITIONS_DIR = _CODE_DIR / "definitions"
@@ -15,3 +10,14 @@ LOCALES_DIR = _CODE_DIR / "locales"
 # Persistent user data directory under the current OS user home.
 DATA_DIR = Path.home() / ".git-gamify"
 DATA_DIR.mkdir(exist_ok=True)
+
+
+def __getattr__(name: str):
+    # The shared Rich console used by CLI and runtime messages is created on
+    # first access, so rich-free code paths (JSON reports, prompt) never import it.
+    if name == "console":
+        from rich.console import Console
+
+        console = globals()["console"] = Console()
+        return console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,54 @@
+# src/gg_cli/wrapper.py
+"""Git wrapper mode (`gg git ...`), kept independent of Typer and Rich."""
+
+from __future__ import annotations
+
+import sys
+import time
+import traceback
+
+from gg_cli import metrics
+from gg_cli.git_service import GitService
+from gg_cli.processors import is_tracked
+from gg_cli.render import get_renderer
+
+
+def run_git_wrapper(git_args: list[str]) -> None:
+    """Run real git command and trigger gamification when a tracked command succeeds."""
+    started = time.perf_counter()
+    git_seconds = 0.0
+    git_service = GitService()
+    command = git_args[0] if git_args else ""
+    try:
+        git_started = time.perf_counter()
+        result = git_service.run(git_args)
+        git_seconds = time.perf_counter() - git_started
+        if result.stdout:
+            sys.stdout.write(result.stdout)
+        if result.stderr:
+            sys.stderr.write(result.stderr)
+
+        if result.returncode == 0 and is_tracked(command):
+            # Imported here so untracked commands (status, log, ...) skip the engine.
+            from gg_cli.gamify import process_gamify_logic
+
+            process_gamify_logic(git_args, git_service=git_service, git_result=result)
+            # Python is already running here, unlike for the untracked commands a shim bypasses.
+            from gg_cli.shim import refresh_installed_shims
+
+            refresh_installed_shims()
+    except FileNotFoundError:
+        metrics.inc("gg_errors_total", kind="git_not_found")
+        renderer = get_renderer()
+        renderer.line("[bold red]Error: 'git' command not found. Is Git installed and in your PATH?[/bold red]")
+        renderer.flush()
+    except Exception:
+        metrics.inc("gg_errors_total", kind="unexpected")
+        renderer = get_renderer()
+        renderer.line("[bold red]An unexpected error occurred. Full traceback below:[/bold red]")
+        renderer.flush()
+        traceback.print_exc()
+    if metrics.registry.enabled:
+        # Untracked subcommands share one label to keep series counts bounded.
+        label = command if is_tracked(command) else "other"
+        metrics.observe("gg_git_wrapper_overhead_seconds", time.perf_counter() - started - git_seconds, command=label)
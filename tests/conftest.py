@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
 
@@ -11,6 +11,7 @@ import pytest
 from typer.testing import CliRunner
 
 from gg_cli.core import get_default_user_data
+from gg_cli.git_service import DiffStat, PushSummary
 
 
 @dataclass
@@ -25,11 +26,22 @@ class StubTranslator:
 class StubGitService:
     """Git service stub used by event processing tests."""
 
-    shortstat: str = " 2 files changed, 100 insertions(+), 40 deletions(-)"
+    diff: DiffStat = field(default_factory=lambda: DiffStat(files=2, insertions=100, deletions=40))
     commit_message: str = "Add feature and tests"
+    push_summary: PushSummary = field(default_factory=PushSummary)
+    rev_parse_calls: list[tuple[str, ...]] = field(default_factory=list)
 
-    def get_shortstat_last_commit(self) -> str:
-        return self.shortstat
+    def rev_parse(self, *revisions: str) -> list[str]:
+        # Every call yields fresh SHAs so repeated commits are distinct work.
+        self.rev_parse_calls.append(revisions)
+        call_index = len(self.rev_parse_calls)
+        return [f"{call_index:04d}{index:036d}" for index, _ in enumerate(revisions)]
+
+    def summarize_push(self, pushed_refs) -> PushSummary:
+        return self.push_summary
+
+    def get_last_commit_diff(self) -> DiffStat:
+        return self.diff
 
     def get_last_commit_message(self) -> str:
         return self.commit_message
@@ -83,3 +95,14 @@ def suppress_console_output(request, monkeypatch: pytest.MonkeyPatch) -> None:
     if request.node.get_closest_marker("allow_console_output"):
         return
     monkeypatch.setattr("gg_cli.utils.console.print", lambda *args, **kwargs: None)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def no_definitions_cache_file():
+    """Keep the compiled definitions cache and plugin index in memory instead of the real data dir."""
+    from gg_cli.definitions_loader import registry
+    from gg_cli.plugins import index
+
+    registry.cache_dir = None
+    index.cache_path = None
+    yield
@@ -7,7 +7,8 @@ from pathlib import Path
 
 import pytest
 
-from gg_cli.core import UserRepository, get_default_user_data
+from gg_cli.core import UserRepository, get_default_user_data, get_profile_filename
+from gg_cli.profile_merge import merge_profiles
 
 
 def test_user_repository_round_trip(tmp_path: Path):
@@ -26,6 +27,7 @@ def test_user_repository_merges_partial_schema_from_disk(tmp_path: Path):
     """Partial legacy files should be merged with default schema keys."""
     repo = UserRepository(tmp_path)
     profile_path = repo.get_profile_path("test@example.com")
+    profile_path.parent.mkdir()
     profile_path.write_text(
         json.dumps(
             {"stats": {"total_commits": 9}, "config": {"language": "zh"}},
@@ -45,6 +47,7 @@ def test_user_repository_recovers_from_corrupt_file(tmp_path: Path):
     """Corrupted JSON should be replaced by a clean default profile."""
     repo = UserRepository(tmp_path)
     profile_path = repo.get_profile_path("test@example.com")
+    profile_path.parent.mkdir()
     profile_path.write_text("{bad-json", encoding="utf-8")
 
     loaded = repo.load("test@example.com")
@@ -65,5 +68,123 @@ def test_user_repository_cleans_temp_file_when_replace_fails(tmp_path: Path, mon
     with pytest.raises(OSError):
         repo.save(data)
 
-    leftovers = list(tmp_path.glob("*.tmp"))
+    leftovers = list(tmp_path.rglob("*.tmp"))
     assert leftovers == []
+
+
+def test_user_repository_stores_profiles_in_hash_shards(tmp_path: Path):
+    """Profiles should live under a two-character hash prefix directory."""
+    repo = UserRepository(tmp_path)
+    repo.save(get_default_user_data("test@example.com"))
+
+    filename = get_profile_filename("test@example.com")
+    assert (tmp_path / filename[:2] / filename[2:]).exists()
+    assert not (tmp_path / filename).exists()
+
+
+def test_user_repository_reads_create_no_shard_directories(tmp_path: Path):
+    """Lookups for unknown profiles must leave the data directory untouched."""
+    repo = UserRepository(tmp_path)
+
+    assert repo.find("ghost@example.com") is None
+    assert repo.delete("ghost@example.com") is False
+    assert not repo.get_profile_path("ghost@example.com").parent.exists()
+
+
+def test_user_repository_migrates_flat_layout_on_load(tmp_path: Path):
+    """Profiles from the flat layout should be moved into their shard transparently."""
+    repo = UserRepository(tmp_path)
+    legacy_path = repo.get_legacy_profile_path("test@example.com")
+    legacy_path.write_text(json.dumps({"stats": {"total_commits": 4}}), encoding="utf-8")
+
+    loaded = repo.load("test@example.com")
+
+    assert loaded["stats"]["total_commits"] == 4
+    assert not legacy_path.exists()
+    assert repo.get_profile_path("test@example.com").exists()
+
+
+def test_user_repository_iterates_and_deletes_both_layouts(tmp_path: Path):
+    """Listing and reset should cover sharded and not-yet-migrated profiles."""
+    repo = UserRepository(tmp_path)
+    repo.save(get_default_user_data("sharded@example.com"))
+    repo.get_legacy_profile_path("flat@example.com").write_text("{}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    paths = sorted(path.name for path in repo.iter_profile_paths())
+    assert len(paths) == 2
+
+    assert repo.delete("flat@example.com") is True
+    assert repo.delete("sharded@example.com") is True
+    assert repo.delete("sharded@example.com") is False
+    assert list(repo.iter_profile_paths()) == []
+
+
+def test_aliases_resolve_to_canonical_profile(tmp_path: Path):
+    """Loading through an alias should return the canonical identity's profile."""
+    repo = UserRepository(tmp_path)
+    data = get_default_user_data("main@example.com")
+    data["user"]["xp"] = 40
+    repo.save(data)
+
+    assert repo.add_alias("work@corp.example", "main@example.com") is False
+
+    reopened = UserRepository(tmp_path)
+    loaded = reopened.load("work@corp.example")
+    assert loaded["config"]["user_email"] == "main@example.com"
+    assert loaded["user"]["xp"] == 40
+
+
+def test_add_alias_merges_existing_profiles(tmp_path: Path):
+    """Counters and XP add up; unlocks keep the earliest date and are rewarded once; the alias file goes away."""
+    repo = UserRepository(tmp_path)
+    main = get_default_user_data("main@example.com")
+    main["user"] = {"xp": 100, "level": 2}
+    main["stats"].update(total_commits=10, last_commit_date="2026-03-02", consecutive_commit_days=3)
+    main["achievements_unlocked"] = {"first_commit": "2026-02-01"}
+    main["events"]["recent"] = ["commit:aaa"]
+    repo.save(main)
+    old = get_default_user_data("old@example.com")
+    old["user"] = {"xp": 50, "level": 1}
+    old["stats"].update(total_commits=4, last_commit_date="2025-12-30", consecutive_commit_days=9)
+    old["achievements_unlocked"] = {"first_commit": "2025-01-01", "commit_10": "2025-12-30"}
+    old["events"]["recent"] = ["commit:bbb"]
+    repo.save(old)
+
+    assert repo.add_alias("old@example.com", "main@example.com") is True
+
+    merged = repo.load("main@example.com")
+    # Both profiles were granted first_commit's 30 XP; the merged profile keeps one reward.
+    assert merged["user"]["xp"] == 120
+    assert merged["stats"]["total_commits"] == 14
+    assert merged["stats"]["last_commit_date"] == "2026-03-02"
+    assert merged["stats"]["consecutive_commit_days"] == 3
+    assert merged["achievements_unlocked"] == {"first_commit": "2025-01-01", "commit_10": "2025-12-30"}
+    assert merged["events"]["recent"] == ["commit:aaa", "commit:bbb"]
+    assert [path.name for path in repo.iter_profile_paths()] == [repo.get_profile_path("main@example.com").name]
+
+
+def test_alias_chains_stay_flat(tmp_path: Path):
+    repo = UserRepository(tmp_path)
+    repo.add_alias("b@example.com", "a@example.com")
+    repo.add_alias("a@example.com", "c@example.com")
+
+    assert repo.resolve_email("b@example.com") == "c@example.com"
+    with pytest.raises(ValueError):
+        repo.add_alias("c@example.com", "b@example.com")
+
+
+def test_merge_profiles_refunds_each_duplicate_unlock():
+    """An achievement unlocked in three profiles is rewarded once, not three times."""
+    profiles = []
+    for index in range(3):
+        data = get_default_user_data(f"user{index}@example.com")
+        data["user"] = {"xp": 100, "level": 2}
+        data["achievements_unlocked"] = {"first_commit": f"2026-01-0{index + 1}", "retired_plugin_ach": "2026-01-01"}
+        profiles.append(data)
+    profiles[0]["achievements_unlocked"]["first_push"] = "2026-01-05"
+
+    merged = merge_profiles(*profiles)
+
+    assert merged["user"]["xp"] == 300 - 2 * 30
+    assert merged["achievements_unlocked"]["first_commit"] == "2026-01-01"
@@ -0,0 +1,146 @@
+"""Tests for lazy definitions loading and the compiled definitions cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+
+from gg_cli.definitions_loader import XP_RULE_KEYS, DefinitionsRegistry, DefinitionsValidationError
+
+
+def _write(path, payload):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+@pytest.fixture
+def sources(tmp_path):
+    definitions = tmp_path / "definitions"
+    locales = tmp_path / "locales"
+    definitions.mkdir()
+    locales.mkdir()
+    _write(
+        definitions / "achievements.json",
+        {"basics": {"first": {"name_key": "first_name", "desc_key": "first_desc", "xp_reward": 5}}},
+    )
+    _write(definitions / "rewards.json", {"quotes": {"en": ["q"], "zh": ["q"]}, "jokes": {"en": ["j"], "zh": ["j"]}})
+    _write(definitions / "rules.json", {"internal_commands": ["help"], "xp_rules": dict.fromkeys(XP_RULE_KEYS, 1)})
+    _write(locales / "en.json", {"first_name": "First", "first_desc": "Desc", "count": 3})
+    _write(locales / "zh.json", {"first_name": "一", "first_desc": "描述"})
+    return definitions, locales, tmp_path / "cache"
+
+
+def test_importing_gamify_reads_no_files():
+    """The gamify engine must not touch definitions (or any data file) at import time."""
+    script = textwrap.dedent(
+        """
+        import sys
+        opened = []
+        def hook(event, args):
+            if event == "open" and isinstance(args[0], str):
+                if not args[0].endswith((".py", ".pyc", ".so", ".pth")):
+                    opened.append(args[0])
+        sys.addaudithook(hook)
+        import gg_cli.gamify
+        print("\\n".join(opened))
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=os.environ.copy()
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_assets_load_lazily_and_once(sources, monkeypatch):
+    definitions, locales, cache_dir = sources
+    registry = DefinitionsRegistry(definitions, locales, cache_dir)
+    loads = []
+    real_load = DefinitionsRegistry._load
+
+    def counting_load(self, name):
+        loads.append(name)
+        return real_load(self, name)
+
+    monkeypatch.setattr(DefinitionsRegistry, "_load", counting_load)
+    assert loads == []
+    assert registry.achievements()["first"]["xp_reward"] == 5
+    assert registry.achievements() is registry.achievements()
+    assert registry.locale("en")["count"] == "3"
+    assert loads == ["achievements", "locale:en"]
+
+
+def test_concurrent_first_access_loads_once(sources, monkeypatch):
+    definitions, locales, cache_dir = sources
+    registry = DefinitionsRegistry(definitions, locales, cache_dir)
+    loads = []
+    real_load = DefinitionsRegistry._load
+    monkeypatch.setattr(DefinitionsRegistry, "_load", lambda self, name: loads.append(name) or real_load(self, name))
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.rewards())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert loads == ["rewards"]
+    assert all(result is results[0] for result in results)
+
+
+def test_compiled_cache_is_reused_until_source_changes(sources, monkeypatch):
+    definitions, locales, cache_dir = sources
+    DefinitionsRegistry(definitions, locales, cache_dir).rewards()
+    DefinitionsRegistry(definitions, locales, cache_dir).locale("en")
+    assert json.loads((cache_dir / "rewards.json").read_text(encoding="utf-8"))["source"] == str(
+        definitions / "rewards.json"
+    )
+
+    read_sources = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        read_sources.append(str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    assert DefinitionsRegistry(definitions, locales, cache_dir).rewards()["jokes"]["en"] == ["j"]
+    # Only the rewards cache file is read: not its source, nor other assets' caches.
+    assert read_sources == [str(cache_dir / "rewards.json")]
+
+    _write(definitions / "rewards.json", {"quotes": {"en": ["new"], "zh": ["q"]}, "jokes": {"en": ["j"], "zh": ["j"]}})
+    stat = os.stat(definitions / "rewards.json")
+    os.utime(definitions / "rewards.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert DefinitionsRegistry(definitions, locales, cache_dir).rewards()["quotes"]["en"] == ["new"]
+    assert str(definitions / "rewards.json") in read_sources
+
+
+def test_invalid_asset_raises_on_first_access(sources):
+    definitions, locales, cache_dir = sources
+    _write(definitions / "rewards.json", {"quotes": {"en": ["q"], "zh": []}})
+    registry = DefinitionsRegistry(definitions, locales, cache_dir)
+    registry.rules()
+    with pytest.raises(DefinitionsValidationError):
+        registry.rewards()
+
+
+def test_validation_stamp_tracks_sources(sources):
+    definitions, locales, cache_dir = sources
+    registry = DefinitionsRegistry(definitions, locales, cache_dir)
+    assert not registry.is_validated()
+    registry.mark_validated()
+    assert DefinitionsRegistry(definitions, locales, cache_dir).is_validated()
+
+    stat = os.stat(locales / "zh.json")
+    os.utime(locales / "zh.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert not DefinitionsRegistry(definitions, locales, cache_dir).is_validated()
+
+
+def test_rules_require_complete_xp_rules(sources):
+    definitions, locales, cache_dir = sources
+    _write(definitions / "rules.json", {"xp_rules": {"commit_base": -1}})
+    with pytest.raises(DefinitionsValidationError, match="commit_base"):
+        DefinitionsRegistry(definitions, locales, cache_dir).rules()
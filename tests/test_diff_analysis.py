@@ -0,0 +1,52 @@
+"""Tests for diff path exclusion and language classification."""
+
+from __future__ import annotations
+
+import pytest
+
+from gg_cli.diff_analysis import OTHER_LANGUAGE, PathClassifier, get_default_classifier
+from gg_cli.git_service import DiffStat, GitService
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "package-lock.json",
+        "web/yarn.lock",
+        "vendor/github.com/pkg/errors/errors.go",
+        "services/api/node_modules/left-pad/index.js",
+        "static/app.min.js",
+        "proto/user_pb2.py",
+    ],
+)
+def test_default_classifier_excludes_generated_and_vendor_paths(path):
+    """Lockfiles, vendored trees and generated artifacts should not be scored."""
+    assert get_default_classifier().classify(path) is None
+
+
+@pytest.mark.parametrize(
+    "path, language",
+    [
+        ("src/gg_cli/gamify.py", "Python"),
+        ("web/App.TSX", "TypeScript"),
+        ("docker/Dockerfile", "Docker"),
+        ("LICENSE", OTHER_LANGUAGE),
+    ],
+)
+def test_default_classifier_maps_languages(path, language):
+    """Scored paths should be grouped by extension or well-known filename."""
+    assert get_default_classifier().classify(path) == language
+
+
+def test_numstat_records_split_scored_and_excluded_lines():
+    """Numstat accounting should keep excluded lines out of size metrics."""
+    classifier = PathClassifier(["*.lock"], {"Python": [".py"]})
+    stat = DiffStat()
+    for record in ("10\t2\tsrc/app.py", "900\t0\tpoetry.lock", "-\t-\tlogo.png"):
+        GitService._add_numstat_record(stat, record, classifier)
+
+    assert stat.files == 3
+    assert stat.changed_lines == 12
+    assert stat.excluded_files == 1
+    assert stat.excluded_lines == 900
+    assert stat.languages == {"Python": 12, OTHER_LANGUAGE: 0}
@@ -0,0 +1,148 @@
+"""Tests for commit/push deduplication through the profile event ledger."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from gg_cli import dedup
+from gg_cli.dedup import EventLedger
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.git_service import parse_push_report
+from gg_cli.render import PlainRenderer
+
+PUSH_REPORT = """To github.com:octo/repo.git
+   1a2b3c4..5d6e7f8  main -> main
+ + 0a0b0c0...9f9e9d9 topic -> topic (forced update)
+ * [new branch]      feature -> feature
+ - [deleted]         stale
+ ! [rejected]        other -> other (fetch first)
+"""
+
+
+def test_ledger_claim_detects_repeated_keys(user_data_factory):
+    """The same key must only be claimable once."""
+    data = user_data_factory()
+    ledger = EventLedger(data)
+
+    assert ledger.claim(["commit:abc"]) is True
+    assert ledger.claim(["commit:abc"]) is False
+    assert EventLedger(data).claim(["commit:abc"]) is False
+
+
+def test_ledger_keeps_evicted_keys_in_bloom_filter(user_data_factory, monkeypatch):
+    """Keys pushed out of the exact window must still be recognized."""
+    monkeypatch.setattr(dedup, "RECENT_KEYS_LIMIT", 4)
+    data = user_data_factory()
+    ledger = EventLedger(data)
+    for index in range(10):
+        ledger.add(f"commit:{index}")
+
+    assert len(data["events"]["recent"]) == 4
+    assert "commit:0" in EventLedger(data)
+    assert "commit:never" not in EventLedger(data)
+
+
+def test_ledger_filter_grows_with_recorded_keys(user_data_factory, monkeypatch):
+    """The serialized ledger must stay proportional to the keys it holds."""
+    monkeypatch.setattr(dedup, "RECENT_KEYS_LIMIT", 4)
+    data = user_data_factory()
+    ledger = EventLedger(data)
+    ledger.add("commit:0")
+    assert len(json.dumps(data["events"])) < 400
+
+    for index in range(1, 1000):
+        ledger.add(f"commit:{index}")
+    # 1000 keys at 16 bits each is ~2.7 KB of base64; a fixed 2**17-bit filter would be 22 KB.
+    assert len(json.dumps(data["events"])) < 6000
+    reloaded = EventLedger(json.loads(json.dumps(data)))
+    assert all(f"commit:{index}" in reloaded for index in range(1000))
+    assert sum(f"other:{index}" in reloaded for index in range(1000)) < 10
+
+
+def test_merge_ledgers_keeps_keys_from_every_side(user_data_factory, monkeypatch):
+    monkeypatch.setattr(dedup, "RECENT_KEYS_LIMIT", 2)
+    first, second = user_data_factory(), user_data_factory()
+    for index in range(100):
+        EventLedger(first).add(f"commit:a{index}")
+        EventLedger(second).add(f"commit:b{index}")
+
+    merged = {"events": dedup.merge_ledgers(first["events"], second["events"])}
+    ledger = EventLedger(merged)
+    assert all(f"commit:a{index}" in ledger and f"commit:b{index}" in ledger for index in range(100))
+    ledger.add("commit:c")
+    assert "commit:c" in EventLedger(merged)
+
+
+def test_ledger_rejects_events_superseding_counted_work(user_data_factory):
+    """Amending an already counted commit must not count again."""
+    data = user_data_factory()
+    ledger = EventLedger(data)
+    ledger.add("commit:old")
+
+    assert ledger.claim(["commit:new"], supersedes=["commit:old"]) is False
+    assert "commit:new" in ledger
+
+
+def test_parse_push_report_extracts_updated_refs():
+    """Only created and updated refs should be reported as pushed work."""
+    refs = parse_push_report(PUSH_REPORT)
+
+    assert [(ref.dst, ref.old, ref.new, ref.forced) for ref in refs] == [
+        ("main", "1a2b3c4", "5d6e7f8", False),
+        ("topic", "0a0b0c0", "9f9e9d9", True),
+        ("feature", None, None, False),
+    ]
+    assert {ref.remote for ref in refs} == {"github.com:octo/repo.git"}
+
+
+def test_process_event_skips_replayed_commit(user_data_factory, translator, git_service):
+    """Processing the same commit SHA twice should award XP only once."""
+    data = user_data_factory()
+    git_service.rev_parse = lambda *revisions: ["f" * 40]
+    today = date(2026, 2, 2)
+
+    first = process_event(data, GamifyEvent("commit", ["commit"], today=today), translator, git_service)
+    replay = GamifyEvent("commit", ["commit"], today=today)
+    second = process_event(data, replay, translator, git_service)
+
+    assert first > 0
+    assert second == 0
+    assert replay.context["duplicate"] is True
+    assert data["stats"]["total_commits"] == 1
+
+
+def test_process_event_skips_push_without_ref_updates(user_data_factory, translator, git_service):
+    """Pushes that update nothing and replayed pushes should not award XP."""
+    data = user_data_factory()
+    today = date(2026, 2, 2)
+    report = "To github.com:octo/repo.git\n   1a2b3c4..5d6e7f8  main -> main\n"
+
+    first = process_event(
+        data, GamifyEvent("push", ["push"], today=today, git_output=report), translator, git_service
+    )
+    replay = process_event(
+        data, GamifyEvent("push", ["push"], today=today, git_output=report), translator, git_service
+    )
+    noop = process_event(
+        data,
+        GamifyEvent("push", ["push"], today=today, git_output="Everything up-to-date\n"),
+        translator,
+        git_service,
+    )
+
+    assert first > 0
+    assert replay == 0
+    assert noop == 0
+    assert data["stats"]["total_pushes"] == 1
+
+
+def test_push_without_ref_updates_is_not_reported_as_duplicate(user_data_factory, translator, git_service, capsys):
+    """An up-to-date push earns nothing but is not "already counted" work either."""
+    data = user_data_factory()
+    event = GamifyEvent("push", ["push"], today=date(2026, 2, 2), git_output="Everything up-to-date\n")
+
+    assert process_event(data, event, translator, git_service, renderer=PlainRenderer()) == 0
+    assert "duplicate" not in event.context
+    assert translator.t("duplicate_event_message") not in capsys.readouterr().out
+    assert data["stats"]["total_pushes"] == 0
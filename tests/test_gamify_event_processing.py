@@ -8,6 +8,7 @@ import pytest
 
 from gg_cli.definitions_loader import DefinitionsValidationError
 from gg_cli.gamify import GamifyEvent, process_event, process_gamify_logic
+from gg_cli.git_service import DiffStat
 
 
 def test_process_commit_event_updates_stats_and_context(user_data_factory, translator, git_service):
@@ -79,7 +80,7 @@ def test_process_event_tolerates_commit_diff_failures(user_data_factory, transla
     event = GamifyEvent(command="commit", args=["commit"], today=date(2026, 2, 2))
 
     class FailingGitService:
-        def get_shortstat_last_commit(self):
+        def get_last_commit_diff(self):
             raise RuntimeError("git diff unavailable")
 
         def get_last_commit_message(self):
@@ -111,3 +112,15 @@ def test_process_gamify_logic_exits_when_user_email_missing(monkeypatch, user_da
 
     process_gamify_logic(["commit", "-m", "x"])
     assert saves == []
+
+
+def test_process_commit_event_scores_truncated_diff_as_large(user_data_factory, translator, git_service):
+    """Diffs cut off by the sizing budget should still earn the top size tier."""
+    data = user_data_factory()
+    git_service.diff = DiffStat(files=2000, insertions=10, deletions=0, truncated=True)
+    event = GamifyEvent(command="commit", args=["commit"], today=date(2026, 2, 2))
+
+    process_event(data, event, translator=translator, git_service=git_service)
+
+    assert event.context["diff_truncated"] is True
+    assert event.context["changes"] >= 200
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from gg_cli.main import run_git_wrapper
+from gg_cli.wrapper import run_git_wrapper
 
 
 def test_run_git_wrapper_triggers_gamify_on_success(monkeypatch):
@@ -16,10 +16,10 @@ def test_run_git_wrapper_triggers_gamify_on_success(monkeypatch):
             assert args == ["commit", "-m", "x"]
             return SimpleNamespace(returncode=0, stdout="ok\n", stderr="")
 
-    monkeypatch.setattr("gg_cli.main.GitService", StubService)
+    monkeypatch.setattr("gg_cli.wrapper.GitService", StubService)
     monkeypatch.setattr(
-        "gg_cli.main.process_gamify_logic",
-        lambda args, git_service=None: calls.append((args, git_service)),
+        "gg_cli.gamify.process_gamify_logic",
+        lambda args, git_service=None, git_result=None: calls.append((args, git_service)),
     )
 
     run_git_wrapper(["commit", "-m", "x"])
@@ -35,10 +35,10 @@ def test_run_git_wrapper_skips_gamify_on_failure(monkeypatch):
         def run(self, args):
             return SimpleNamespace(returncode=1, stdout="", stderr="fail\n")
 
-    monkeypatch.setattr("gg_cli.main.GitService", StubService)
+    monkeypatch.setattr("gg_cli.wrapper.GitService", StubService)
     monkeypatch.setattr(
-        "gg_cli.main.process_gamify_logic",
-        lambda args, git_service=None: calls.append((args, git_service)),
+        "gg_cli.gamify.process_gamify_logic",
+        lambda args, git_service=None, git_result=None: calls.append((args, git_service)),
     )
 
     run_git_wrapper(["commit", "-m", "x"])
@@ -0,0 +1,121 @@
+"""Tests for the compact per-day activity history."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+from gg_cli.core import get_default_user_data
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.history import (
+    HISTORY_MAX_DAYS,
+    ActivityHistory,
+    heatmap_grid,
+    heatmap_levels,
+    merge_histories,
+)
+from gg_cli.main import render_heatmap
+
+
+def test_history_round_trips_through_profile_payload():
+    user_data = get_default_user_data("a@example.com")
+    ActivityHistory(user_data).record(date(2026, 1, 1), commits=2, xp=30)
+    ActivityHistory(user_data).record(date(2026, 1, 3), pushes=1, xp=4)
+    # Backdated activity prepends days without disturbing later ones.
+    ActivityHistory(user_data).record(date(2025, 12, 31), commits=1)
+
+    history = ActivityHistory(user_data)
+    assert history.first_day == date(2025, 12, 31)
+    assert history.window("commits", date(2025, 12, 30), date(2026, 1, 4)) == [0, 1, 2, 0, 0, 0]
+    assert history.get("xp", date(2026, 1, 3)) == 4
+    assert isinstance(user_data["history"]["commits"], str)
+
+
+def test_history_is_bounded_and_saturates():
+    user_data = get_default_user_data("a@example.com")
+    history = ActivityHistory(user_data)
+    start = date(2000, 1, 1)
+    history.record(start, commits=1)
+    history.record(start + timedelta(days=HISTORY_MAX_DAYS + 9), commits=70000)
+
+    assert len(history) == HISTORY_MAX_DAYS
+    assert history.first_day == start + timedelta(days=10)
+    assert history.get("commits", start + timedelta(days=HISTORY_MAX_DAYS + 9)) == 0xFFFF
+
+
+def test_days_older_than_retention_are_dropped():
+    user_data = get_default_user_data("a@example.com")
+    today = date(2026, 5, 10)
+    ActivityHistory(user_data).record(today - timedelta(days=340), commits=5)
+    before = dict(user_data["history"])
+
+    ActivityHistory(user_data).record(today - timedelta(days=4000), commits=1)
+    assert user_data["history"] == before
+
+    old = get_default_user_data("b@example.com")
+    ActivityHistory(old).record(today - timedelta(days=4000), commits=1)
+    merged = ActivityHistory({"history": merge_histories(user_data["history"], old["history"])})
+    assert merged.get("commits", today - timedelta(days=340)) == 5
+    assert merged.get("commits", today - timedelta(days=4000)) == 0
+    assert merged.first_day == today - timedelta(days=340)
+
+
+def test_commit_streak_is_recomputed_from_history():
+    user_data = get_default_user_data("a@example.com")
+    history = ActivityHistory(user_data)
+    today = date(2026, 5, 10)
+    for offset in (1, 2, 3, 5):
+        history.record(today - timedelta(days=offset), commits=1)
+
+    assert history.commit_streak(today) == 3
+    history.record(today, commits=1)
+    assert history.commit_streak(today) == 4
+
+
+def test_merge_histories_adds_overlapping_days():
+    first = get_default_user_data("a@example.com")
+    second = get_default_user_data("b@example.com")
+    ActivityHistory(first).record(date(2026, 1, 2), commits=1)
+    ActivityHistory(second).record(date(2026, 1, 2), commits=2)
+    ActivityHistory(second).record(date(2026, 1, 1), xp=9)
+
+    merged = ActivityHistory({"history": merge_histories(first["history"], second["history"])})
+
+    assert merged.get("commits", date(2026, 1, 2)) == 3
+    assert merged.get("xp", date(2026, 1, 1)) == 9
+
+
+def test_heatmap_grid_aligns_weeks_and_hides_future_days():
+    user_data = get_default_user_data("a@example.com")
+    today = date(2026, 10, 14)  # Wednesday
+    ActivityHistory(user_data).record(today, commits=4)
+    ActivityHistory(user_data).record(today - timedelta(days=1), commits=1)
+
+    grid = heatmap_grid(ActivityHistory(user_data), today)
+    levels = heatmap_levels(grid)
+
+    assert len(grid) == 7 and len(grid[0]) == 53
+    assert grid[2][-1] == 4 and grid[1][-1] == 1
+    assert grid[3][-1] is None
+    assert (levels[2][-1], levels[1][-1], levels[0][-1]) == (4, 1, 0)
+
+
+def test_process_event_records_daily_history(user_data, git_service, translator, today):
+    xp = process_event(user_data, GamifyEvent(command="commit", args=["commit"], today=today), translator, git_service)
+
+    history = ActivityHistory(user_data)
+    assert history.get("commits", today) == 1
+    assert history.get("xp", today) == xp
+
+
+def test_render_heatmap_for_full_year_is_fast():
+    user_data = get_default_user_data("a@example.com")
+    history = ActivityHistory(user_data)
+    for offset in range(400):
+        history.series["commits"].append(offset % 7)
+    history.start = date.today().toordinal() - 399
+    history.flush()
+
+    started = time.perf_counter()
+    render_heatmap(user_data)
+    assert time.perf_counter() - started < 0.5
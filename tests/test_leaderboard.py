@@ -0,0 +1,77 @@
+"""Tests for the sidecar leaderboard index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gg_cli.core import UserRepository, get_default_user_data
+from gg_cli.leaderboard import LeaderboardIndex
+from gg_cli.main import app
+
+
+def _save_profile(repo: UserRepository, email: str, xp: int, streak: int = 0) -> None:
+    data = get_default_user_data(email)
+    data["user"]["xp"] = xp
+    data["stats"]["consecutive_commit_days"] = streak
+    data["achievements_unlocked"]["first_commit"] = "2026-01-01"
+    repo.save(data)
+
+
+def test_repository_save_updates_index_incrementally(tmp_path: Path):
+    """Each save should upsert the profile's leaderboard row."""
+    repo = UserRepository(tmp_path)
+    _save_profile(repo, "low@example.com", 10)
+    _save_profile(repo, "high@example.com", 500, streak=4)
+    _save_profile(repo, "low@example.com", 900)
+
+    top = repo.leaderboard_index.top(2)
+
+    assert [entry.email for entry in top] == ["low@example.com", "high@example.com"]
+    assert top[1].streak == 4
+    assert top[1].achievements == 1
+    assert repo.leaderboard_index.count() == 2
+
+
+def test_repository_delete_removes_index_row(tmp_path: Path):
+    """Resetting a profile should drop it from the leaderboard."""
+    repo = UserRepository(tmp_path)
+    _save_profile(repo, "gone@example.com", 10)
+
+    repo.delete("gone@example.com")
+
+    assert repo.leaderboard_index.count() == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_index_rebuild_reads_all_profile_files(tmp_path: Path, workers: int):
+    """A rebuild should index every profile, including flat-layout leftovers."""
+    repo = UserRepository(tmp_path)
+    for index in range(5):
+        _save_profile(repo, f"user{index}@example.com", index * 100)
+    repo.get_legacy_profile_path("flat@example.com").write_text(
+        '{"config": {"user_email": "flat@example.com"}, "user": {"xp": 9999, "level": 30}}',
+        encoding="utf-8",
+    )
+    repo.leaderboard_index.path.unlink()
+    repo.leaderboard_index.close()
+
+    fresh = LeaderboardIndex(tmp_path)
+    indexed = fresh.rebuild(repo.iter_profile_paths(), workers=workers)
+
+    assert indexed == 6
+    assert fresh.top(1)[0].email == "flat@example.com"
+
+
+@pytest.mark.allow_console_output
+def test_cli_leaderboard_lists_top_profiles(tmp_path: Path, monkeypatch, runner):
+    """The leaderboard command should render indexed identities."""
+    repo = UserRepository(tmp_path)
+    _save_profile(repo, "champion@example.com", 4000)
+    monkeypatch.setattr("gg_cli.main.get_user_repository", lambda: repo)
+
+    result = runner.invoke(app, ["leaderboard", "--top", "5"])
+
+    assert result.exit_code == 0
+    assert "champion@example.com" in result.stdout
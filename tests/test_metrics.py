@@ -0,0 +1,85 @@
+"""Tests for the optional Prometheus textfile metrics."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from gg_cli import metrics
+from gg_cli.metrics import LATENCY_BUCKETS, MetricsRegistry
+
+
+def _samples(path: Path) -> dict[str, float]:
+    samples = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_disabled_registry_records_nothing(tmp_path: Path):
+    registry = MetricsRegistry(None)
+    registry.inc("gg_events_total", command="commit")
+    with registry.timer("gg_profile_save_seconds") as timer:
+        pass
+    registry.flush()
+    assert timer is metrics._NULL_TIMER
+    assert not registry.enabled
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_flush_writes_histograms_and_counters(tmp_path: Path):
+    path = tmp_path / "gg.prom"
+    registry = MetricsRegistry(str(path))
+    registry.inc("gg_events_total", command="commit")
+    registry.inc("gg_events_total", command="commit")
+    registry.observe("gg_gamify_phase_seconds", 0.02, phase="save")
+    registry.observe("gg_gamify_phase_seconds", 3.0, phase="save")
+    registry.flush()
+
+    text = path.read_text(encoding="utf-8")
+    assert "# TYPE gg_events_total counter" in text
+    assert "# TYPE gg_gamify_phase_seconds histogram" in text
+    samples = _samples(path)
+    assert samples['gg_events_total{command="commit"}'] == 2
+    assert samples['gg_gamify_phase_seconds_bucket{phase="save",le="0.025"}'] == 1
+    assert samples['gg_gamify_phase_seconds_bucket{phase="save",le="5"}'] == 2
+    assert samples['gg_gamify_phase_seconds_bucket{phase="save",le="+Inf"}'] == 2
+    assert samples['gg_gamify_phase_seconds_count{phase="save"}'] == 2
+    assert samples['gg_gamify_phase_seconds_sum{phase="save"}'] == 3.02
+    assert len([name for name in samples if "_bucket" in name]) == len(LATENCY_BUCKETS) + 1
+
+
+def test_flushes_from_several_processes_add_up(tmp_path: Path):
+    path = tmp_path / "gg.prom"
+    for _ in range(3):
+        registry = MetricsRegistry(str(path))
+        registry.inc("gg_errors_total", kind='odd "quoted"\nkind')
+        registry.observe("gg_profile_save_seconds", 0.001)
+        registry.flush()
+        # A second flush without new samples leaves the file alone.
+        registry.flush()
+
+    samples = _samples(path)
+    assert samples['gg_errors_total{kind="odd \\"quoted\\"\\nkind"}'] == 3
+    assert samples['gg_profile_save_seconds_bucket{le="0.005"}'] == 3
+    assert samples["gg_profile_save_seconds_count"] == 3
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_gamify_logic_records_phases_and_events(tmp_path: Path, monkeypatch, user_data, git_service):
+    from gg_cli import gamify
+
+    registry = MetricsRegistry(str(tmp_path / "gg.prom"))
+    monkeypatch.setattr(metrics, "registry", registry)
+    monkeypatch.setattr(gamify, "load_user_data", lambda: user_data)
+    monkeypatch.setattr(gamify, "save_user_data", lambda data: None)
+
+    gamify.process_gamify_logic(["commit", "-m", "x"], git_service=git_service)
+    registry.flush()
+
+    samples = _samples(tmp_path / "gg.prom")
+    assert samples['gg_events_total{command="commit"}'] == 1
+    assert samples["gg_achievement_unlocks_total"] >= 1
+    for phase in ("load", "process", "render", "save"):
+        assert samples[f'gg_gamify_phase_seconds_count{{phase="{phase}"}}'] == 1
@@ -0,0 +1,122 @@
+"""Tests for achievement plugins discovered through entry points."""
+
+from __future__ import annotations
+
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from gg_cli import plugins
+from gg_cli.achievements import check_all_achievements
+from gg_cli.plugins import AchievementPlugin, PluginIndex, check_plugin
+from gg_cli.render import SilentRenderer
+
+PLUGIN_MODULE = "acme_gg_plugin"
+
+PLUGIN_SOURCE = '''
+from gg_cli.plugins import AchievementPlugin
+
+def _oncall(user_data, context):
+    return "INC-" in context.get("commit_message", "")
+
+def _broken(user_data, context):
+    raise RuntimeError("boom")
+
+plugin = AchievementPlugin(
+    events=("commit",),
+    achievements={
+        "acme_oncall": {"xp_reward": 25, "name": {"en": "On-call {hero}", "zh": "值班英雄"}, "desc": "Fix an incident."},
+        "acme_broken": {"xp_reward": 5, "name": "Broken", "desc": "Never unlocks."},
+    },
+    checkers={"acme_oncall": _oncall, "acme_broken": _broken},
+)
+
+clashing = AchievementPlugin(
+    events=("commit",),
+    achievements={"first_commit": {"xp_reward": 1, "name": "Mine", "desc": "Mine."}},
+    checkers={"first_commit": _oncall},
+)
+'''
+
+
+@pytest.fixture
+def site(tmp_path: Path, monkeypatch) -> Path:
+    """A fake site-packages directory holding one distribution with two entry points."""
+    site_dir = tmp_path / "site"
+    dist_info = site_dir / "acme_gg_plugin-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-gg-plugin\nVersion: 1.0\n", encoding="utf-8")
+    (dist_info / "entry_points.txt").write_text(
+        textwrap.dedent(
+            f"""\
+            [gg_cli.achievements]
+            oncall = {PLUGIN_MODULE}:plugin
+            clash = {PLUGIN_MODULE}:clashing
+            """
+        ),
+        encoding="utf-8",
+    )
+    (site_dir / f"{PLUGIN_MODULE}.py").write_text(PLUGIN_SOURCE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(site_dir))
+    yield site_dir
+    sys.modules.pop(PLUGIN_MODULE, None)
+
+
+@pytest.fixture
+def plugin_index(site: Path, tmp_path: Path, monkeypatch) -> PluginIndex:
+    """An index read back from disk, as a later `gg` process would, with the plugin not imported yet."""
+    cache_path = tmp_path / "plugins-cache.json"
+    PluginIndex(cache_path).entries()
+    sys.modules.pop(PLUGIN_MODULE, None)
+    plugin_index = PluginIndex(cache_path)
+    monkeypatch.setattr(plugins, "index", plugin_index)
+    return plugin_index
+
+
+def test_discovery_is_cached_until_site_packages_change(site: Path, tmp_path: Path, monkeypatch):
+    cache_path = tmp_path / "plugins-cache.json"
+    entries = {entry["name"]: entry for entry in PluginIndex(cache_path).entries()}
+    assert entries["oncall"]["events"] == ["commit"]
+    assert entries["oncall"]["error"] is None
+    assert "clashes with a built-in" in entries["clash"]["error"]
+    assert cache_path.exists()
+
+    # A fresh process reads the index without scanning or importing anything.
+    sys.modules.pop(PLUGIN_MODULE, None)
+    monkeypatch.setattr(plugins, "_entry_points", lambda: pytest.fail("entry points were rescanned"))
+    assert {entry["name"] for entry in PluginIndex(cache_path).entries()} == set(entries)
+    assert PLUGIN_MODULE not in sys.modules
+
+    stat = os.stat(site)
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(pytest.fail.Exception, match="rescanned"):
+        PluginIndex(cache_path).entries()
+
+
+def test_plugin_achievement_unlocks_on_subscribed_event(plugin_index, user_data, translator):
+    user_data["config"]["language"] = "zh"
+    check_all_achievements(user_data, translator, {"command": "push"}, SilentRenderer())
+    assert "acme_oncall" not in user_data["achievements_unlocked"]
+    assert PLUGIN_MODULE not in sys.modules
+
+    context = {"command": "commit", "commit_message": "fix: INC-42 restore quota"}
+    gained = check_all_achievements(user_data, translator, context, SilentRenderer())
+    assert "acme_oncall" in user_data["achievements_unlocked"]
+    assert "acme_broken" not in user_data["achievements_unlocked"]
+    assert gained >= 25
+    assert plugins.achievement_definitions("zh")["acme_oncall"]["name_key"] == "值班英雄"
+    assert plugins.achievement_definitions("en")["acme_oncall"]["name_key"] == "On-call {{hero}}"
+
+
+def test_check_plugin_reports_problems():
+    plugin = AchievementPlugin(
+        events="commit",
+        achievements={"x": {"xp_reward": True, "name": "", "desc": {"en": "ok"}}},
+        checkers={},
+    )
+    errors = check_plugin(plugin)
+    assert len(errors) == 4
+    assert check_plugin(object()) == ["Entry point does not refer to an AchievementPlugin."]
@@ -0,0 +1,143 @@
+"""Tests for the processor registry and the reflog-based processors."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from gg_cli import processors
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.git_service import GitService
+from gg_cli.processors import get_processor, recordable_commands, register_processor
+from gg_cli.rate_windows import RateWindows
+from gg_cli.reflog_processors import created_tag_name
+from gg_cli.render import SilentRenderer
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+def _commit(cwd: Path, name: str) -> None:
+    (cwd / name).write_text(f"{name}\n", encoding="utf-8")
+    _git(cwd, "add", name)
+    _git(cwd, "commit", "-q", "-m", f"add {name}")
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    _commit(tmp_path, "base.txt")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _run(user_data, translator, *args: str) -> int:
+    """Process `args` as a successful command; return the XP the shared cap recorded."""
+    before = RateWindows(user_data, time.time()).total("git_ops_xp")
+    event = GamifyEvent(command=args[0], args=list(args))
+    process_event(user_data, event, translator, GitService(), renderer=SilentRenderer())
+    return RateWindows(user_data, time.time()).total("git_ops_xp") - before
+
+
+@requires_git
+def test_merge_is_rewarded_once(repo: Path, user_data, translator):
+    _git(repo, "checkout", "-q", "-b", "topic")
+    _commit(repo, "topic.txt")
+    _git(repo, "checkout", "-q", "main")
+    _commit(repo, "main.txt")
+    _git(repo, "merge", "-q", "--no-edit", "topic")
+
+    assert _run(user_data, translator, "merge", "topic") == 4
+    # An "Already up to date." merge leaves the reflog untouched.
+    _git(repo, "merge", "-q", "topic")
+    assert _run(user_data, translator, "merge", "topic") == 0
+
+
+@requires_git
+def test_tag_creation_is_rewarded_but_listing_is_not(repo: Path, user_data, translator):
+    _git(repo, "tag", "-a", "v1.0", "-m", "release")
+
+    assert _run(user_data, translator, "tag", "-a", "v1.0", "-m", "release") == 3
+    assert _run(user_data, translator, "tag", "-a", "v1.0", "-m", "release") == 0
+    assert _run(user_data, translator, "tag", "-l") == 0
+    assert user_data["stats"]["total_commits"] == 0
+
+
+@requires_git
+def test_cherry_pick_and_revert_share_the_cap(repo: Path, user_data, translator):
+    _git(repo, "checkout", "-q", "-b", "topic")
+    _commit(repo, "fix.txt")
+    fix = _git(repo, "rev-parse", "HEAD").strip()
+    _git(repo, "checkout", "-q", "main")
+    _git(repo, "cherry-pick", fix)
+    assert _run(user_data, translator, "cherry-pick", fix) == 2
+
+    _git(repo, "revert", "--no-edit", "HEAD")
+    assert _run(user_data, translator, "revert", "HEAD") == 2
+
+    user_data["windows"]["git_ops_xp"].append([time.time(), 7])
+    _git(repo, "revert", "--no-edit", "HEAD")
+    assert _run(user_data, translator, "revert", "HEAD") == 1
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["tag", "v1"], "v1"),
+        (["tag", "-a", "-m", "v2 notes", "v2", "HEAD~1"], "v2"),
+        (["tag", "-s", "v3"], "v3"),
+        (["tag"], None),
+        (["tag", "-l", "v*"], None),
+        (["tag", "-d", "v1"], None),
+        (["tag", "--cleanup", "verbatim", "-m", "notes", "v4"], "v4"),
+        (["tag", "--merged", "main"], None),
+        (["tag", "--no-merged", "main"], None),
+        (["tag", "--contains", "HEAD", "v*"], None),
+        (["tag", "--format=%(refname:short)"], None),
+        (["tag", "--format", "%(refname)", "v*"], None),
+        (["tag", "--sort=-creatordate"], None),
+        (["tag", "-n"], None),
+        (["tag", "-n3", "v*"], None),
+        (["tag", "--column=always"], None),
+        (["tag", "-i", "V*"], None),
+    ],
+)
+def test_created_tag_name(args, expected):
+    assert created_tag_name(args) == expected
+
+
+def test_register_processor_is_lazy_and_validates_metadata(monkeypatch):
+    monkeypatch.setattr(processors, "PROCESSORS", dict(processors.PROCESSORS))
+    monkeypatch.setattr(processors, "_INSTANCES", {})
+    with pytest.raises(ValueError, match="Unknown git metadata"):
+        register_processor("stash", "gg_cli.reflog_processors:MergeProcessor", frozenset({"stash"}))
+
+    register_processor("pull", "gg_cli.reflog_processors:MergeProcessor", frozenset({"reflog"}))
+    assert "pull" not in recordable_commands()
+    assert "commit" in recordable_commands()
+    assert get_processor("pull") is get_processor("pull")
+    assert get_processor("status") is None
+
+
+def test_wrapper_import_skips_the_engine():
+    code = "import sys, gg_cli.wrapper; print('gg_cli.gamify' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_processor_requires_process():
+    class Incomplete(processors.Processor):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,71 @@
+"""Tests for the shell prompt segment."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+from gg_cli import prompt
+from gg_cli.core import get_default_user_data
+
+
+def _status_for(tmp_path: Path, email: str, xp: int, aliases: dict | None = None) -> dict:
+    data = get_default_user_data(email)
+    data["user"] = {"xp": xp, "level": 2}
+    data["stats"]["consecutive_commit_days"] = 5
+    data["stats"]["last_commit_date"] = date.today().isoformat()
+    prompt.write_status(str(tmp_path), data, aliases or {})
+    return prompt.read_status(str(tmp_path / prompt.STATUS_FILENAME))
+
+
+def test_render_segment_uses_format_and_aliases(tmp_path: Path):
+    status = _status_for(tmp_path, "me@example.com", 250, aliases={"work@corp.example": "me@example.com"})
+
+    assert prompt.render_segment(status, "work@corp.example") == "Lv2 250xp 5d"
+    assert prompt.render_segment(status, "me@example.com", "{level}|{xp_to_next}|{progress}%") == "2|190|13%"
+
+
+def test_render_segment_falls_back_and_expires_streak(tmp_path: Path):
+    status = _status_for(tmp_path, "me@example.com", 250)
+    status["identities"]["me@example.com"]["last_commit_date"] = "2020-01-01"
+
+    assert prompt.render_segment(status, "unknown@example.com") == "Lv2 250xp 0d"
+    assert prompt.render_segment(status, None, "{bogus}") == "Lv2 250xp 0d"
+    assert prompt.render_segment(None, "me@example.com") == ""
+
+
+def test_find_git_email_prefers_repo_config(tmp_path: Path, monkeypatch):
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / ".gitconfig").write_text("[user]\n\tname = Me\n\temail = global@example.com\n", encoding="utf-8")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    repo = tmp_path / "repo"
+    (repo / ".git").mkdir(parents=True)
+    (repo / "sub").mkdir()
+
+    assert prompt.find_git_email(str(repo / "sub")) == "global@example.com"
+    (repo / ".git" / "config").write_text('[user]\n\temail = "local@example.com"\n', encoding="utf-8")
+    assert prompt.find_git_email(str(repo / "sub")) == "local@example.com"
+
+
+def test_main_prints_segment_quickly(tmp_path: Path, monkeypatch, capsys):
+    _status_for(tmp_path, "me@example.com", 250)
+    monkeypatch.setattr(prompt, "DATA_DIR", str(tmp_path))
+
+    started = time.perf_counter()
+    for _ in range(20):
+        prompt.main(["--format", "{level}:{streak}"])
+    elapsed = (time.perf_counter() - started) / 20
+
+    assert capsys.readouterr().out.splitlines()[0] == "2:5"
+    assert elapsed < 0.005
+
+
+def test_prompt_module_imports_nothing_heavy():
+    code = "import sys, gg_cli.prompt; print(sorted(m for m in ('rich', 'typer', 'json', 'typing', 'gg_cli.utils') if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
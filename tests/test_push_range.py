@@ -0,0 +1,118 @@
+"""Tests for git-backed diff sizing, push range resolution and push scoring."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.git_service import GitService, PushSummary, parse_push_report
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _commit(cwd: Path, name: str, lines: int) -> None:
+    (cwd / name).write_text("".join(f"{i}\n" for i in range(lines)), encoding="utf-8")
+    _git(cwd, "add", name)
+    _git(cwd, "commit", "-q", "-m", f"add {name}")
+
+
+@pytest.fixture
+def clone(tmp_path: Path, monkeypatch) -> Path:
+    remote = tmp_path / "remote.git"
+    work = tmp_path / "work"
+    _git(tmp_path, "init", "-q", "--bare", "-b", "main", str(remote))
+    _git(tmp_path, "clone", "-q", str(remote), str(work))
+    _git(work, "config", "user.email", "test@example.com")
+    _git(work, "config", "user.name", "Test")
+    _git(work, "checkout", "-q", "-b", "main")
+    _commit(work, "base.txt", 1)
+    _git(work, "push", "-q", "-u", "origin", "main")
+    monkeypatch.chdir(work)
+    return work
+
+
+def _push(cwd: Path, *args: str) -> str:
+    result = subprocess.run(["git", "push", *args], cwd=cwd, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stderr
+
+
+@requires_git
+def test_summarize_push_counts_fast_forward_range(clone: Path):
+    """Updated refs should contribute exactly the commits between old and new tips."""
+    _commit(clone, "a.txt", 3)
+    _commit(clone, "b.txt", 4)
+    refs = parse_push_report(_push(clone))
+
+    summary = GitService().summarize_push(refs)
+
+    assert summary.commits == 2
+    assert summary.insertions == 7
+
+
+@requires_git
+def test_summarize_push_resolves_new_branch_tip(clone: Path):
+    """New branches should count only commits not already on the remote."""
+    _git(clone, "checkout", "-q", "-b", "topic")
+    _commit(clone, "c.txt", 2)
+    tip = _git(clone, "rev-parse", "HEAD").strip()
+    refs = parse_push_report(_push(clone, "origin", "topic"))
+
+    summary = GitService().summarize_push(refs)
+
+    assert summary.commits == 1
+    assert summary.tips["topic"] == tip
+
+
+@requires_git
+def test_last_commit_diff_counts_first_parent_numstat(clone: Path):
+    """Diff sizing should sum numstat lines of the newest commit."""
+    _commit(clone, "a.txt", 5)
+
+    diff = GitService().get_last_commit_diff()
+
+    assert (diff.files, diff.insertions, diff.deletions, diff.truncated) == (1, 5, 0, False)
+
+
+@requires_git
+def test_last_commit_diff_stops_at_file_budget(clone: Path):
+    """Commits wider than the file budget should return a truncated lower bound."""
+    for index in range(5):
+        (clone / f"wide{index}.txt").write_text("x\n", encoding="utf-8")
+    _git(clone, "add", ".")
+    _git(clone, "commit", "-q", "-m", "wide")
+
+    diff = GitService().get_last_commit_diff(max_files=2)
+
+    assert diff.truncated is True
+    assert diff.files == 2
+
+
+def test_push_event_awards_capped_range_bonus(user_data_factory, translator, git_service):
+    """Pushed commits should add a bonus bounded per push and per 24 hours."""
+    data = user_data_factory()
+    data["achievements_unlocked"]["first_push"] = "2026-01-01"
+    git_service.push_summary = PushSummary(commits=40, insertions=300, deletions=20)
+    report = "To origin\n   1a2b3c4..5d6e7f8  main -> main\n"
+    today = date(2026, 2, 3)
+
+    first = GamifyEvent("push", ["push"], today=today, git_output=report)
+    xp_first = process_event(data, first, translator=translator, git_service=git_service)
+
+    assert first.context["push_commits"] == 40
+    assert "convoy" in data["achievements_unlocked"]
+    assert data["stats"]["total_pushed_commits"] == 40
+    assert data["stats"]["total_pushed_lines"] == 320
+    assert sum(xp for _, xp in data["windows"]["push_bonus"]) == 5
+    assert xp_first >= 12 + 5
@@ -0,0 +1,68 @@
+"""Tests for rolling-window reward limits."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.profile_merge import merge_profiles
+from gg_cli.rate_windows import RateWindows
+
+
+def _commit_at(data, translator, git_service, moment: datetime) -> int:
+    event = GamifyEvent("commit", ["commit"], today=moment.date(), timestamp=moment.timestamp())
+    return process_event(data, event, translator=translator, git_service=git_service)
+
+
+def test_midnight_burst_does_not_reset_commit_rewards(user_data_factory, translator, git_service):
+    data = user_data_factory()
+    data["achievements_unlocked"]["first_commit"] = "2026-01-01"
+    for minute in range(6):
+        _commit_at(data, translator, git_service, datetime(2026, 3, 1, 23, 50 + minute))
+
+    after_midnight = _commit_at(data, translator, git_service, datetime(2026, 3, 2, 0, 1))
+    next_day = _commit_at(data, translator, git_service, datetime(2026, 3, 3, 0, 0))
+
+    assert data["stats"]["daily_commit_count"] == 1  # The calendar counter still resets.
+    assert after_midnight < next_day
+
+
+def test_windows_stay_bounded_at_any_rate(user_data_factory, translator, git_service):
+    data = user_data_factory()
+    for second in range(300):
+        _commit_at(data, translator, git_service, datetime(2026, 3, 1, 12, second // 60, second % 60))
+        event = GamifyEvent("push", ["push"], today=date(2026, 3, 1), timestamp=datetime(2026, 3, 1, 13).timestamp())
+        process_event(data, event, translator=translator, git_service=git_service)
+
+    windows = data["windows"]
+    assert len(windows["commits"]) <= 13
+    assert sum(xp for _, xp in windows["push_xp"]) == 12
+    assert len(windows["push_xp"]) <= 12
+
+
+def test_push_cap_frees_up_after_the_window():
+    data = {}
+    start = datetime(2026, 3, 1, 20).timestamp()
+    assert RateWindows(data, start).earn("push_xp", 12, 12) == 12
+    assert RateWindows(data, start + 3600 * 12).earn("push_xp", 12, 12) == 0
+    assert RateWindows(data, start + 3600 * 24).earn("push_xp", 4, 12) == 4
+    assert data["windows"]["push_xp"] == [[int(start) + 3600 * 24, 4]]
+
+
+def test_hit_counts_saturate_past_capacity():
+    data = {}
+    counts = [RateWindows(data, 1000 + i).hit("commits", 3) for i in range(6)]
+    assert counts == [1, 2, 3, 4, 4, 4]
+    assert len(data["windows"]["commits"]) == 3
+
+
+def test_merge_keeps_entries_in_time_order(user_data_factory):
+    first, second = user_data_factory(), user_data_factory()
+    RateWindows(first, 200).hit("commits", 5)
+    RateWindows(second, 100).hit("commits", 5)
+    RateWindows(second, 300).earn("push_xp", 4, 12)
+
+    merged = merge_profiles(first, second)
+
+    assert merged["windows"]["commits"] == [100, 200]
+    assert merged["windows"]["push_xp"] == [[300, 4]]
@@ -0,0 +1,153 @@
+"""Tests for replaying git history under candidate XP rules."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gg_cli.core import UserRepository, get_default_user_data
+from gg_cli.gamify import DEFAULT_XP_RULES
+from gg_cli.rebalance import RebalanceError, apply_rebalance, collect_history, plan_rebalance, read_repo_history
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(cwd: Path, *args: str, env: dict[str, str] | None = None) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True, env={**os.environ, **(env or {})}
+    ).stdout
+
+
+def _commit(cwd: Path, email: str, day: str, name: str, lines: int) -> None:
+    (cwd / name).write_text("".join(f"{i}\n" for i in range(lines)), encoding="utf-8")
+    _git(cwd, "add", name)
+    stamp = f"{day}T12:00:00"
+    env = {"GIT_AUTHOR_EMAIL": email, "GIT_AUTHOR_DATE": stamp, "GIT_COMMITTER_DATE": stamp}
+    _git(cwd, "commit", "-q", "-m", f"add {name}", env=env)
+
+
+@pytest.fixture
+def history_repo(tmp_path: Path) -> Path:
+    work = tmp_path / "work"
+    work.mkdir()
+    _git(work, "init", "-q", "-b", "main")
+    _git(work, "config", "user.email", "alice@example.com")
+    _git(work, "config", "user.name", "Test")
+    _commit(work, "alice@example.com", "2024-03-01", "a1.txt", 5)
+    _commit(work, "bob@example.com", "2024-03-01", "b1.txt", 90)
+    _commit(work, "Alice@Example.com", "2024-03-02", "a2.txt", 30)
+    _commit(work, "alice@example.com", "2024-03-04", "a3.txt", 250)
+    return work
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> UserRepository:
+    repo = UserRepository(tmp_path / "data")
+    for email, xp in (("alice@example.com", 200), ("bob@example.com", 40)):
+        profile = get_default_user_data(email)
+        profile["user"]["xp"] = xp
+        repo.save(profile)
+    return repo
+
+
+@requires_git
+def test_history_is_grouped_by_author_with_diff_sizes(history_repo: Path):
+    history = read_repo_history(str(history_repo))
+
+    assert sorted(history) == ["alice@example.com", "bob@example.com"]
+    alice = history["alice@example.com"]
+    assert [commit.diff.insertions for commit in alice] == [5, 30, 250]
+    assert [commit.day for commit in alice] == sorted(commit.day for commit in alice)
+    assert alice[0].message == "add a1.txt"
+    assert read_repo_history(str(history_repo), emails=["bob@example.com"]).keys() == {"bob@example.com"}
+
+
+@requires_git
+def test_parallel_collection_merges_repositories(history_repo: Path, tmp_path: Path):
+    other = tmp_path / "other"
+    shutil.copytree(history_repo, other)
+    _commit(other, "alice@example.com", "2024-03-03", "a4.txt", 1)
+
+    sequential = collect_history([str(history_repo), str(other)], workers=1)
+    parallel = collect_history([str(history_repo), str(other)], workers=2)
+
+    assert len(sequential["alice@example.com"]) == 7
+    days = [commit.day for commit in sequential["alice@example.com"]]
+    assert days == sorted(days)
+    assert [c.sha for c in parallel["alice@example.com"]] == [c.sha for c in sequential["alice@example.com"]]
+
+
+@requires_git
+def test_unchanged_rules_give_zero_delta(history_repo: Path, repository: UserRepository):
+    history = collect_history([str(history_repo)])
+    planned = list(plan_rebalance(repository, history, dict(DEFAULT_XP_RULES)))
+    assert [entry.delta for entry, _ in planned] == [0, 0]
+
+
+@requires_git
+def test_apply_replaces_previous_delta(history_repo: Path, repository: UserRepository):
+    rules = {**DEFAULT_XP_RULES, "commit_base": DEFAULT_XP_RULES["commit_base"] + 5}
+    history = collect_history([str(history_repo)])
+
+    planned = list(plan_rebalance(repository, history, rules))
+    alice = planned[0][0]
+    assert alice.email == "alice@example.com" and alice.commits == 3
+    assert alice.delta == 15
+    assert apply_rebalance(repository, planned, rules) == 2
+
+    saved = repository.find("alice@example.com")
+    assert saved["user"]["xp"] == 215
+    assert saved["rebalance"]["xp_delta"] == 15
+
+    # Applying the same rules again is a no-op rather than a second bonus.
+    apply_rebalance(repository, list(plan_rebalance(repository, history, rules)), rules)
+    assert repository.find("alice@example.com")["user"]["xp"] == 215
+
+    # Going back to the engine's rules restores the original XP.
+    apply_rebalance(repository, list(plan_rebalance(repository, history, dict(DEFAULT_XP_RULES))), DEFAULT_XP_RULES)
+    assert repository.find("alice@example.com")["user"]["xp"] == 200
+
+
+@requires_git
+def test_repo_overrides_win_over_baseline_and_candidate(history_repo: Path, repository: UserRepository):
+    base = DEFAULT_XP_RULES["commit_base"]
+    (history_repo / ".gamify.json").write_text(json.dumps({"xp_rules": {"commit_base": base + 10}}), encoding="utf-8")
+    history = collect_history([str(history_repo)])
+    assert history["alice@example.com"][0].xp_overrides == {"commit_base": base + 10}
+
+    # The repository pins commit_base, so changing it in the candidate rules changes nothing.
+    pinned = {**DEFAULT_XP_RULES, "commit_base": base + 5}
+    assert [entry.delta for entry, _ in plan_rebalance(repository, history, pinned)] == [0, 0]
+    # Rules the repository does not override still apply.
+    tiers = {**DEFAULT_XP_RULES, "commit_change_tier1": DEFAULT_XP_RULES["commit_change_tier1"] + 1000}
+    assert any(entry.delta for entry, _ in plan_rebalance(repository, history, tiers))
+
+    (history_repo / ".gamify.json").write_text("[]", encoding="utf-8")
+    with pytest.raises(RebalanceError, match="Cannot read XP rules"):
+        read_repo_history(str(history_repo))
+
+
+@requires_git
+def test_cli_dry_run_does_not_save(history_repo: Path, repository: UserRepository, tmp_path: Path, runner, monkeypatch):
+    from gg_cli.main import app
+
+    monkeypatch.setattr("gg_cli.main.get_user_repository", lambda: repository)
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps({"xp_rules": {"commit_base": 20}}), encoding="utf-8")
+    args = ["rebalance", "--rules", str(rules_path), "--repo", str(history_repo), "--workers", "1"]
+
+    result = runner.invoke(app, [*args, "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert repository.find("bob@example.com")["user"]["xp"] == 40
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert repository.find("bob@example.com")["user"]["xp"] == 52
+
+    rules_path.write_text(json.dumps({"level_tiers": [[100, 50]]}), encoding="utf-8")
+    assert runner.invoke(app, args).exit_code == 1
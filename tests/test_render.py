@@ -0,0 +1,105 @@
+"""Tests for the pluggable gamify output renderers."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.render import (
+    PlainRenderer,
+    Renderer,
+    RichRenderer,
+    SilentRenderer,
+    get_renderer,
+    resolve_output_mode,
+    strip_markup,
+)
+
+
+class RecordingRenderer(Renderer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[list[tuple]] = []
+
+    def _write(self, items):
+        self.writes.append(items)
+
+
+class CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.write_calls = 0
+
+    def write(self, text: str) -> int:
+        self.write_calls += 1
+        return super().write(text)
+
+
+def test_strip_markup_keeps_text_and_escaped_brackets():
+    assert strip_markup("[bold cyan]Hi[/bold cyan] [dim]there[/] \\[x]") == "Hi there [x]"
+
+
+def test_plain_renderer_buffers_event_into_one_write(monkeypatch):
+    stream = CountingStream()
+    monkeypatch.setattr("sys.stdout", stream)
+    renderer = PlainRenderer()
+    renderer.line("[green]+10 XP[/green]")
+    renderer.panel("[bold]Name[/bold]\nDesc", title="Unlocked")
+
+    assert stream.write_calls == 0
+    renderer.flush()
+
+    assert stream.write_calls == 1
+    assert stream.getvalue() == "+10 XP\n== Unlocked ==\n  Name\n  Desc\n"
+
+
+@pytest.mark.parametrize(
+    ("env", "configured", "expected"),
+    [
+        ("silent", "rich", "silent"),
+        (None, "plain", "plain"),
+        (None, "auto", "plain"),  # pytest's captured stdout is not a TTY
+        (None, None, "plain"),
+    ],
+)
+def test_resolve_output_mode(monkeypatch, env, configured, expected):
+    if env:
+        monkeypatch.setenv("GG_OUTPUT", env)
+    else:
+        monkeypatch.delenv("GG_OUTPUT", raising=False)
+    assert resolve_output_mode(configured) == expected
+
+
+def test_get_renderer_types(monkeypatch):
+    monkeypatch.delenv("GG_OUTPUT", raising=False)
+    assert isinstance(get_renderer("rich"), RichRenderer)
+    assert isinstance(get_renderer("plain"), PlainRenderer)
+    assert isinstance(get_renderer("silent"), SilentRenderer)
+    with pytest.raises(TypeError):
+        Renderer()
+
+
+def test_rich_renderer_prints_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr("gg_cli.utils.console.print", lambda *args, **kwargs: calls.append(args))
+    renderer = RichRenderer()
+    renderer.line("one")
+    renderer.panel("two", title="t")
+    renderer.flush()
+
+    assert len(calls) == 1
+
+
+def test_process_event_routes_all_feedback_through_renderer(user_data, git_service, translator, today):
+    renderer = RecordingRenderer()
+    event = GamifyEvent(command="commit", args=["commit"], today=today)
+
+    process_event(user_data, event, translator, git_service=git_service, renderer=renderer)
+    assert renderer.writes == []
+
+    renderer.flush()
+    kinds = [item[0] for item in renderer.writes[0]]
+    assert "panel" in kinds  # first_commit unlock
+    assert "line" in kinds  # XP summary
@@ -0,0 +1,94 @@
+"""Tests for per-repository XP rule overrides."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from gg_cli import repo_rules
+from gg_cli.definitions_loader import load_xp_rules
+from gg_cli.repo_rules import RepoRulesError, clear_repo_rules_cache, resolve_xp_rules
+
+
+@pytest.fixture(autouse=True)
+def fresh_overrides():
+    clear_repo_rules_cache()
+    yield
+    clear_repo_rules_cache()
+
+
+@pytest.fixture
+def worktree(tmp_path: Path) -> Path:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "docs").mkdir()
+    return tmp_path
+
+
+def _touch_later(path: Path) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+def test_without_override_the_builtin_rules_are_used(worktree: Path, tmp_path: Path):
+    assert resolve_xp_rules(worktree / "docs") is load_xp_rules()
+    assert resolve_xp_rules(tmp_path.parent) is load_xp_rules()
+
+
+def test_toml_override_is_merged_from_a_subdirectory(worktree: Path):
+    (worktree / ".gamify.toml").write_text("[xp_rules]\ncommit_base = 0\npush_base = 0\n", encoding="utf-8")
+    rules = resolve_xp_rules(worktree / "docs")
+    assert rules["commit_base"] == 0 and rules["push_base"] == 0
+    assert rules["commit_change_tier1"] == load_xp_rules()["commit_change_tier1"]
+
+
+def test_override_is_memoized_until_the_file_changes(worktree: Path, monkeypatch):
+    path = worktree / ".gamify.json"
+    path.write_text(json.dumps({"xp_rules": {"commit_base": 20}}), encoding="utf-8")
+    parsed = []
+    real_parse = repo_rules.parse_override_file
+    monkeypatch.setattr(repo_rules, "parse_override_file", lambda p: parsed.append(p) or real_parse(p))
+
+    for _ in range(50):
+        assert resolve_xp_rules(worktree)["commit_base"] == 20
+    assert len(parsed) == 1
+
+    path.write_text(json.dumps({"xp_rules": {"commit_base": 30}}), encoding="utf-8")
+    _touch_later(path)
+    assert resolve_xp_rules(worktree)["commit_base"] == 30
+    assert len(parsed) == 2
+
+    path.unlink()
+    assert resolve_xp_rules(worktree)["commit_base"] == load_xp_rules()["commit_base"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"xp_rules": {"commit_bonus": 3}},
+        {"xp_rules": {"commit_base": -1}},
+        {"xp_rules": {"commit_base": "8"}},
+        {"rules": {}},
+    ],
+)
+def test_invalid_override_raises(worktree: Path, payload):
+    (worktree / ".gamify.json").write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(RepoRulesError):
+        resolve_xp_rules(worktree)
+
+
+def test_invalid_override_falls_back_during_gamify(worktree: Path, monkeypatch, user_data):
+    from gg_cli import gamify
+
+    (worktree / ".gamify.json").write_text("{not json", encoding="utf-8")
+    monkeypatch.chdir(worktree)
+    used = {}
+    monkeypatch.setattr(gamify, "load_user_data", lambda: user_data)
+    monkeypatch.setattr(gamify, "save_user_data", lambda data: None)
+    monkeypatch.setattr(gamify, "process_event", lambda *args, **kwargs: used.update(kwargs))
+
+    gamify.process_gamify_logic(["commit", "-m", "x"])
+
+    assert used["xp_rules"] is load_xp_rules()
@@ -0,0 +1,89 @@
+"""Tests for per-repository activity counters."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gg_cli.core import get_default_user_data
+from gg_cli.gamify import GamifyEvent, process_event
+from gg_cli.repo_stats import (
+    OTHER_REPOS_KEY,
+    REPO_STATS_LIMIT,
+    find_repo_id,
+    merge_repo_stats,
+    normalize_remote_url,
+    record_repo_activity,
+)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "git@github.com:DeerYang/git-gamify.git",
+        "https://token@GitHub.com/DeerYang/git-gamify",
+        "ssh://git@github.com:22/DeerYang/git-gamify.git/",
+    ],
+)
+def test_equivalent_remote_urls_share_one_id(url: str):
+    assert normalize_remote_url(url) == "github.com/DeerYang/git-gamify"
+
+
+def test_find_repo_id_reads_origin_without_git(tmp_path: Path):
+    """The ID should come from .git/config, also from nested dirs and worktrees."""
+    git_dir = tmp_path / "main" / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text(
+        '[core]\n\tbare = false\n[remote "upstream"]\n\turl = git@host.example:team/a.git\n'
+        '[remote "origin"]\n\turl = https://host.example/me/a.git\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n',
+        encoding="utf-8",
+    )
+    nested = tmp_path / "main" / "src" / "pkg"
+    nested.mkdir(parents=True)
+    worktree_meta = git_dir / "worktrees" / "wt"
+    worktree_meta.mkdir(parents=True)
+    (worktree_meta / "commondir").write_text("../..\n", encoding="utf-8")
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {worktree_meta}\n", encoding="utf-8")
+
+    assert find_repo_id(nested) == "host.example/me/a"
+    assert find_repo_id(worktree) == "host.example/me/a"
+    assert find_repo_id(tmp_path) is None
+
+
+def test_repo_without_remote_falls_back_to_root_path(tmp_path: Path):
+    (tmp_path / ".git").mkdir()
+    assert find_repo_id(tmp_path) == f"path:{tmp_path.resolve()}"
+
+
+def test_repo_section_is_bounded_with_other_bucket():
+    """Low-XP repositories fold into the bucket; the active one is never evicted."""
+    user_data = get_default_user_data("a@example.com")
+    for index in range(REPO_STATS_LIMIT + 3):
+        record_repo_activity(user_data, f"repo{index}", "commit", 10 + index, "2026-01-01")
+    record_repo_activity(user_data, "fresh", "push", 0, "2026-01-02")
+
+    repos = user_data["repos"]
+    assert len(repos) == REPO_STATS_LIMIT + 1
+    assert "fresh" in repos
+    assert repos[OTHER_REPOS_KEY]["commits"] == 4
+    assert sum(entry["xp"] for entry in repos.values()) == sum(10 + i for i in range(REPO_STATS_LIMIT + 3))
+
+
+def test_merge_repo_stats_sums_matching_repos():
+    merged = merge_repo_stats(
+        {"r": {"commits": 1, "pushes": 0, "xp": 5, "last_active": "2026-01-01"}},
+        {"r": {"commits": 2, "pushes": 1, "xp": 7, "last_active": "2026-02-01"}},
+    )
+    assert merged["r"] == {"commits": 3, "pushes": 1, "xp": 12, "last_active": "2026-02-01"}
+
+
+def test_process_event_attributes_xp_to_repo(user_data, git_service, translator, today):
+    event = GamifyEvent(command="commit", args=["commit"], today=today, repo_id="github.com/me/app")
+
+    xp = process_event(user_data, event, translator, git_service=git_service)
+
+    entry = user_data["repos"]["github.com/me/app"]
+    assert (entry["commits"], entry["xp"], entry["last_active"]) == (1, xp, today.isoformat())
@@ -0,0 +1,79 @@
+"""Tests for machine-readable reports."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gg_cli import report
+from gg_cli.core import UserRepository, get_default_user_data
+from gg_cli.main import app
+
+
+@pytest.fixture
+def repository(tmp_path: Path, monkeypatch) -> UserRepository:
+    repo = UserRepository(tmp_path)
+    data = get_default_user_data("me@example.com")
+    data["user"] = {"xp": 250, "level": 2}
+    data["stats"]["total_commits"] = 12
+    data["achievements_unlocked"] = {"streak_3": "2026-02-01", "first_commit": "2026-01-01"}
+    repo.save(data)
+    monkeypatch.setattr(report, "get_user_repository", lambda: repo)
+    monkeypatch.setattr(report, "get_current_git_email", lambda: "me@example.com")
+    return repo
+
+
+def test_profile_report_schema(repository):
+    payload, code = report.run("profile")
+
+    assert code == 0
+    assert payload["schema_version"] == report.SCHEMA_VERSION
+    assert (payload["email"], payload["level"], payload["xp"]) == ("me@example.com", 2, 250)
+    assert payload["progress"] == {"current": 30, "total": 220, "percent": 13.6, "xp_to_next_level": 190}
+    assert payload["stats"]["total_commits"] == 12
+    assert [(a["id"], a["unlocked_on"]) for a in payload["achievements"]] == [
+        ("first_commit", "2026-01-01"),
+        ("streak_3", "2026-02-01"),
+    ]
+
+
+def test_multiple_emails_return_a_list_without_creating_profiles(repository):
+    payload, code = report.run("profile", ["me@example.com", "ghost@example.com"], stats=True)
+
+    assert code == 0
+    assert payload[0]["stats"]["total_commits"] == 12
+    assert payload[1] == {"schema_version": report.SCHEMA_VERSION, "email": "ghost@example.com", "error": "profile not found"}
+    assert repository.find("ghost@example.com") is None
+
+
+def test_achievements_report_can_include_locked(repository):
+    payload, _ = report.run("achievements", include_locked=True)
+
+    unlocked = [entry for entry in payload["achievements"] if entry["unlocked"]]
+    assert len(unlocked) == 2
+    assert len(payload["achievements"]) > 2
+    assert all(entry["unlocked_on"] is None for entry in payload["achievements"][2:])
+
+
+def test_cli_profile_json_writes_plain_json(repository, runner):
+    result = runner.invoke(app, ["profile", "--json", "--email", "me@example.com"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)[0]["level"] == 2
+
+
+def test_json_entry_path_never_imports_rich(tmp_path: Path):
+    code = (
+        "import sys; sys.argv = ['gg', 'achievements', '--json', '--email', 'nobody@example.com']\n"
+        "from gg_cli.entry import cli_entry\n"
+        "try:\n    cli_entry()\nexcept SystemExit:\n    pass\n"
+        "sys.stderr.write(str(sorted(m for m in ('rich', 'typer') if m in sys.modules)))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert json.loads(result.stdout)[0]["error"] == "profile not found"
+    assert result.stderr.strip() == "[]"
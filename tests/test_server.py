@@ -0,0 +1,165 @@
+"""Tests for the asyncio ingestion/leaderboard server, exercised over localhost."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gg_cli.core import UserRepository
+from gg_cli.server import EventPayloadError, GamifyServer, event_from_payload
+
+
+async def _request(host: str, port: int, method: str, path: str, payload: Any = None) -> tuple[int, Any]:
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode("latin-1")
+        + body
+    )
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, response_body = raw.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, json.loads(response_body)
+
+
+def _commit(email: str, sha: str, day: str = "2026-02-02") -> dict[str, Any]:
+    return {
+        "email": email,
+        "command": "commit",
+        "date": day,
+        "sha": sha,
+        "message": "fix: flaky test",
+        "diff": {"files": 1, "insertions": 30, "deletions": 5},
+    }
+
+
+def _run(tmp_path: Path, scenario) -> Any:
+    async def _main():
+        server = GamifyServer(UserRepository(tmp_path), snapshot_interval=3600)
+        host, port = await server.start("127.0.0.1", 0)
+        try:
+            return await scenario(server, host, port)
+        finally:
+            await server.stop()
+
+    return asyncio.run(_main())
+
+
+def test_server_ingests_batches_and_serves_leaderboard(tmp_path: Path):
+    """Batched events should update per-identity state visible via the JSON API."""
+
+    async def scenario(server, host, port):
+        status, result = await _request(
+            host,
+            port,
+            "POST",
+            "/events",
+            [
+                _commit("ana@example.com", "a1"),
+                _commit("ana@example.com", "a2"),
+                _commit("ana@example.com", "a1"),
+                _commit("bo@example.com", "b1"),
+                {"email": "bo@example.com", "command": "rm"},
+            ],
+        )
+        assert status == 200
+        assert result["accepted"] == 4
+        assert result["rejected"] == 1
+
+        status, board = await _request(host, port, "GET", "/leaderboard?limit=1")
+        assert status == 200
+        assert [row["email"] for row in board["leaderboard"]] == ["ana@example.com"]
+
+        status, profile = await _request(host, port, "GET", "/profiles/ana%40example.com")
+        assert status == 200
+        # The replayed SHA "a1" must not be counted twice.
+        assert profile["stats"]["total_commits"] == 2
+        assert "bug_hunter" in profile["achievements_unlocked"]
+
+    _run(tmp_path, scenario)
+
+    # Stopping the server snapshots dirty profiles to disk.
+    assert UserRepository(tmp_path).load("bo@example.com")["stats"]["total_commits"] == 1
+
+
+def test_server_rejects_bad_requests(tmp_path: Path):
+    """Malformed bodies, unknown paths and wrong methods should map to HTTP errors."""
+
+    async def scenario(server, host, port):
+        assert (await _request(host, port, "GET", "/events"))[0] == 405
+        assert (await _request(host, port, "POST", "/events", {"events": "nope"}))[0] == 400
+        assert (await _request(host, port, "GET", "/profiles/missing@example.com"))[0] == 404
+        assert (await _request(host, port, "GET", "/nowhere"))[0] == 404
+
+    _run(tmp_path, scenario)
+
+
+def test_event_payload_timestamp():
+    """An explicit timestamp is kept; a non-numeric one is rejected."""
+    event, _ = event_from_payload({**_commit("a@example.com", "1" * 40), "timestamp": 1770040800})
+    assert event.timestamp == 1770040800.0
+    with pytest.raises(EventPayloadError):
+        event_from_payload({**_commit("a@example.com", "1" * 40), "timestamp": "noon"})
+
+
+def test_server_rejects_malformed_metadata_per_event(tmp_path: Path):
+    """Bad diff/push fields reject only their event; the batch still gets a response."""
+
+    async def scenario(server, host, port):
+        status, result = await _request(
+            host,
+            port,
+            "POST",
+            "/events",
+            [
+                _commit("ana@example.com", "a1"),
+                {**_commit("ana@example.com", "a2"), "diff": {"files": "lots"}},
+                {**_commit("ana@example.com", "a3"), "diff": {"languages": 5}},
+                {**_commit("ana@example.com", "a4"), "diff": {"languages": {"Python": -1}}},
+                {"email": "ana@example.com", "command": "push", "push": {"commits": 2.5}},
+                {"email": "ana@example.com", "command": "push", "push": ["1"]},
+                _commit("ana@example.com", "a5"),
+            ],
+        )
+        assert status == 200
+        assert result["accepted"] == 2
+        assert [error.split(":")[0] for error in result["errors"]] == ["1", "2", "3", "4", "5"]
+        assert "diff.files" in result["errors"][0]
+
+        status, profile = await _request(host, port, "GET", "/profiles/ana%40example.com")
+        assert profile["stats"]["total_commits"] == 2
+
+    _run(tmp_path, scenario)
+
+
+def test_periodic_snapshot_updates_leaderboard_index(tmp_path: Path):
+    """Snapshots are saved on an executor thread; the index must still see them."""
+    repository = UserRepository(tmp_path)
+
+    async def _main():
+        server = GamifyServer(repository, snapshot_interval=0.05)
+        host, port = await server.start("127.0.0.1", 0)
+        try:
+            # Open the index on the loop thread first, as `gg serve` does when loading profiles.
+            repository.leaderboard_index.count()
+            status, result = await _request(host, port, "POST", "/events", [_commit("dev@example.com", "a" * 40)])
+            assert status == 200 and result["accepted"] == 1
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                top = repository.leaderboard_index.top(1)
+                if top and top[0].xp:
+                    break
+            return result["xp"], repository.leaderboard_index.top(1)
+        finally:
+            await server.stop()
+
+    xp, top = asyncio.run(_main())
+    assert xp > 0
+    assert [(entry.email, entry.xp) for entry in top] == [("dev@example.com", xp)]
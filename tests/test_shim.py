@@ -0,0 +1,77 @@
+"""Tests for the POSIX git shims installed by `gg install-shim`."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gg_cli import processors, shim
+from gg_cli.shim import ShimError, install_shim, refresh_installed_shims
+
+pytestmark = pytest.mark.skipif(
+    os.name == "nt" or shutil.which("sh") is None or shutil.which("git") is None,
+    reason="needs a POSIX shell and git",
+)
+
+
+@pytest.fixture
+def env(tmp_path: Path, monkeypatch) -> dict[str, Path]:
+    """A fake `gg` that echoes its arguments and the git it would run, first in PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gg = bin_dir / "gg"
+    gg.write_text('#!/bin/sh\necho "gg $* via $(command -v git)"\n', encoding="utf-8")
+    gg.chmod(0o755)
+    shim_dir = tmp_path / "shims"
+    monkeypatch.setenv("PATH", os.pathsep.join([str(shim_dir), str(bin_dir), os.environ["PATH"]]))
+    monkeypatch.setattr(shim, "SHIM_STATE_PATH", tmp_path / "shim.json")
+    monkeypatch.setattr(shim, "FUNCTION_SHIM_PATH", tmp_path / "git-shim.sh")
+    return {"shim_dir": shim_dir, "gg": gg}
+
+
+def _sh(script: str) -> str:
+    return subprocess.run(["sh", "-c", script], capture_output=True, text=True, check=True).stdout
+
+
+def test_script_shim_routes_only_tracked_commands(env):
+    path = install_shim("script", env["shim_dir"])
+    real_git = shutil.which("git", path=os.environ["PATH"].split(os.pathsep, 1)[1])
+
+    assert _sh("git --version").startswith("git version")
+    # gg runs with the real git first in PATH, never the shim itself.
+    assert _sh("git commit -m x").strip() == f"gg git commit -m x via {real_git}"
+    assert _sh("git cherry-pick abc").startswith("gg git cherry-pick abc")
+    assert os.access(path, os.X_OK)
+
+
+def test_function_shim_routes_only_tracked_commands(env):
+    path = install_shim("function")
+
+    assert _sh(f". {path}; git --version").startswith("git version")
+    assert _sh(f". {path}; git push origin main").startswith("gg git push origin main")
+
+
+def test_install_refuses_to_replace_a_foreign_git(env):
+    env["shim_dir"].mkdir()
+    (env["shim_dir"] / "git").write_text("#!/bin/sh\necho mine\n", encoding="utf-8")
+    with pytest.raises(ShimError, match="not a git-gamify shim"):
+        install_shim("script", env["shim_dir"])
+
+
+def test_shims_refresh_when_tracked_commands_change(env, monkeypatch):
+    path = install_shim("script", env["shim_dir"])
+    assert refresh_installed_shims() == []
+
+    monkeypatch.setitem(processors.PROCESSORS, "stash", processors.ProcessorSpec("pkg.mod:Stash"))
+    assert refresh_installed_shims() == [path]
+    assert _sh("git stash list").startswith("gg git stash list")
+    assert refresh_installed_shims() == []
+
+    path.unlink()
+    monkeypatch.delitem(processors.PROCESSORS, "stash")
+    assert refresh_installed_shims() == []
+    assert shim._read_state(shim.SHIM_STATE_PATH) == []
@@ -0,0 +1,88 @@
+"""Tests for the vectorized population simulator."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from gg_cli.simulate import (  # noqa: E402
+    ActivityModel,
+    SimulationError,
+    SimulationRules,
+    cross_check,
+    load_rules_file,
+    simulate,
+)
+
+
+@pytest.mark.parametrize(
+    "model,overrides",
+    [
+        (ActivityModel(), {}),
+        (ActivityModel(commits_per_day=9, pushes_per_day=3, change_median=120), {}),
+        (ActivityModel(commits_per_day=4, active_rate=1.0), {"commit_full_reward_count": 0}),
+        (ActivityModel(commits_per_day=30), {"commit_half_reward_count": 40, "push_daily_xp_cap": 30}),
+    ],
+)
+def test_vectorized_xp_matches_scalar_engine(model, overrides):
+    rules = SimulationRules()
+    rules.xp_rules.update(overrides)
+    result = cross_check(25, 90, model, rules, seed=7)
+    assert result.commit_days > 0
+    assert result.mismatches == []
+    assert result.ok
+
+
+def test_simulation_is_reproducible_and_independent_of_workers(monkeypatch):
+    first = simulate(500, 120, seed=3)
+    assert first == simulate(500, 120, seed=3)
+    assert sum(first.level_counts.values()) == 500
+
+    # Each chunk has its own random stream, so results depend on the chunk
+    # size but not on how chunks are spread over processes.
+    monkeypatch.setattr("gg_cli.simulate.CHUNK_CELLS", 120 * 64)
+    chunked = simulate(500, 120, seed=3, workers=1)
+    assert sum(chunked.level_counts.values()) == 500
+    assert chunked.milestones[0].level == 5
+    assert simulate(500, 120, seed=3, workers=2) == chunked
+
+
+def test_milestone_days_are_ordered():
+    result = simulate(300, 365, ActivityModel(active_rate=0.9), seed=1, milestones=(2, 5, 10))
+    p50 = [milestone.p50 for milestone in result.milestones]
+    assert all(value is not None for value in p50)
+    assert p50 == sorted(p50)
+    assert result.milestones[0].reached >= result.milestones[-1].reached
+
+
+def test_harder_level_tiers_lower_final_levels():
+    easy = simulate(300, 200, seed=2)
+    hard_rules = SimulationRules(level_tiers=[(100, 2000)])
+    hard = simulate(300, 200, rules=hard_rules, seed=2)
+    assert max(hard.level_counts) < max(easy.level_counts)
+    assert cross_check(5, 30, rules=hard_rules).skipped_reason
+
+
+def test_load_rules_file(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(
+        json.dumps({"xp_rules": {"commit_base": 12}, "streak_bonus": {"tiers": [[5, 3]], "base": 0}}),
+        encoding="utf-8",
+    )
+    rules = load_rules_file(str(path))
+    assert rules.xp_rules["commit_base"] == 12
+    assert rules.streak_tiers == [(5, 3)] and rules.streak_base == 0
+
+    path.write_text(json.dumps({"xp_rules": {"commit_bonus": 1}}), encoding="utf-8")
+    with pytest.raises(SimulationError):
+        load_rules_file(str(path))
+
+
+def test_cli_simulate(runner):
+    from gg_cli.main import app
+
+    result = runner.invoke(app, ["simulate", "--users", "200", "--days", "60", "--seed", "1", "--check", "3"])
+    assert result.exit_code == 0, result.output
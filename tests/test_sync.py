@@ -0,0 +1,123 @@
+"""Tests for profile sync through a git ref, using a local bare repository."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from gg_cli.core import get_default_user_data
+from gg_cli.dedup import EventLedger
+from gg_cli.sync import sync_profile, sync_ref_name
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+EMAIL = "dev@example.com"
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def machines(tmp_path: Path) -> tuple[Path, Path]:
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+    clones = []
+    for name in ("laptop", "workstation"):
+        clone = tmp_path / name
+        _git(tmp_path, "clone", "-q", str(remote), str(clone))
+        _git(clone, "config", "user.email", EMAIL)
+        _git(clone, "config", "user.name", "Dev")
+        clones.append(clone)
+    return clones[0], clones[1]
+
+
+def _profile(xp: int, commits: int, last_commit: str, streak: int, unlocks: dict[str, str]) -> dict:
+    data = get_default_user_data(EMAIL)
+    data["user"]["xp"] = xp
+    data["stats"]["total_commits"] = commits
+    data["stats"]["last_commit_date"] = last_commit
+    data["stats"]["consecutive_commit_days"] = streak
+    data["achievements_unlocked"].update(unlocks)
+    return data
+
+
+def test_sync_merges_two_devices_commutatively(machines, monkeypatch):
+    """Both devices should converge on summed counters and earliest unlocks, rewarded once."""
+    laptop_dir, workstation_dir = machines
+    laptop = _profile(300, 10, "2026-02-01", 3, {"first_commit": "2026-01-05"})
+    workstation = _profile(500, 20, "2026-02-02", 5, {"first_commit": "2026-01-01", "commit_10": "2026-01-20"})
+
+    monkeypatch.chdir(laptop_dir)
+    assert sync_profile(laptop, "origin").pushed is True
+    monkeypatch.chdir(workstation_dir)
+    assert sync_profile(workstation, "origin").pushed is True
+    monkeypatch.chdir(laptop_dir)
+    result = sync_profile(laptop, "origin")
+
+    assert result.devices == 2
+    assert result.pushed is False
+    for data in (laptop, workstation):
+        # first_commit (30 XP) was unlocked on both machines.
+        assert data["user"]["xp"] == 770
+        assert data["stats"]["total_commits"] == 30
+        assert data["stats"]["last_commit_date"] == "2026-02-02"
+        assert data["stats"]["consecutive_commit_days"] == 5
+        assert data["achievements_unlocked"]["first_commit"] == "2026-01-01"
+        assert "commit_10" in data["achievements_unlocked"]
+
+
+def test_sync_publishes_only_new_local_activity(machines, monkeypatch):
+    """Later syncs should push the delta on top of already merged peer totals."""
+    laptop_dir, workstation_dir = machines
+    laptop = _profile(100, 1, "2026-02-01", 1, {})
+    workstation = _profile(200, 2, "2026-02-01", 1, {})
+
+    monkeypatch.chdir(laptop_dir)
+    sync_profile(laptop, "origin")
+    monkeypatch.chdir(workstation_dir)
+    sync_profile(workstation, "origin")
+
+    # New local work on the workstation after it merged the laptop's totals.
+    workstation["user"]["xp"] += 50
+    workstation["stats"]["total_commits"] += 1
+    assert sync_profile(workstation, "origin").pushed is True
+
+    monkeypatch.chdir(laptop_dir)
+    result = sync_profile(laptop, "origin")
+    assert result.fetched_devices == 1
+    assert laptop["user"]["xp"] == 350
+    assert laptop["stats"]["total_commits"] == 4
+
+    commits = _git(workstation_dir, "rev-list", "--count", sync_ref_name(EMAIL)).strip()
+    assert commits == "3"
+
+
+def test_sync_rewards_shared_unlocks_once_and_shares_ledgers(machines, monkeypatch):
+    """Repeated syncs keep one reward per achievement; commits counted elsewhere stay counted."""
+    laptop_dir, workstation_dir = machines
+    laptop = _profile(100, 1, "2026-02-01", 1, {"first_commit": "2026-02-01"})
+    workstation = _profile(100, 1, "2026-02-01", 1, {"first_commit": "2026-02-01"})
+    EventLedger(workstation).add("commit:abc")
+
+    for _ in range(2):
+        monkeypatch.chdir(laptop_dir)
+        sync_profile(laptop, "origin")
+        monkeypatch.chdir(workstation_dir)
+        sync_profile(workstation, "origin")
+    assert laptop["user"]["xp"] == workstation["user"]["xp"] == 170
+
+    # An achievement unlocked on one machine only is rewarded in full.
+    laptop["user"]["xp"] += 50
+    laptop["achievements_unlocked"]["commit_10"] = "2026-02-03"
+    monkeypatch.chdir(laptop_dir)
+    sync_profile(laptop, "origin")
+    monkeypatch.chdir(workstation_dir)
+    sync_profile(workstation, "origin")
+    assert laptop["user"]["xp"] == workstation["user"]["xp"] == 220
+
+    assert "commit:abc" in EventLedger(laptop)
+    assert EventLedger(laptop).claim(["commit:abc"]) is False
@@ -0,0 +1,106 @@
+"""Tests for NDJSON profile export and import."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from gg_cli.core import UserRepository, get_default_user_data
+from gg_cli.main import app
+from gg_cli.transfer import (
+    ProfileRecordError,
+    export_lines,
+    import_lines,
+    iter_profiles,
+    validate_profile_record,
+)
+
+
+def _save_profile(repo: UserRepository, email: str, xp: int) -> None:
+    data = get_default_user_data(email)
+    data["user"]["xp"] = xp
+    data["events"]["recent"] = [f"commit:{email}"]
+    repo.save(data)
+
+
+def test_validate_merges_record_over_defaults():
+    """Older records missing newer stats should be upgraded like a profile load."""
+    record = {"config": {"user_email": "old@example.com"}, "stats": {"total_commits": 7}, "junk": 1}
+
+    profile = validate_profile_record(record)
+
+    assert profile["stats"]["total_commits"] == 7
+    assert profile["stats"]["total_pushed_lines"] == 0
+    assert "junk" not in profile
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        [],
+        {"config": {"user_email": ""}},
+        {"config": {"user_email": "a@example.com"}, "user": {"xp": "12"}},
+        {"config": {"user_email": "a@example.com"}, "user": {"xp": True}},
+        {"config": {"user_email": "a@example.com"}, "stats": []},
+        {"config": {"user_email": "a@example.com"}, "achievements_unlocked": {"x": 1}},
+    ],
+)
+def test_validate_rejects_schema_mismatches(record):
+    with pytest.raises(ProfileRecordError):
+        validate_profile_record(record)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_export_then_import_round_trips_profiles(tmp_path: Path, workers: int):
+    """Every profile, including its event ledger, should survive a round trip."""
+    source = UserRepository(tmp_path / "source")
+    for index in range(7):
+        _save_profile(source, f"user{index}@example.com", index * 10)
+    dump = tmp_path / "profiles.ndjson"
+    dump.write_text("".join(export_lines(iter_profiles(source))), encoding="utf-8")
+
+    target = UserRepository(tmp_path / "target")
+    with open(dump, "r", encoding="utf-8") as f:
+        report = import_lines(f, target, workers=workers, batch_size=3)
+
+    assert (report.imported, report.rejected) == (7, 0)
+    restored = target.load("user6@example.com")
+    assert restored["user"]["xp"] == 60
+    assert restored["events"]["recent"] == ["commit:user6@example.com"]
+    assert target.leaderboard_index.count() == 7
+
+
+def test_import_reports_bad_lines_and_keeps_going(tmp_path: Path):
+    repo = UserRepository(tmp_path)
+    lines = [
+        json.dumps(get_default_user_data("ok@example.com")) + "\n",
+        "{not json\n",
+        "\n",
+        json.dumps({"config": {"user_email": "bad@example.com"}, "user": {"xp": "lots"}}) + "\n",
+    ]
+
+    report = import_lines(lines, repo)
+
+    assert report.imported == 1
+    assert report.rejected == 2
+    assert report.errors[0].startswith("line 2:")
+    assert report.errors[1].startswith("line 4:")
+
+
+def test_cli_export_all_and_import(tmp_path: Path, monkeypatch, runner):
+    source = UserRepository(tmp_path / "source")
+    _save_profile(source, "export@example.com", 42)
+    dump = tmp_path / "out.ndjson"
+    monkeypatch.setattr("gg_cli.main.get_user_repository", lambda: source)
+
+    result = runner.invoke(app, ["export", "--all", "--output", str(dump)])
+    assert result.exit_code == 0
+
+    target = UserRepository(tmp_path / "target")
+    monkeypatch.setattr("gg_cli.main.get_user_repository", lambda: target)
+    result = runner.invoke(app, ["import", str(dump)])
+
+    assert result.exit_code == 0
+    assert target.load("export@example.com")["user"]["xp"] == 42
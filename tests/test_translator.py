@@ -0,0 +1,76 @@
+"""Tests for shared translator catalogs and pre-parsed templates."""
+
+from __future__ import annotations
+
+import builtins
+
+import pytest
+
+from gg_cli import translator as translator_module
+from gg_cli.translator import Translator, clear_catalogs, get_catalog, get_translator
+
+
+@pytest.fixture(autouse=True)
+def fresh_catalogs():
+    clear_catalogs()
+    yield
+    clear_catalogs()
+
+
+def test_catalog_falls_back_to_english_keys():
+    english = get_catalog("en").strings
+    chinese = get_catalog("zh").strings
+    assert set(english) <= set(chinese)
+    assert get_translator("zh").t("profile_title") != get_translator("en").t("profile_title")
+
+
+def test_no_locale_io_after_warm_up(monkeypatch):
+    get_translator("en").t("profile_title")
+    get_translator("zh").t("profile_title")
+
+    opened = []
+    real_open = builtins.open
+
+    def tracking_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", tracking_open)
+    for _ in range(1000):
+        Translator("zh").t("config_language_set")
+        get_translator("en").t("profile_title")
+    assert opened == []
+
+
+@pytest.mark.parametrize(
+    "template,kwargs",
+    [
+        ("plain text", {}),
+        ("{{escaped}} braces", {}),
+        ("Level {level}: {title}", {"level": 3, "title": "Coder"}),
+        ("{xp:>6,} XP ({pct:.1f}%)", {"xp": 12345, "pct": 42.25}),
+        ("{name!r}", {"name": "x"}),
+        ("{items[0]} and {obj.real}", {"items": ["a"], "obj": 5}),
+    ],
+)
+def test_compiled_templates_match_str_format(template, kwargs):
+    catalog = get_catalog("en")
+    catalog.strings["__test__"] = template
+    assert catalog.format("__test__", kwargs) == template.format(**kwargs)
+    # Second call goes through the memoized template.
+    assert catalog.format("__test__", kwargs) == template.format(**kwargs)
+
+
+def test_missing_template_argument_still_raises():
+    with pytest.raises(KeyError):
+        get_translator("en").t("config_language_set_does_not_exist {value}")
+
+
+def test_missing_locale_warns_once(monkeypatch):
+    printed = []
+    monkeypatch.setattr(translator_module.utils.console, "print", printed.append)
+    for _ in range(3):
+        translator = Translator("xx")
+    assert len(printed) == 1
+    assert "xx" in printed[0]
+    assert translator.t("profile_title") == get_translator("en").t("profile_title")